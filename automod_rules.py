@@ -0,0 +1,213 @@
+"""
+Règles d'auto-modération par serveur - Compilées en un évaluateur à chaque changement
+"""
+
+import re
+import time
+from datetime import timedelta
+import discord
+from config import Config
+from link_filter import extract_domains
+
+# Valeurs par défaut (0 ou liste vide = règle désactivée)
+RULE_DEFAULTS = {
+    "spam_threshold": Config.SPAM_THRESHOLD,  # messages identiques (fenêtre SPAM_TIME_WINDOW)
+    "mention_limit": Config.MENTION_THRESHOLD,  # mentions par message
+    "caps_ratio": 0.0,  # part de majuscules (0.7 = 70 %)
+    "emoji_limit": 0,  # emojis par message
+    "attachment_limit": 0,  # pièces jointes par message
+    "new_account_days": 0,  # comptes plus récents : ni liens ni pièces jointes
+    "banned_words": [],  # mots interdits
+}
+
+RULE_LABELS = {
+    "spam_threshold": "Anti-spam",
+    "mention_limit": "Mentions massives",
+    "caps_ratio": "Majuscules",
+    "emoji_limit": "Flood d'emojis",
+    "attachment_limit": "Pièces jointes",
+    "new_account_days": "Compte récent",
+    "banned_words": "Mot interdit",
+}
+
+# Bornes des règles numériques (0 reste accepté : règle désactivée)
+RULE_BOUNDS = {
+    "spam_threshold": (2, 100),  # 1 ferait de chaque message un spam
+    "mention_limit": (1, 100),
+    "emoji_limit": (1, 200),
+    "attachment_limit": (1, 10),
+    "new_account_days": (1, 3650),
+}
+
+CAPS_MIN_LETTERS = 10  # pas de contrôle des majuscules sur les messages courts
+
+_EMOJI = r"<a?:\w{2,32}:\d{15,25}>|[\U0001F300-\U0001FAFF\u2600-\u27BF]"
+_UPPER = re.compile(r"[A-ZÀ-ÖØ-Þ]")
+_LETTER = re.compile(r"[A-Za-zÀ-ÖØ-öø-ÿ]")
+
+def parse_rule_value(rule: str, raw: str):
+    """Convertit la valeur saisie par un administrateur (ValueError si invalide)"""
+    if rule not in RULE_DEFAULTS:
+        raise ValueError(f"Règle inconnue: {rule}")
+    if rule == "banned_words":
+        return sorted({word.strip().lower() for word in raw.split(",") if word.strip()})
+    if rule == "caps_ratio":
+        value = float(raw.replace("%", "")) if raw.strip() else 0.0
+        if value > 1:
+            value /= 100
+        if not 0 <= value <= 1:
+            raise ValueError("Le ratio doit être entre 0 et 1 (ou 0 et 100 %)")
+        return value
+    value = int(raw)
+    low, high = RULE_BOUNDS[rule]
+    if value != 0 and not low <= value <= high:
+        raise ValueError(f"La valeur doit être 0 (désactivée) ou entre {low} et {high}")
+    return value
+
+def _bounded(rule: str, value):
+    """Valeur stockée ramenée dans ses bornes (lignes écrites avant leur validation)"""
+    if rule not in RULE_BOUNDS or not value:
+        return value
+    low, high = RULE_BOUNDS[rule]
+    return min(max(value, low), high)
+
+class CompiledRules:
+    """Règles d'un serveur prêtes à évaluer : seuils résolus et une expression combinée"""
+    __slots__ = ("source", "settings", "checks", "content_args", "spam_threshold")
+
+    def __init__(self, source: dict):
+        self.source = source  # dict du cache de la base : recompilé quand il change
+        self.settings = {rule: _bounded(rule, value) for rule, value in {**RULE_DEFAULTS, **source}.items()}
+        self.spam_threshold = self.settings["spam_threshold"]  # 0 : anti-spam désactivé
+        self.checks = self._compile()
+
+    def _compile(self):
+        """Liste [(règle, fonction)] des seules règles actives sur les métadonnées ; prépare content_args"""
+        settings = self.settings
+        checks = []
+
+        new_account_days = settings["new_account_days"]
+        if new_account_days:
+            min_age = timedelta(days=new_account_days)
+
+            def check_new_account(message):
+                if discord.utils.utcnow() - message.author.created_at >= min_age:
+                    return None
+                if message.attachments:
+                    return "pièce jointe"
+                if "." in message.content and extract_domains(message.content):
+                    return "lien"
+                return None
+            checks.append(("new_account_days", check_new_account))
+
+        mention_limit = settings["mention_limit"]
+        if mention_limit:
+            def check_mentions(message):
+                count = len(message.raw_mentions) + len(message.raw_role_mentions)
+                return f"{count} mentions" if count >= mention_limit else None
+            checks.append(("mention_limit", check_mentions))
+
+        attachment_limit = settings["attachment_limit"]
+        if attachment_limit:
+            def check_attachments(message):
+                count = len(message.attachments)
+                return f"{count} pièces jointes" if count > attachment_limit else None
+            checks.append(("attachment_limit", check_attachments))
+
+        # Règles sur le texte, évaluables hors de la boucle (arguments picklables)
+        words = settings["banned_words"]
+        emoji_limit = settings["emoji_limit"]
+        caps_ratio = settings["caps_ratio"]
+        parts = []
+        if words:
+            parts.append(r"(?P<banned>(?<!\w)(?:" + "|".join(re.escape(word) for word in words) + r")(?!\w))")
+        if emoji_limit:
+            parts.append(f"(?P<emoji>{_EMOJI})")
+        scanner = re.compile("|".join(parts), re.IGNORECASE) if parts else None
+        self.content_args = (scanner, emoji_limit, caps_ratio) if scanner or caps_ratio else None
+
+        return checks
+
+def scan_content(content: str, scanner, emoji_limit: int, caps_ratio: float):
+    """Mots interdits et emojis (un seul parcours du texte), puis majuscules : (règle, détail) ou None"""
+    if scanner is not None:
+        emojis = 0
+        for match in scanner.finditer(content):
+            if match.lastgroup == "banned":
+                return "banned_words", match.group("banned").lower()
+            emojis += 1
+            if emojis > emoji_limit:
+                return "emoji_limit", f"plus de {emoji_limit} emojis"
+
+    if caps_ratio:
+        letters = len(_LETTER.findall(content))
+        if letters >= CAPS_MIN_LETTERS:
+            ratio = len(_UPPER.findall(content)) / letters
+            if ratio >= caps_ratio:
+                return "caps_ratio", f"{ratio:.0%} de majuscules"
+    return None
+
+class RuleEngine:
+    """Évaluateurs compilés par serveur, avec compteurs et durées par règle"""
+
+    def __init__(self, pool=None, offload_min_length: int = 0):
+        # pool (CheckPool) : les textes d'au moins offload_min_length caractères y sont analysés
+        self.pool = pool
+        self.offload_min_length = offload_min_length
+        self._compiled = {}  # guild_id -> CompiledRules
+        self._metrics = {}  # contrôle -> {"count", "total", "max"}
+        self.hits = {}  # règle -> déclenchements
+        self.compilations = 0
+
+    def get(self, guild_id: int, source: dict) -> CompiledRules:
+        """Évaluateur du serveur, recompilé si les règles ont changé"""
+        compiled = self._compiled.get(guild_id)
+        if compiled is None or compiled.source is not source:
+            compiled = self._compiled[guild_id] = CompiledRules(source)
+            self.compilations += 1
+        return compiled
+
+    def _record(self, name: str, elapsed: float):
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = {"count": 0, "total": 0.0, "max": 0.0}
+        metric["count"] += 1
+        metric["total"] += elapsed
+        if elapsed > metric["max"]:
+            metric["max"] = elapsed
+
+    async def evaluate(self, compiled: CompiledRules, message: discord.Message):
+        """Première règle enfreinte (règle, détail), sinon None"""
+        result = None
+        for name, check in compiled.checks:
+            start = time.perf_counter()
+            detail = check(message)
+            self._record(name, time.perf_counter() - start)
+            if detail is not None:
+                result = name, detail
+                break
+
+        if result is None and compiled.content_args is not None:
+            content = message.content
+            if self.pool is not None and len(content) >= self.offload_min_length:
+                # Durée mesurée par le pool (file d'attente comprise)
+                result = await self.pool.run("content", scan_content, content, *compiled.content_args)
+            else:
+                start = time.perf_counter()
+                result = scan_content(content, *compiled.content_args)
+                self._record("content", time.perf_counter() - start)
+
+        if result is not None:
+            self.hits[result[0]] = self.hits.get(result[0], 0) + 1
+        return result
+
+    def stats(self) -> dict:
+        """Durée par contrôle (millisecondes) ; les déclenchements par règle sont dans self.hits"""
+        return {
+            name: {
+                "count": metric["count"],
+                "avg_ms": metric["total"] / metric["count"] * 1000 if metric["count"] else 0.0,
+                "max_ms": metric["max"] * 1000,
+            }
+            for name, metric in self._metrics.items()
+        }
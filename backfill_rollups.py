@@ -0,0 +1,28 @@
+"""
+Script de reconstruction des agrégats horaires (messages et temps vocal)
+À lancer une fois après la mise à jour, puis si les agrégats semblent incohérents.
+"""
+
+import asyncio
+import database
+
+async def main():
+    print("=" * 50)
+    print("🔁 RECONSTRUCTION DES AGRÉGATS HORAIRES")
+    print("=" * 50)
+
+    await database.pool.open()
+    try:
+        # Créer les tables d'agrégats si elles n'existent pas encore
+        await database.init_db()
+
+        message_rows, voice_rows = await database.backfill_rollups()
+        print(f"✅ {message_rows} tranches horaires de messages")
+        print(f"✅ {voice_rows} tranches horaires de temps vocal")
+    finally:
+        await database.pool.close()
+
+    print("=" * 50)
+
+if __name__ == "__main__":
+    asyncio.run(main())
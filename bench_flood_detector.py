@@ -0,0 +1,51 @@
+"""
+Micro-benchmark de la détection de flood (coût par message)
+"""
+
+import random
+import string
+import time
+from flood_detector import FloodDetector, fingerprint
+
+ITERATIONS = 20000
+
+def random_message(length: int) -> str:
+    words = ["".join(random.choices(string.ascii_lowercase, k=random.randint(2, 8))) for _ in range(length // 5)]
+    return " ".join(words)[:length]
+
+def bench(label: str, func, items):
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed / len(items) * 1e6:8.2f} µs/message")
+
+def main():
+    print("=" * 60)
+    print("⏱️  BENCHMARK DÉTECTION DE FLOOD")
+    print("=" * 60)
+
+    for length in (40, 120, 400):
+        messages = [random_message(length) for _ in range(ITERATIONS)]
+        bench(f"Empreinte ({length} caractères)", fingerprint, messages)
+
+    # Salon actif : messages tous différents, aucun flood
+    detector = FloodDetector(min_messages=5, min_authors=3, window=30)
+    messages = [(i, random_message(120)) for i in range(ITERATIONS)]
+    bench("Vérification (salon sans flood)", lambda m: detector.check(1, m[0], m[0] % 50, m[1]), messages)
+
+    # Raid : variantes d'un même texte par des comptes différents
+    base = "Free nitro for everyone claim your gift now at the link below before it expires"
+    detector = FloodDetector(min_messages=5, min_authors=3, window=30)
+    variants = [(i, base.replace("now", random.choice(["now", "today", "fast"])) + f" {i % 97}") for i in range(ITERATIONS)]
+    flagged = 0
+    start = time.perf_counter()
+    for message_id, content in variants:
+        if detector.check(1, message_id, message_id, content):
+            flagged += 1
+    elapsed = time.perf_counter() - start
+    print(f"{'Vérification (raid de variantes)':<40} {elapsed / len(variants) * 1e6:8.2f} µs/message ({flagged} floods)")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Pool d'exécution des contrôles coûteux - Hors de la boucle d'événements, avec délai maximal
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+LATENCY_SAMPLES = 1024  # dernières durées gardées pour le p99
+
+class CheckPool:
+    """
+    Exécute une fonction de contrôle dans un pool de threads ou de processus.
+    Au-delà du délai, ou si la file est pleine, le contrôle est abandonné
+    et le message passe : mieux vaut un contrôle manqué qu'un bot figé.
+    """
+
+    def __init__(self, mode: str = "process", workers: int = 2, deadline: float = 0.25, max_pending: int = 64):
+        # "process" isole vraiment le calcul (pas de GIL) mais chaque appel est sérialisé ;
+        # les fonctions et arguments doivent alors être picklables (fonctions de module).
+        # "thread" ne borne que l'attente : un contrôle qui déborde garde le GIL et continue
+        # de ralentir la boucle (heartbeats compris) après son abandon.
+        self.mode = mode
+        self.deadline = deadline
+        self.max_pending = max_pending
+        if mode == "process":
+            # Pas de fork d'un processus qui a déjà des threads (connexions SQLite, pools)
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            # Démarrer les processus tout de suite : le premier contrôle dépasserait sinon le délai
+            self._executor.submit(int)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="automod-check")
+        self._pending = 0  # soumis et pas encore terminés (y compris ceux abandonnés)
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.metrics = {"submitted": 0, "timeouts": 0, "shed": 0, "errors": 0}
+
+    async def run(self, name: str, func, *args):
+        """Résultat de func(*args), ou None si le contrôle est abandonné (délai, file pleine, erreur)"""
+        if self._pending >= self.max_pending:
+            self.metrics["shed"] += 1
+            return None
+
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            future = self._executor.submit(func, *args)
+        except RuntimeError:
+            # Pool arrêté (déchargement du cog)
+            return None
+        self._pending += 1
+        self.metrics["submitted"] += 1
+        future.add_done_callback(lambda _: self._notify(loop, start))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.deadline)
+        except asyncio.TimeoutError:
+            # Le calcul continue dans le pool : il reste compté dans la file jusqu'à sa fin
+            self.metrics["timeouts"] += 1
+            logger.warning(f"Auto-mod: contrôle {name} abandonné après {self.deadline * 1000:.0f}ms")
+            return None
+        except Exception as e:
+            self.metrics["errors"] += 1
+            logger.error(f"Auto-mod: erreur du contrôle {name}: {e}")
+            return None
+
+    def _notify(self, loop, start: float):
+        # Appelé depuis le pool : revenir dans la boucle pour mettre à jour les compteurs
+        try:
+            loop.call_soon_threadsafe(self._finished, start)
+        except RuntimeError:
+            pass  # boucle fermée (arrêt du bot)
+
+    def _finished(self, start: float):
+        self._pending -= 1
+        self._latencies.append(time.perf_counter() - start)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def percentile(self, fraction: float) -> float:
+        """Durée (secondes, file d'attente comprise) sous laquelle se trouve cette part des contrôles"""
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "pending": self._pending,
+            "p50_ms": self.percentile(0.5) * 1000,
+            "p99_ms": self.percentile(0.99) * 1000,
+            **self.metrics,
+        }
@@ -1,211 +1,328 @@
-"""
-Cog d'Analytics - Statistiques et activité des utilisateurs
-"""
-
-import discord
-from discord import app_commands
-from discord.ext import commands
-import database
-from config import Colors, Emojis
-import logging
-from datetime import datetime, timedelta
-
-logger = logging.getLogger(__name__)
-
-class Analytics(commands.Cog):
-    """Système d'analytics et de statistiques"""
-    
-    def __init__(self, bot):
-        self.bot = bot
-    
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        """Track les messages pour les statistiques"""
-        # Ne pas compter les messages du bot et en DM
-        if message.author.bot or not message.guild:
-            return
-        
-        try:
-            # Incrémenter le compteur de messages
-            await database.increment_message_count(message.guild.id, message.author.id)
-        except Exception as e:
-            logger.error(f"Erreur lors du tracking de message: {e}")
-    
-    @commands.Cog.listener()
-    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
-        """Track l'activité vocale"""
-        try:
-            # Rejoindre un vocal
-            if before.channel is None and after.channel is not None:
-                await database.log_activity(member.guild.id, member.id, "VOICE_JOIN")
-                await database.log_voice_join(member.guild.id, member.id)
-            
-            # Quitter un vocal
-            elif before.channel is not None and after.channel is None:
-                await database.log_activity(member.guild.id, member.id, "VOICE_LEAVE")
-                await database.log_voice_leave(member.guild.id, member.id)
-        except Exception as e:
-            logger.error(f"Erreur lors du tracking vocal: {e}")
-    
-    @app_commands.command(name="stats", description="Voir les statistiques d'un membre")
-    @app_commands.describe(member="Le membre (optionnel, vous par défaut)")
-    async def stats(self, interaction: discord.Interaction, member: discord.Member = None):
-        """Affiche les statistiques d'un membre"""
-        target = member or interaction.user
-        
-        try:
-            # Récupérer les stats de base
-            stats = await database.get_user_stats(interaction.guild.id, target.id)
-            
-            # Récupérer les stats de messages par période
-            msg_24h = await database.get_message_count_period(interaction.guild.id, target.id, 24)
-            msg_7d = await database.get_message_count_period(interaction.guild.id, target.id, 168)
-            
-            # Récupérer les stats vocales
-            voice_total = await database.get_voice_time(interaction.guild.id, target.id, None)
-            voice_24h = await database.get_voice_time(interaction.guild.id, target.id, 24)
-            voice_7d = await database.get_voice_time(interaction.guild.id, target.id, 168)
-            
-            # Récupérer les rangs
-            msg_rank, msg_total = await database.get_user_message_rank_7d(interaction.guild.id, target.id)
-            voice_rank, voice_total = await database.get_user_voice_rank_7d(interaction.guild.id, target.id)
-            
-            # Vérifier s'il y a des données à afficher
-            total_messages = stats['message_count'] if stats else 0
-            has_data = total_messages > 0 or voice_total > 0
-            
-            if not has_data:
-                return await interaction.response.send_message(
-                    f"{Emojis.INFO} Aucune statistique disponible pour {target.mention}.",
-                    ephemeral=True
-                )
-            
-            # Créer l'embed
-            embed = discord.Embed(
-                title=f"📊 Statistiques de {target.display_name}",
-                color=Colors.INFO
-            )
-            embed.set_thumbnail(url=target.display_avatar.url)
-            
-            # Fonction helper pour formater le temps
-            def format_time(seconds):
-                if seconds == 0:
-                    return "0min"
-                hours = seconds // 3600
-                minutes = (seconds % 3600) // 60
-                if hours > 0:
-                    return f"{hours}h {minutes}min"
-                return f"{minutes}min"
-            
-            # Messages
-            msg_value = f"**Total:** {total_messages:,} messages\n"
-            msg_value += f"**24h:** {msg_24h:,} messages\n"
-            msg_value += f"**7j:** {msg_7d:,} messages"
-            if msg_total > 0:
-                msg_value += f"\n**Rang (7j):** #{msg_rank}/{msg_total}"
-            
-            embed.add_field(
-                name="💬 Messages",
-                value=msg_value,
-                inline=True
-            )
-            
-            # Temps Vocal
-            voice_value = f"**Total:** {format_time(voice_total)}\n"
-            voice_value += f"**24h:** {format_time(voice_24h)}\n"
-            voice_value += f"**7j:** {format_time(voice_7d)}"
-            if voice_total > 0:
-                voice_value += f"\n**Rang (7j):** #{voice_rank}/{voice_total}"
-            
-            embed.add_field(
-                name="🎤 Temps Vocal",
-                value=voice_value,
-                inline=True
-            )
-            
-            # Dernière activité
-            if stats and stats['last_message_at']:
-                last_msg = datetime.fromisoformat(stats['last_message_at'])
-                time_ago = datetime.now() - last_msg
-                
-                if time_ago.days > 0:
-                    ago_str = f"il y a {time_ago.days} jour(s)"
-                elif time_ago.seconds > 3600:
-                    ago_str = f"il y a {time_ago.seconds // 3600} heure(s)"
-                else:
-                    ago_str = f"il y a {time_ago.seconds // 60} minute(s)"
-                
-                embed.add_field(
-                    name="⏰ Dernière activité",
-                    value=ago_str,
-                    inline=False
-                )
-            
-            # Informations additionnelles
-            embed.add_field(
-                name="📅 Membre depuis",
-                value=f"<t:{int(target.joined_at.timestamp())}:R>",
-                inline=False
-            )
-            
-            embed.set_footer(text=f"ID: {target.id}")
-            
-            await interaction.response.send_message(embed=embed)
-            
-        except Exception as e:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} Erreur: {str(e)}",
-                ephemeral=True
-            )
-            logger.error(f"Erreur dans stats: {e}")
-    
-    @app_commands.command(name="activityboard", description="Classement d'activité du serveur")
-    @app_commands.describe(limit="Nombre de résultats (max 25)")
-    async def activityboard(self, interaction: discord.Interaction, limit: int = 10):
-        """Affiche le classement d'activité par messages"""
-        try:
-            # Limiter entre 5 et 25
-            limit = max(5, min(limit, 25))
-            
-            # Classement des messages
-            stats = await database.get_activity_leaderboard(interaction.guild.id, limit=limit)
-            
-            if not stats:
-                return await interaction.response.send_message(
-                    f"{Emojis.INFO} Aucune statistique disponible.",
-                    ephemeral=True
-                )
-            
-            embed = discord.Embed(
-                title="🏆 Classement d'Activité - Messages",
-                description=f"Top {len(stats)} des membres les plus actifs",
-                color=Colors.SUCCESS
-            )
-            
-            medals = ["🥇", "🥈", "🥉"]
-            
-            for idx, stat in enumerate(stats, 1):
-                member = interaction.guild.get_member(stat['user_id'])
-                if not member:
-                    continue
-                
-                medal = medals[idx-1] if idx <= 3 else f"`#{idx}`"
-                
-                embed.add_field(
-                    name=f"{medal} {member.display_name}",
-                    value=f"💬 **{stat['message_count']:,}** messages",
-                    inline=False
-                )
-            
-            embed.set_footer(text=f"Serveur: {interaction.guild.name}")
-            await interaction.response.send_message(embed=embed)
-            
-        except Exception as e:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} Erreur: {str(e)}",
-                ephemeral=True
-            )
-            logger.error(f"Erreur dans activityboard: {e}")
-
-async def setup(bot):
-    await bot.add_cog(Analytics(bot))
+"""
+Cog d'Analytics - Statistiques et activité des utilisateurs
+"""
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+import database
+from config import Config, Colors, Emojis
+from ingestion import MessageIngestor
+from leaderboard import TopKCache, LeaderboardView, guild_member_check
+from pipeline import MessageContext, ORDER_ANALYTICS
+from rank_index import ActivityRankIndex, WINDOW_HOURS
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+class Analytics(commands.Cog):
+    """Système d'analytics et de statistiques"""
+    
+    def __init__(self, bot):
+        self.bot = bot
+        # Les messages sont écrits par lots en arrière-plan
+        self.ingestor = MessageIngestor(
+            flush_interval=Config.INGEST_FLUSH_INTERVAL,
+            batch_size=Config.INGEST_BATCH_SIZE,
+            max_queue=Config.INGEST_QUEUE_SIZE
+        )
+        # Rangs sur 7 jours tenus en mémoire, alimentés par chaque lot écrit
+        self.ranks = ActivityRankIndex()
+        self.ingestor.listeners.append(lambda rows, totals: self.ranks.record("messages", rows))
+        # Top des messages par serveur, mis à jour avec les totaux de chaque lot
+        self.board = TopKCache(
+            Config.LEADERBOARD_CACHE_SIZE, database.get_activity_board, database.get_activity_board_after,
+            present=guild_member_check(bot)
+        )
+        self.ingestor.listeners.append(self._update_board)
+        self._rank_task = None
+        self._returning = set()  # membres revenus pendant une reconstruction des rangs
+    
+    async def cog_load(self):
+        """Démarre l'ingestion et s'enregistre dans le pipeline des messages"""
+        self.ingestor.start()
+        self.bot.pipeline.register("analytics", self.process_message, ORDER_ANALYTICS)
+        self._rank_task = asyncio.create_task(self.build_rank_index())
+    
+    async def cog_unload(self):
+        """Écrit les messages encore en file avant l'arrêt"""
+        self.bot.pipeline.unregister("analytics")
+        if self._rank_task:
+            self._rank_task.cancel()
+        await self.ingestor.close()
+    
+    def _update_board(self, rows, totals):
+        for guild_id, user_id, count in totals:
+            self.board.update(guild_id, user_id, count)
+    
+    async def build_rank_index(self):
+        """Reconstruit l'index des rangs depuis les agrégats des 7 derniers jours"""
+        self.ranks.reset()
+        try:
+            # Lecture sur un lecteur figé : les lots écrits après sont mis de côté puis rejoués
+            rollups = database.iter_activity_rollups(WINDOW_HOURS, on_snapshot=self.ranks.begin_rebuild)
+            async for metric, guild_id, user_id, bucket, amount in rollups:
+                self.ranks.load(metric, guild_id, user_id, bucket, amount)
+        except Exception as e:
+            logger.error(f"Erreur lors de la construction de l'index des rangs: {e}")
+            self.ranks.reset()
+            return
+        self.ranks.finish_rebuild()
+        logger.info(f"Index des rangs construit: {self.ranks.stats()['entries']} entrées")
+        
+        # Membres revenus après que la reconstruction a figé son état de lecture
+        returning, self._returning = self._returning, set()
+        for guild_id, user_id in returning:
+            try:
+                await self.reload_member_ranks(guild_id, user_id)
+            except Exception as e:
+                logger.error(f"Erreur lors du rechargement des rangs de {user_id}: {e}")
+    
+    async def reload_member_ranks(self, guild_id: int, user_id: int):
+        """Remet dans l'index des rangs l'activité récente d'un membre revenu"""
+        if not self.ranks.ready:
+            # Repris à la fin de la reconstruction en cours
+            self._returning.add((guild_id, user_id))
+            return
+        generation = self.ranks.generation
+        
+        def clear_member():
+            # Les lots écrits après ce point arrivent par les listeners, les précédents par la lecture
+            if self.ranks.generation == generation:
+                self.ranks.remove(guild_id, user_id)
+        
+        rows = await database.get_user_rollups(guild_id, user_id, WINDOW_HOURS, on_snapshot=clear_member)
+        if self.ranks.generation != generation:
+            return  # Index reconstruit entre-temps : il a relu ce membre en base
+        for metric, bucket, amount in rows:
+            self.ranks.load(metric, guild_id, user_id, bucket, amount)
+    
+    @commands.Cog.listener()
+    async def on_membership_update(self, guild_id: int, user_id: int, present: bool, returning: bool):
+        """Les membres partis sortent du classement et des rangs de /stats"""
+        if not present:
+            self.board.discard(guild_id, user_id)
+            self.ranks.remove(guild_id, user_id)
+        elif returning:
+            self.board.invalidate(guild_id)
+            try:
+                await self.reload_member_ranks(guild_id, user_id)
+            except Exception as e:
+                logger.error(f"Erreur lors du rechargement des rangs de {user_id}: {e}")
+    
+    @commands.Cog.listener()
+    async def on_members_synced(self, guild_ids: list):
+        """Présence recalée au démarrage : classements et index des rangs relus en base"""
+        for guild_id in guild_ids:
+            self.board.invalidate(guild_id)
+        if self._rank_task:
+            self._rank_task.cancel()
+        self._rank_task = asyncio.create_task(self.build_rank_index())
+    
+    async def get_activity_snapshot(self, guild_id: int, user_id: int) -> dict:
+        """Statistiques de /stats : totaux en base, rangs depuis l'index mémoire s'il est prêt"""
+        if not self.ranks.ready:
+            return await database.get_user_activity_snapshot(
+                guild_id, user_id, with_ranks=True, ttl=Config.STATS_CACHE_TTL
+            )
+        snapshot = await database.get_user_activity_snapshot(
+            guild_id, user_id, with_ranks=False, ttl=Config.STATS_CACHE_TTL
+        )
+        return {
+            **snapshot,
+            "message_rank": self.ranks.rank(guild_id, "messages", user_id),
+            "voice_rank": self.ranks.rank(guild_id, "voice", user_id),
+        }
+    
+    async def process_message(self, ctx: MessageContext):
+        """Étape du pipeline : track les messages pour les statistiques"""
+        try:
+            # Mettre le message en file (écrit par lots)
+            await self.ingestor.submit(ctx.guild.id, ctx.author.id)
+        except Exception as e:
+            logger.error(f"Erreur lors du tracking de message: {e}")
+    
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        """Track l'activité vocale"""
+        try:
+            # Rejoindre un vocal
+            if before.channel is None and after.channel is not None:
+                await database.log_activity(member.guild.id, member.id, "VOICE_JOIN")
+                await database.log_voice_join(member.guild.id, member.id)
+            
+            # Quitter un vocal
+            elif before.channel is not None and after.channel is None:
+                await database.log_activity(member.guild.id, member.id, "VOICE_LEAVE")
+                rollups = await database.log_voice_leave(member.guild.id, member.id)
+                self.ranks.record("voice", rollups)
+        except Exception as e:
+            logger.error(f"Erreur lors du tracking vocal: {e}")
+    
+    @staticmethod
+    async def _send_private(interaction: discord.Interaction, content: str):
+        """
+        Réponse visible du seul auteur après un defer public : le premier followup remplacerait
+        le message « réfléchit… » (public), on le retire pour envoyer un message éphémère
+        """
+        try:
+            await interaction.delete_original_response()
+        except discord.HTTPException:
+            pass
+        await interaction.followup.send(content, ephemeral=True)
+    
+    @app_commands.command(name="stats", description="Voir les statistiques d'un membre")
+    @app_commands.describe(member="Le membre (optionnel, vous par défaut)")
+    async def stats(self, interaction: discord.Interaction, member: discord.Member = None):
+        """Affiche les statistiques d'un membre"""
+        target = member or interaction.user
+        # Répondre à Discord tout de suite, les requêtes suivent
+        await interaction.response.defer()
+        
+        try:
+            # Toutes les statistiques en une fois
+            snapshot = await self.get_activity_snapshot(interaction.guild.id, target.id)
+            total_messages = snapshot['message_count']
+            msg_24h = snapshot['messages_24h']
+            msg_7d = snapshot['messages_7d']
+            voice_total = snapshot['voice_total']
+            voice_24h = snapshot['voice_24h']
+            voice_7d = snapshot['voice_7d']
+            msg_rank, msg_users = snapshot['message_rank']
+            voice_rank, voice_users = snapshot['voice_rank']
+            
+            # Vérifier s'il y a des données à afficher
+            has_data = total_messages > 0 or voice_total > 0
+            
+            if not has_data:
+                return await self._send_private(
+                    interaction,
+                    f"{Emojis.INFO} Aucune statistique disponible pour {target.mention}."
+                )
+            
+            # Créer l'embed
+            embed = discord.Embed(
+                title=f"📊 Statistiques de {target.display_name}",
+                color=Colors.INFO
+            )
+            embed.set_thumbnail(url=target.display_avatar.url)
+            
+            # Fonction helper pour formater le temps
+            def format_time(seconds):
+                if seconds == 0:
+                    return "0min"
+                hours = seconds // 3600
+                minutes = (seconds % 3600) // 60
+                if hours > 0:
+                    return f"{hours}h {minutes}min"
+                return f"{minutes}min"
+            
+            # Messages
+            msg_value = f"**Total:** {total_messages:,} messages\n"
+            msg_value += f"**24h:** {msg_24h:,} messages\n"
+            msg_value += f"**7j:** {msg_7d:,} messages"
+            if msg_users > 0:
+                msg_value += f"\n**Rang (7j):** #{msg_rank}/{msg_users}"
+            
+            embed.add_field(
+                name="💬 Messages",
+                value=msg_value,
+                inline=True
+            )
+            
+            # Temps Vocal
+            voice_value = f"**Total:** {format_time(voice_total)}\n"
+            voice_value += f"**24h:** {format_time(voice_24h)}\n"
+            voice_value += f"**7j:** {format_time(voice_7d)}"
+            if voice_users > 0:
+                voice_value += f"\n**Rang (7j):** #{voice_rank}/{voice_users}"
+            
+            embed.add_field(
+                name="🎤 Temps Vocal",
+                value=voice_value,
+                inline=True
+            )
+            
+            # Dernière activité
+            if snapshot['last_message_at']:
+                last_msg = datetime.fromisoformat(snapshot['last_message_at'])
+                time_ago = datetime.now() - last_msg
+                
+                if time_ago.days > 0:
+                    ago_str = f"il y a {time_ago.days} jour(s)"
+                elif time_ago.seconds > 3600:
+                    ago_str = f"il y a {time_ago.seconds // 3600} heure(s)"
+                else:
+                    ago_str = f"il y a {time_ago.seconds // 60} minute(s)"
+                
+                embed.add_field(
+                    name="⏰ Dernière activité",
+                    value=ago_str,
+                    inline=False
+                )
+            
+            # Informations additionnelles
+            embed.add_field(
+                name="📅 Membre depuis",
+                value=f"<t:{int(target.joined_at.timestamp())}:R>",
+                inline=False
+            )
+            
+            embed.set_footer(text=f"ID: {target.id}")
+            
+            await interaction.followup.send(embed=embed)
+            
+        except Exception as e:
+            await self._send_private(interaction, f"{Emojis.ERROR} Erreur: {str(e)}")
+            logger.error(f"Erreur dans stats: {e}")
+    
+    @app_commands.command(name="activityboard", description="Classement d'activité du serveur")
+    @app_commands.describe(limit="Nombre de résultats par page (max 25)")
+    async def activityboard(self, interaction: discord.Interaction, limit: int = 10):
+        """Affiche le classement d'activité par messages"""
+        try:
+            # Limiter entre 5 et 25
+            limit = max(5, min(limit, 25))
+            
+            # Classement servi par le cache en mémoire
+            guild = interaction.guild
+            rows, next_cursor = await self.board.page(guild.id, limit)
+            
+            if not rows:
+                return await interaction.response.send_message(
+                    f"{Emojis.INFO} Aucune statistique disponible.",
+                    ephemeral=True
+                )
+            
+            def render(rows, page):
+                embed = discord.Embed(
+                    title="🏆 Classement d'Activité - Messages",
+                    description=f"Membres les plus actifs • Page {page}",
+                    color=Colors.SUCCESS
+                )
+                medals = ["🥇", "🥈", "🥉"]
+                for rank, user_id, count, _ in rows:
+                    member = guild.get_member(user_id)
+                    medal = medals[rank-1] if rank <= 3 else f"`#{rank}`"
+                    embed.add_field(
+                        name=f"{medal} {member.display_name if member else user_id}",
+                        value=f"💬 **{count:,}** messages",
+                        inline=False
+                    )
+                embed.set_footer(text=f"Serveur: {guild.name}")
+                return embed
+            
+            view = LeaderboardView(self.board, guild, interaction.user.id, limit, render, next_cursor)
+            await interaction.response.send_message(embed=render(rows, 1), view=view)
+            
+        except Exception as e:
+            await interaction.response.send_message(
+                f"{Emojis.ERROR} Erreur: {str(e)}",
+                ephemeral=True
+            )
+            logger.error(f"Erreur dans activityboard: {e}")
+
+async def setup(bot):
+    await bot.add_cog(Analytics(bot))
@@ -1,236 +1,550 @@
-"""
-Cog d'Auto-Modération - Détection automatique de spam et contenus indésirables
-"""
-
-import discord
-from discord.ext import commands
-from discord import app_commands
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
-from config import Config, Colors, Emojis
-import database
-import logging
-
-logger = logging.getLogger(__name__)
-
-class AutoMod(commands.Cog):
-    """Auto-modération pour détecter et punir automatiquement"""
-    
-    def __init__(self, bot):
-        self.bot = bot
-        # Tracking des messages pour détection de spam
-        self.message_history = defaultdict(lambda: deque(maxlen=Config.SPAM_THRESHOLD))
-        # Tracking des violations
-        self.violations = defaultdict(int)
-    
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        """Écoute tous les messages pour auto-modération"""
-        # Ignorer les bots et les DMs
-        if message.author.bot or not message.guild:
-            return
-        
-        # Ignorer les admins/modos
-        if message.author.guild_permissions.administrator or message.author.guild_permissions.manage_messages:
-            return
-        
-        # Vérifier si l'auto-mod est activée
-        config = await database.get_guild_config(message.guild.id)
-        if not config['automod_enabled']:
-            return
-        
-        # === DÉTECTION DE SPAM ===
-        if await self._check_spam(message):
-            await self._handle_spam(message)
-            return
-        
-        # === DÉTECTION DE LIENS ===
-        if config['antilink_enabled'] and await self._check_links(message):
-            await self._handle_links(message)
-            return
-        
-        # === DÉTECTION DE MENTIONS MASSIVES ===
-        if await self._check_mass_mentions(message):
-            await self._handle_mass_mentions(message)
-            return
-    
-    async def _check_spam(self, message: discord.Message) -> bool:
-        """Détecte le spam (messages identiques répétés)"""
-        user_messages = self.message_history[message.author.id]
-        user_messages.append({
-            'content': message.content.lower(),
-            'timestamp': datetime.now()
-        })
-        
-        # Vérifier si les X derniers messages sont identiques
-        if len(user_messages) >= Config.SPAM_THRESHOLD:
-            recent = [msg for msg in user_messages 
-                     if (datetime.now() - msg['timestamp']).seconds < Config.SPAM_TIME_WINDOW]
-            
-            if len(recent) >= Config.SPAM_THRESHOLD:
-                contents = [msg['content'] for msg in recent]
-                if len(set(contents)) == 1:  # Tous identiques
-                    return True
-        
-        return False
-    
-    async def _check_links(self, message: discord.Message) -> bool:
-        """Détecte les liens dans les messages"""
-        link_patterns = ['http://', 'https://', 'www.', '.com', '.net', '.org', '.gg']
-        return any(pattern in message.content.lower() for pattern in link_patterns)
-    
-    async def _check_mass_mentions(self, message: discord.Message) -> bool:
-        """Détecte les mentions massives"""
-        total_mentions = len(message.mentions) + len(message.role_mentions)
-        return total_mentions >= Config.MENTION_THRESHOLD
-    
-    async def _handle_spam(self, message: discord.Message):
-        """Gère la détection de spam"""
-        try:
-            # Supprimer les messages récents de l'utilisateur
-            def check(m):
-                return (m.author == message.author and 
-                       (datetime.now() - m.created_at).seconds < Config.SPAM_TIME_WINDOW)
-            
-            deleted = await message.channel.purge(limit=20, check=check)
-            
-            # Incrémenter les violations
-            self.violations[message.author.id] += 1
-            violations = self.violations[message.author.id]
-            
-            # Actions progressives
-            if violations == 1:
-                # Premier avertissement
-                embed = discord.Embed(
-                    title=f"{Emojis.WARNING} Anti-Spam",
-                    description=f"{message.author.mention}, merci de ne pas spammer. ({len(deleted)} messages supprimés)",
-                    color=Colors.WARNING
-                )
-                await message.channel.send(embed=embed, delete_after=10)
-                
-            elif violations == 2:
-                # Mute 5 minutes
-                await message.author.timeout(
-                    timedelta(minutes=5),
-                    reason="Auto-mod: Spam répété"
-                )
-                await message.channel.send(
-                    f"{Emojis.MUTE} {message.author.mention} a été mute pour 5 minutes (spam répété).",
-                    delete_after=10
-                )
-                await database.add_warn(message.guild.id, message.author.id, self.bot.user.id, "Auto-mod: Spam")
-                
-            elif violations >= 3:
-                # Kick
-                await message.author.kick(reason="Auto-mod: Spam excessif")
-                await message.channel.send(
-                    f"{Emojis.KICK} {message.author.mention} a été expulsé pour spam excessif."
-                )
-                await database.add_mod_log(
-                    message.guild.id,
-                    "KICK",
-                    self.bot.user.id,
-                    message.author.id,
-                    "Auto-mod: Spam excessif"
-                )
-            
-            logger.info(f"Auto-mod: Spam détecté de {message.author} ({violations} violations)")
-            
-        except discord.Forbidden:
-            logger.warning(f"Auto-mod: Permissions insuffisantes pour modérer {message.author}")
-    
-    async def _handle_links(self, message: discord.Message):
-        """Gère la détection de liens"""
-        try:
-            await message.delete()
-            
-            embed = discord.Embed(
-                title=f"{Emojis.WARNING} Anti-Liens",
-                description=f"{message.author.mention}, les liens ne sont pas autorisés dans ce serveur.",
-                color=Colors.WARNING
-            )
-            await message.channel.send(embed=embed, delete_after=10)
-            
-            logger.info(f"Auto-mod: Lien supprimé de {message.author}")
-            
-        except discord.Forbidden:
-            pass
-    
-    async def _handle_mass_mentions(self, message: discord.Message):
-        """Gère les mentions massives"""
-        try:
-            await message.delete()
-            
-            # Mute immédiat 10 minutes
-            await message.author.timeout(
-                timedelta(minutes=10),
-                reason="Auto-mod: Mentions massives"
-            )
-            
-            embed = discord.Embed(
-                title=f"{Emojis.MUTE} Mentions Massives",
-                description=f"{message.author.mention} a été mute pour 10 minutes (mentions massives).",
-                color=Colors.ERROR
-            )
-            await message.channel.send(embed=embed)
-            
-            await database.add_warn(
-                message.guild.id,
-                message.author.id,
-                self.bot.user.id,
-                "Auto-mod: Mentions massives"
-            )
-            
-            logger.info(f"Auto-mod: Mentions massives de {message.author}")
-            
-        except discord.Forbidden:
-            pass
-    
-    # ===== COMMANDES DE CONFIGURATION =====
-    @app_commands.command(name="automod", description="Activer/désactiver l'auto-modération")
-    @app_commands.describe(enabled="Activer (True) ou désactiver (False)")
-    @app_commands.checks.has_permissions(administrator=True)
-    async def automod_toggle(self, interaction: discord.Interaction, enabled: bool):
-        """Active ou désactive l'auto-modération"""
-        await database.update_guild_config(interaction.guild.id, automod_enabled=enabled)
-        
-        status = "activée" if enabled else "désactivée"
-        emoji = Emojis.SUCCESS if enabled else Emojis.ERROR
-        
-        embed = discord.Embed(
-            title=f"{emoji} Auto-Modération",
-            description=f"L'auto-modération a été **{status}**.",
-            color=Colors.SUCCESS if enabled else Colors.WARNING
-        )
-        
-        if enabled:
-            embed.add_field(
-                name="Fonctionnalités",
-                value="• Détection de spam\n• Protection mentions massives\n• Filtrage de liens (si activé)",
-                inline=False
-            )
-        
-        await interaction.response.send_message(embed=embed)
-        logger.info(f"{interaction.user} a {status} l'auto-modération")
-    
-    @app_commands.command(name="antilink", description="Activer/désactiver le filtre anti-liens")
-    @app_commands.describe(enabled="Activer (True) ou désactiver (False)")
-    @app_commands.checks.has_permissions(administrator=True)
-    async def antilink_toggle(self, interaction: discord.Interaction, enabled: bool):
-        """Active ou désactive le filtre anti-liens"""
-        await database.update_guild_config(interaction.guild.id, antilink_enabled=enabled)
-        
-        status = "activé" if enabled else "désactivé"
-        emoji = Emojis.SUCCESS if enabled else Emojis.ERROR
-        
-        embed = discord.Embed(
-            title=f"{emoji} Anti-Liens",
-            description=f"Le filtre anti-liens a été **{status}**.",
-            color=Colors.SUCCESS if enabled else Colors.WARNING
-        )
-        
-        await interaction.response.send_message(embed=embed)
-        logger.info(f"{interaction.user} a {status} l'anti-liens")
-
-async def setup(bot):
-    await bot.add_cog(AutoMod(bot))
+"""
+Cog d'Auto-Modération - Détection automatique de spam et contenus indésirables
+"""
+
+import discord
+from discord.ext import commands, tasks
+from discord import app_commands
+from datetime import timedelta
+from config import Config, Colors, Emojis
+import database
+from pipeline import MessageContext, ORDER_AUTOMOD
+from spam_tracker import SpamTracker
+from flood_detector import FloodDetector
+from violations import ViolationLedger
+from link_filter import LinkFilter, normalize_domain
+from automod_rules import RuleEngine, RULE_DEFAULTS, RULE_LABELS, parse_rule_value
+from check_pool import CheckPool
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AutoMod(commands.Cog):
+    """Auto-modération pour détecter et punir automatiquement"""
+    
+    def __init__(self, bot):
+        self.bot = bot
+        # Tracking des messages pour détection de spam (par serveur et utilisateur)
+        self.spam_tracker = SpamTracker(Config.SPAM_THRESHOLD, Config.SPAM_TIME_WINDOW)
+        # Messages quasi identiques de plusieurs comptes (raids coordonnés)
+        self.flood_detector = FloodDetector(
+            Config.FLOOD_MIN_MESSAGES,
+            Config.FLOOD_MIN_AUTHORS,
+            Config.FLOOD_TIME_WINDOW,
+            Config.FLOOD_SIMILARITY
+        )
+        # Scores de violation (décroissants, sauvegardés par lots)
+        self.violations = ViolationLedger()
+        # Liens : listes du serveur et domaines de phishing connus
+        self.link_filter = LinkFilter()
+        # Contrôles coûteux exécutés hors de la boucle d'événements, avec délai maximal
+        self.check_pool = CheckPool(
+            Config.AUTOMOD_OFFLOAD_MODE,
+            Config.AUTOMOD_WORKERS,
+            Config.AUTOMOD_CHECK_DEADLINE,
+            Config.AUTOMOD_MAX_PENDING
+        ) if Config.AUTOMOD_OFFLOAD_MODE else None
+        # Règles configurables par serveur, compilées à chaque changement
+        self.rule_engine = RuleEngine(self.check_pool, Config.AUTOMOD_OFFLOAD_MIN_LENGTH)
+    
+    async def cog_load(self):
+        """Enregistre l'étape auto-mod dans le pipeline des messages"""
+        await self.violations.load()
+        count = await asyncio.to_thread(self.link_filter.load_blocklist, Config.PHISHING_DOMAINS_FILE)
+        if count:
+            logger.info(f"Anti-phishing: {count:,} domaines chargés")
+        self.bot.pipeline.register("automod", self.process_message, ORDER_AUTOMOD)
+        self.sweep_trackers.start()
+        self.checkpoint_violations.start()
+    
+    async def cog_unload(self):
+        """Retire l'étape du pipeline et sauvegarde les scores de violation"""
+        self.bot.pipeline.unregister("automod")
+        self.sweep_trackers.cancel()
+        self.checkpoint_violations.cancel()
+        await self.violations.checkpoint()
+        if self.check_pool:
+            self.check_pool.shutdown()
+    
+    @tasks.loop(minutes=1)
+    async def sweep_trackers(self):
+        """Oublie les utilisateurs et salons inactifs pour garder une mémoire stable"""
+        self.spam_tracker.sweep()
+        self.flood_detector.sweep()
+    
+    @tasks.loop(seconds=Config.VIOLATION_CHECKPOINT_INTERVAL)
+    async def checkpoint_violations(self):
+        """Oublie les scores négligeables et sauvegarde les scores modifiés"""
+        self.violations.sweep()
+        await self.violations.checkpoint()
+    
+    async def process_message(self, ctx: MessageContext):
+        """Étape du pipeline : auto-modération de chaque message"""
+        message = ctx.message
+        
+        # Ignorer les admins/modos
+        if ctx.is_moderator:
+            return
+        
+        # Vérifier si l'auto-mod est activée
+        if not ctx.config['automod_enabled']:
+            return
+        
+        # Règles du serveur (recompilées seulement quand elles changent)
+        rules = self.rule_engine.get(message.guild.id, await database.get_automod_rules(message.guild.id))
+        
+        # === DÉTECTION DE SPAM ===
+        if rules.spam_threshold and await self._check_spam(message, rules.spam_threshold):
+            await self._handle_spam(message, ctx.config)
+            ctx.stop()
+            return
+        
+        # === DÉTECTION DE FLOOD COORDONNÉ ===
+        flood = self.flood_detector.check(message.channel.id, message.id, message.author.id, message.content)
+        if flood:
+            await self._handle_flood(message, *flood, ctx.config)
+            ctx.stop()
+            return
+        
+        # === DÉTECTION DE LIENS ===
+        link = await self._check_links(message, ctx.config)
+        if link:
+            await self._handle_links(message, *link, ctx.config)
+            ctx.stop()
+            return
+        
+        # === RÈGLES DU SERVEUR (mentions, majuscules, emojis, mots interdits...) ===
+        violation = await self.rule_engine.evaluate(rules, message)
+        if violation:
+            rule, detail = violation
+            if rule == "mention_limit":
+                await self._handle_mass_mentions(message)
+            else:
+                await self._handle_rule(message, rule, detail, ctx.config)
+            ctx.stop()
+            return
+    
+    async def _check_spam(self, message: discord.Message, threshold: int) -> bool:
+        """Détecte le spam (messages identiques répétés)"""
+        return self.spam_tracker.record(
+            message.guild.id,
+            message.author.id,
+            message.content,
+            message.channel.id,
+            message.id,
+            threshold
+        )
+    
+    async def _delete_message_ids(self, channel, message_ids: list, reason: str) -> int:
+        """Supprime des messages par ID : par lots de 100, un par un au-delà de 14 jours"""
+        # Suppressions de l'auto-mod : pas de log « message supprimé » en double
+        message_logs = self.bot.get_cog("MessageLogs")
+        if message_logs:
+            message_logs.cache.discard(channel.guild.id, message_ids)
+        
+        # Discord refuse la suppression groupée des messages de plus de 14 jours
+        bulk_limit = discord.utils.utcnow() - timedelta(days=14, minutes=-1)
+        recent = [i for i in message_ids if discord.utils.snowflake_time(i) > bulk_limit]
+        old = [i for i in message_ids if discord.utils.snowflake_time(i) <= bulk_limit]
+        deleted = 0
+        
+        for i in range(0, len(recent), 100):
+            chunk = recent[i:i + 100]
+            try:
+                await channel.delete_messages([discord.Object(id=message_id) for message_id in chunk], reason=reason)
+                deleted += len(chunk)
+            except discord.NotFound:
+                pass  # Déjà supprimés
+        
+        for message_id in old:
+            try:
+                await channel.get_partial_message(message_id).delete()
+                deleted += 1
+            except discord.NotFound:
+                pass
+        
+        return deleted
+    
+    async def _check_links(self, message: discord.Message, config: dict):
+        """Détecte les liens à sanctionner, retourne (verdict, domaine) ou None"""
+        if "." not in message.content and "://" not in message.content:
+            return None
+        rules = await database.get_link_rules(message.guild.id)
+        return self.link_filter.check(message.content, rules, bool(config['antilink_enabled']))
+    
+    async def _escalate(self, member: discord.Member, channel, score: float, label: str) -> bool:
+        """Sanctions progressives selon le score de violations (mute puis kick), False sous le seuil du mute"""
+        if score < Config.VIOLATION_TIMEOUT_SCORE:
+            return False
+        try:
+            if score < Config.VIOLATION_KICK_SCORE:
+                # Mute 5 minutes
+                await member.timeout(timedelta(minutes=5), reason=f"Auto-mod: {label} (récidive)")
+                await channel.send(
+                    f"{Emojis.MUTE} {member.mention} a été mute pour 5 minutes (récidive : {label.lower()}).",
+                    delete_after=10
+                )
+                await database.add_warn(member.guild.id, member.id, self.bot.user.id, f"Auto-mod: {label}")
+            else:
+                # Kick
+                await member.kick(reason=f"Auto-mod: {label} (violations répétées)")
+                await channel.send(
+                    f"{Emojis.KICK} {member.mention} a été expulsé (violations répétées : {label.lower()})."
+                )
+                await database.add_mod_log(
+                    member.guild.id,
+                    "KICK",
+                    self.bot.user.id,
+                    member.id,
+                    f"Auto-mod: {label} (violations répétées)"
+                )
+        except discord.Forbidden:
+            logger.warning(f"Auto-mod: Permissions insuffisantes pour sanctionner {member}")
+        except discord.HTTPException as e:
+            logger.error(f"Auto-mod: Erreur lors de la sanction de {member}: {e}")
+        logger.info(f"Auto-mod: Sanction de {member} ({label}, score de violations {score:.2f})")
+        return True
+    
+    async def _handle_spam(self, message: discord.Message, config: dict):
+        """Gère la détection de spam"""
+        try:
+            # Supprimer les messages récents de l'utilisateur, par ID (sans relire l'historique)
+            # Ils ne comptent plus pour la prochaine détection
+            recent = self.spam_tracker.pop_messages(message.guild.id, message.author.id)
+            deleted = 0
+            for channel_id, message_ids in recent.items():
+                channel = message.guild.get_channel_or_thread(channel_id)
+                if channel:
+                    deleted += await self._delete_message_ids(channel, message_ids, "Auto-mod: Spam")
+            
+            # Ajouter une violation (les anciennes s'estompent avec le temps)
+            violations = self.violations.add(
+                message.guild.id,
+                message.author.id,
+                config['violation_half_life']
+            )
+            
+            # Actions progressives : avertissement tant que le score reste sous le seuil du mute
+            if not await self._escalate(message.author, message.channel, violations, "Spam"):
+                embed = discord.Embed(
+                    title=f"{Emojis.WARNING} Anti-Spam",
+                    description=f"{message.author.mention}, merci de ne pas spammer. ({deleted} messages supprimés)",
+                    color=Colors.WARNING
+                )
+                await message.channel.send(embed=embed, delete_after=10)
+            
+            logger.info(f"Auto-mod: Spam détecté de {message.author} (score de violations {violations:.2f})")
+            
+        except discord.Forbidden:
+            logger.warning(f"Auto-mod: Permissions insuffisantes pour modérer {message.author}")
+    
+    async def _handle_flood(self, message: discord.Message, offenders: list, follow_up: bool, config: dict):
+        """Gère un flood coordonné : supprime tous les messages en cause (alerte au premier signalement)"""
+        message_ids = [message_id for _, message_id in offenders]
+        author_ids = list(dict.fromkeys(author_id for author_id, _ in offenders))
+        
+        try:
+            await self._delete_message_ids(message.channel, message_ids, "Auto-mod: Flood coordonné")
+        except discord.Forbidden:
+            logger.warning(f"Auto-mod: Permissions insuffisantes pour supprimer le flood dans #{message.channel}")
+            return
+        except discord.HTTPException as e:
+            logger.error(f"Auto-mod: Erreur lors de la suppression du flood: {e}")
+        
+        # Chaque compte impliqué reçoit une violation
+        for author_id in author_ids:
+            score = self.violations.add(message.guild.id, author_id, config['violation_half_life'])
+            member = message.guild.get_member(author_id)
+            if member:
+                await self._escalate(member, message.channel, score, "Flood coordonné")
+        
+        if follow_up:
+            # Flood déjà annoncé dans le salon et les logs
+            logger.info(f"Auto-mod: Suite de flood dans #{message.channel} ({len(message_ids)} messages)")
+            return
+        
+        embed = discord.Embed(
+            title=f"{Emojis.WARNING} Anti-Flood",
+            description=f"{len(message_ids)} messages similaires de {len(author_ids)} comptes ont été supprimés.",
+            color=Colors.WARNING
+        )
+        await message.channel.send(embed=embed, delete_after=10)
+        
+        log_embed = discord.Embed(
+            title="🚨 Flood coordonné",
+            description=f"Salon: {message.channel.mention}\n"
+                        f"Messages supprimés: **{len(message_ids)}**\n"
+                        f"Comptes: {' '.join(f'<@{author_id}>' for author_id in author_ids)[:3900]}",
+            color=Colors.ERROR,
+            timestamp=discord.utils.utcnow()
+        )
+        await database.send_mod_log(self.bot, message.guild.id, log_embed)
+        
+        logger.info(f"Auto-mod: Flood de {len(author_ids)} comptes dans #{message.channel} ({len(message_ids)} messages)")
+    
+    async def _handle_links(self, message: discord.Message, verdict: str, domain: str, config: dict):
+        """Gère la détection de liens"""
+        try:
+            await message.delete()
+            
+            if verdict == "phishing":
+                description = f"{message.author.mention}, ce lien est connu pour du phishing et a été supprimé."
+            elif verdict == "denied":
+                description = f"{message.author.mention}, les liens vers `{domain}` sont interdits dans ce serveur."
+            else:
+                description = f"{message.author.mention}, les liens ne sont pas autorisés dans ce serveur."
+            
+            embed = discord.Embed(
+                title=f"{Emojis.WARNING} Anti-Liens",
+                description=description,
+                color=Colors.ERROR if verdict == "phishing" else Colors.WARNING
+            )
+            await message.channel.send(embed=embed, delete_after=10)
+            
+            if verdict == "phishing":
+                # Compte probablement compromis : violation et log
+                score = self.violations.add(message.guild.id, message.author.id, config['violation_half_life'])
+                log_embed = discord.Embed(
+                    title="🎣 Lien de phishing supprimé",
+                    color=Colors.ERROR,
+                    timestamp=discord.utils.utcnow()
+                )
+                log_embed.add_field(name="Membre", value=f"{message.author.mention} ({message.author.id})", inline=True)
+                log_embed.add_field(name="Domaine", value=f"`{domain}`", inline=True)
+                log_embed.add_field(name="Salon", value=message.channel.mention, inline=True)
+                await database.send_mod_log(self.bot, message.guild.id, log_embed)
+                await self._escalate(message.author, message.channel, score, "Lien de phishing")
+            
+            logger.info(f"Auto-mod: Lien supprimé de {message.author} ({verdict}: {domain})")
+            
+        except discord.Forbidden:
+            pass
+    
+    async def _handle_rule(self, message: discord.Message, rule: str, detail: str, config: dict):
+        """Gère une règle du serveur enfreinte : suppression et violation"""
+        try:
+            await message.delete()
+        except discord.Forbidden:
+            return
+        except discord.NotFound:
+            pass
+        
+        score = self.violations.add(message.guild.id, message.author.id, config['violation_half_life'])
+        
+        # Ne pas répéter le mot interdit dans le salon
+        reason = RULE_LABELS[rule] if rule == "banned_words" else f"{RULE_LABELS[rule]} ({detail})"
+        embed = discord.Embed(
+            title=f"{Emojis.WARNING} Auto-Modération",
+            description=f"{message.author.mention}, votre message a été supprimé : {reason}.",
+            color=Colors.WARNING
+        )
+        await message.channel.send(embed=embed, delete_after=10)
+        await self._escalate(message.author, message.channel, score, RULE_LABELS[rule])
+        
+        logger.info(f"Auto-mod: {rule} de {message.author} ({detail})")
+    
+    async def _handle_mass_mentions(self, message: discord.Message):
+        """Gère les mentions massives"""
+        try:
+            await message.delete()
+            
+            # Mute immédiat 10 minutes
+            await message.author.timeout(
+                timedelta(minutes=10),
+                reason="Auto-mod: Mentions massives"
+            )
+            
+            embed = discord.Embed(
+                title=f"{Emojis.MUTE} Mentions Massives",
+                description=f"{message.author.mention} a été mute pour 10 minutes (mentions massives).",
+                color=Colors.ERROR
+            )
+            await message.channel.send(embed=embed)
+            
+            await database.add_warn(
+                message.guild.id,
+                message.author.id,
+                self.bot.user.id,
+                "Auto-mod: Mentions massives"
+            )
+            
+            logger.info(f"Auto-mod: Mentions massives de {message.author}")
+            
+        except discord.Forbidden:
+            pass
+    
+    # ===== COMMANDES DE CONFIGURATION =====
+    @app_commands.command(name="automod", description="Activer/désactiver l'auto-modération")
+    @app_commands.describe(enabled="Activer (True) ou désactiver (False)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def automod_toggle(self, interaction: discord.Interaction, enabled: bool):
+        """Active ou désactive l'auto-modération"""
+        await database.update_guild_config(interaction.guild.id, automod_enabled=enabled)
+        
+        status = "activée" if enabled else "désactivée"
+        emoji = Emojis.SUCCESS if enabled else Emojis.ERROR
+        
+        embed = discord.Embed(
+            title=f"{emoji} Auto-Modération",
+            description=f"L'auto-modération a été **{status}**.",
+            color=Colors.SUCCESS if enabled else Colors.WARNING
+        )
+        
+        if enabled:
+            embed.add_field(
+                name="Fonctionnalités",
+                value="• Détection de spam\n• Protection mentions massives\n• Filtrage de liens (si activé)",
+                inline=False
+            )
+        
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"{interaction.user} a {status} l'auto-modération")
+    
+    @app_commands.command(name="violationdecay", description="Durée après laquelle les violations auto-mod comptent moitié moins")
+    @app_commands.describe(hours="Demi-vie en heures (24 par défaut)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def violation_decay(self, interaction: discord.Interaction, hours: app_commands.Range[float, 0.5, 720.0]):
+        """Configure la demi-vie des scores de violation"""
+        await database.update_guild_config(interaction.guild.id, violation_half_life=hours)
+        
+        embed = discord.Embed(
+            title=f"{Emojis.SUCCESS} Violations Auto-Mod",
+            description=f"Les violations comptent moitié moins après **{hours:g}h**.",
+            color=Colors.SUCCESS
+        )
+        
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"{interaction.user} a réglé la demi-vie des violations à {hours}h")
+    
+    @app_commands.command(name="antilink", description="Activer/désactiver le filtre anti-liens")
+    @app_commands.describe(enabled="Activer (True) ou désactiver (False)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def antilink_toggle(self, interaction: discord.Interaction, enabled: bool):
+        """Active ou désactive le filtre anti-liens"""
+        await database.update_guild_config(interaction.guild.id, antilink_enabled=enabled)
+        
+        status = "activé" if enabled else "désactivé"
+        emoji = Emojis.SUCCESS if enabled else Emojis.ERROR
+        
+        embed = discord.Embed(
+            title=f"{emoji} Anti-Liens",
+            description=f"Le filtre anti-liens a été **{status}**.",
+            color=Colors.SUCCESS if enabled else Colors.WARNING
+        )
+        
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"{interaction.user} a {status} l'anti-liens")
+
+    @app_commands.command(name="automodrule", description="Modifier une règle d'auto-modération du serveur")
+    @app_commands.describe(
+        rule="La règle à modifier",
+        value="Nouvelle valeur (0 = désactivée, vide = valeur par défaut ; mots séparés par des virgules)"
+    )
+    @app_commands.choices(rule=[
+        app_commands.Choice(name=label, value=rule) for rule, label in RULE_LABELS.items()
+    ])
+    @app_commands.checks.has_permissions(administrator=True)
+    async def automod_rule(self, interaction: discord.Interaction, rule: str, value: str = None):
+        """Modifie une règle d'auto-mod (seuil, ratio ou liste de mots)"""
+        try:
+            parsed = parse_rule_value(rule, value) if value is not None else None
+        except ValueError as e:
+            return await interaction.response.send_message(
+                f"{Emojis.ERROR} Valeur invalide: {e}",
+                ephemeral=True
+            )
+        
+        await database.set_automod_rule(interaction.guild.id, rule, parsed)
+        shown = parsed if parsed is not None else RULE_DEFAULTS[rule]
+        if isinstance(shown, list):
+            shown = f"{len(shown)} mot(s)"
+        
+        embed = discord.Embed(
+            title=f"{Emojis.SUCCESS} Auto-Modération",
+            description=f"**{RULE_LABELS[rule]}** : `{shown}`" + (" (par défaut)" if parsed is None else ""),
+            color=Colors.SUCCESS
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=rule == "banned_words")
+        logger.info(f"{interaction.user} a modifié la règle auto-mod {rule}")
+    
+    @app_commands.command(name="automodrules", description="Voir les règles d'auto-modération du serveur")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def automod_rules(self, interaction: discord.Interaction):
+        """Affiche les règles effectives du serveur"""
+        rules = self.rule_engine.get(interaction.guild.id, await database.get_automod_rules(interaction.guild.id))
+        
+        embed = discord.Embed(
+            title="🛡️ Règles d'auto-modération",
+            description="0 = règle désactivée",
+            color=Colors.INFO
+        )
+        for rule, label in RULE_LABELS.items():
+            value = rules.settings[rule]
+            if rule == "banned_words":
+                value = ", ".join(value)[:1000] or "Aucun"
+            embed.add_field(name=label, value=f"`{value}`", inline=True)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @app_commands.command(name="linkrule", description="Autoriser ou interdire un domaine (et ses sous-domaines)")
+    @app_commands.describe(
+        action="Autoriser, interdire ou retirer de la liste",
+        domain="Domaine (ex: youtube.com)"
+    )
+    @app_commands.choices(action=[
+        app_commands.Choice(name="Autoriser", value="allow"),
+        app_commands.Choice(name="Interdire", value="deny"),
+        app_commands.Choice(name="Retirer", value="remove")
+    ])
+    @app_commands.checks.has_permissions(administrator=True)
+    async def link_rule(self, interaction: discord.Interaction, action: str, domain: str):
+        """Gère les listes de domaines autorisés et interdits"""
+        domain = normalize_domain(domain)
+        if "." not in domain:
+            return await interaction.response.send_message(
+                f"{Emojis.ERROR} Domaine invalide. Exemple: `youtube.com`",
+                ephemeral=True
+            )
+        
+        if action == "remove":
+            if not await database.remove_link_rule(interaction.guild.id, domain):
+                return await interaction.response.send_message(
+                    f"{Emojis.INFO} `{domain}` n'est dans aucune liste.",
+                    ephemeral=True
+                )
+            description = f"`{domain}` a été retiré des listes."
+        else:
+            await database.set_link_rule(interaction.guild.id, domain, action)
+            status = "autorisé" if action == "allow" else "interdit"
+            description = f"`{domain}` et ses sous-domaines sont maintenant **{status}s**."
+        
+        embed = discord.Embed(
+            title=f"{Emojis.SUCCESS} Anti-Liens",
+            description=description,
+            color=Colors.SUCCESS
+        )
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"{interaction.user} a modifié les règles de liens: {action} {domain}")
+    
+    @app_commands.command(name="linkrules", description="Voir les domaines autorisés et interdits")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def link_rules(self, interaction: discord.Interaction):
+        """Affiche les listes de domaines du serveur"""
+        rules = await database.get_link_rules(interaction.guild.id)
+        
+        def format_domains(domains):
+            text = "\n".join(f"`{domain}`" for domain in sorted(domains))
+            return text[:1024] if text else "Aucun"
+        
+        embed = discord.Embed(
+            title="🔗 Règles de liens",
+            color=Colors.INFO
+        )
+        embed.add_field(name="✅ Autorisés", value=format_domains(rules["allow"]), inline=True)
+        embed.add_field(name="⛔ Interdits", value=format_domains(rules["deny"]), inline=True)
+        embed.set_footer(text=f"Anti-phishing: {len(self.link_filter.blocklist):,} domaines connus")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(AutoMod(bot))
@@ -1,211 +1,577 @@
-"""
-Cog de Leveling - Système de niveaux et XP
-"""
-
-import discord
-from discord import app_commands
-from discord.ext import commands
-from datetime import datetime, timedelta
-import database
-from config import Config, Colors, Emojis
-import random
-import logging
-
-logger = logging.getLogger(__name__)
-
-class Leveling(commands.Cog):
-    """Système de niveaux basé sur l'activité"""
-    
-    def __init__(self, bot):
-        self.bot = bot
-        # Cache pour le cooldown XP
-        self.xp_cooldowns = {}
-    
-    @commands.Cog.listener()
-    async def on_message(self, message: discord.Message):
-        """Gagne de l'XP en envoyant des messages"""
-        # Ignorer les bots et DMs
-        if message.author.bot or not message.guild:
-            return
-        
-        # Vérifier si le leveling est activé
-        config = await database.get_guild_config(message.guild.id)
-        if not config['leveling_enabled']:
-            return
-        
-        # Vérifier le cooldown
-        user_id = message.author.id
-        now = datetime.now()
-        
-        if user_id in self.xp_cooldowns:
-            last_xp = self.xp_cooldowns[user_id]
-            if (now - last_xp).total_seconds() < Config.XP_COOLDOWN:
-                return  # Encore en cooldown
-        
-        # Donner de l'XP
-        xp_gain = random.randint(Config.XP_MIN, Config.XP_MAX)
-        leveled_up, new_level = await database.add_xp(message.guild.id, message.author.id, xp_gain)
-        
-        # Mettre à jour le cooldown
-        self.xp_cooldowns[user_id] = now
-        
-        # Si level up, envoyer un message
-        if leveled_up:
-            embed = discord.Embed(
-                title=f"{Emojis.LEVEL_UP} LEVEL UP!",
-                description=f"Bravo {message.author.mention} ! Tu es maintenant **niveau {new_level}** !",
-                color=Colors.SUCCESS
-            )
-            
-            await message.channel.send(embed=embed, delete_after=10)
-            logger.info(f"{message.author} a atteint le niveau {new_level}")
-    
-    # ===== RANK =====
-    @app_commands.command(name="rank", description="Voir votre niveau et XP")
-    @app_commands.describe(member="Le membre à vérifier (vous par défaut)")
-    async def rank(self, interaction: discord.Interaction, member: discord.Member = None):
-        """Affiche le niveau et l'XP d'un utilisateur"""
-        member = member or interaction.user
-        
-        data = await database.get_level_data(interaction.guild.id, member.id)
-        
-        if not data:
-            return await interaction.response.send_message(
-                f"{Emojis.INFO} **{member.display_name}** n'a pas encore gagné d'XP.",
-                ephemeral=True
-            )
-        
-        level = data['level']
-        xp = data['xp']
-        
-        # Calculer l'XP nécessaire pour le prochain niveau
-        current_level_xp = Config.XP_FORMULA(level)
-        next_level_xp = Config.XP_FORMULA(level + 1)
-        xp_for_next = next_level_xp - current_level_xp
-        current_xp = xp - current_level_xp
-        
-        # Calculer le pourcentage
-        progress_percent = int((current_xp / xp_for_next) * 100)
-        
-        # Barre de progression
-        filled = "█" * (progress_percent // 10)
-        empty = "░" * (10 - (progress_percent // 10))
-        progress_bar = f"[{filled}{empty}] {progress_percent}%"
-        
-        embed = discord.Embed(
-            title=f"📊 Niveau de {member.display_name}",
-            color=member.color if member.color != discord.Color.default() else Colors.INFO
-        )
-        
-        embed.set_thumbnail(url=member.display_avatar.url)
-        
-        embed.add_field(
-            name="🎖️ Niveau",
-            value=f"**{level}**",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="✨ XP Total",
-            value=f"**{xp}**",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="📈 Progression",
-            value=f"{current_xp}/{xp_for_next} XP\n{progress_bar}",
-            inline=False
-        )
-        
-        await interaction.response.send_message(embed=embed)
-    
-    # ===== LEADERBOARD =====
-    @app_commands.command(name="leaderboard", description="Voir le classement du serveur")
-    @app_commands.describe(limit="Nombre de personnes à afficher (max 20)")
-    async def leaderboard(self, interaction: discord.Interaction, limit: int = 10):
-        """Affiche le classement des membres les plus actifs"""
-        if limit < 1 or limit > 20:
-            return await interaction.response.send_message(
-                f"{Emojis.ERROR} Veuillez spécifier un nombre entre 1 et 20.",
-                ephemeral=True
-            )
-        
-        data = await database.get_leaderboard(interaction.guild.id, limit)
-        
-        if not data:
-            return await interaction.response.send_message(
-                f"{Emojis.INFO} Aucune donnée de classement disponible.",
-                ephemeral=True
-            )
-        
-        embed = discord.Embed(
-            title=f"🏆 Classement de {interaction.guild.name}",
-            description=f"Top {len(data)} membres les plus actifs",
-            color=Colors.INFO
-        )
-        
-        medals = ["🥇", "🥈", "🥉"]
-        
-        for i, row in enumerate(data, 1):
-            member = interaction.guild.get_member(row['user_id'])
-            if not member:
-                continue
-            
-            medal = medals[i-1] if i <= 3 else f"**#{i}**"
-            
-            embed.add_field(
-                name=f"{medal} {member.display_name}",
-                value=f"Niveau {row['level']} • {row['xp']} XP",
-                inline=False
-            )
-        
-        await interaction.response.send_message(embed=embed)
-    
-    # ===== SETLEVEL (ADMIN) =====
-    @app_commands.command(name="setlevel", description="Définir le niveau d'un membre (admin)")
-    @app_commands.describe(
-        member="Le membre",
-        level="Le nouveau niveau"
-    )
-    @app_commands.checks.has_permissions(administrator=True)
-    async def setlevel(self, interaction: discord.Interaction, member: discord.Member, level: int):
-        """Définit manuellement le niveau d'un membre"""
-        if level < 0:
-            return await interaction.response.send_message(
-                f"{Emojis.ERROR} Le niveau doit être positif.",
-                ephemeral=True
-            )
-        
-        await database.set_level(interaction.guild.id, member.id, level)
-        
-        embed = discord.Embed(
-            title=f"{Emojis.SUCCESS} Niveau modifié",
-            description=f"{member.mention} est maintenant **niveau {level}**.",
-            color=Colors.SUCCESS
-        )
-        
-        await interaction.response.send_message(embed=embed)
-        logger.info(f"{interaction.user} a défini le niveau de {member} à {level}")
-    
-    # ===== TOGGLE LEVELING =====
-    @app_commands.command(name="leveling", description="Activer/désactiver le système de niveaux")
-    @app_commands.describe(enabled="Activer (True) ou désactiver (False)")
-    @app_commands.checks.has_permissions(administrator=True)
-    async def leveling_toggle(self, interaction: discord.Interaction, enabled: bool):
-        """Active ou désactive le système de niveaux"""
-        await database.update_guild_config(interaction.guild.id, leveling_enabled=enabled)
-        
-        status = "activé" if enabled else "désactivé"
-        emoji = Emojis.SUCCESS if enabled else Emojis.ERROR
-        
-        embed = discord.Embed(
-            title=f"{emoji} Système de Niveaux",
-            description=f"Le système de niveaux a été **{status}**.",
-            color=Colors.SUCCESS if enabled else Colors.WARNING
-        )
-        
-        await interaction.response.send_message(embed=embed)
-        logger.info(f"{interaction.user} a {status} le système de niveaux")
-
-async def setup(bot):
-    await bot.add_cog(Leveling(bot))
+"""
+Cog de Leveling - Système de niveaux et XP
+"""
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+import database
+from config import Config, Colors, Emojis
+from cooldowns import CooldownStore
+from levels import LevelTable, XPAccumulator, recompute_levels, parse_xp_import, import_xp
+from leaderboard import TopKCache, LeaderboardView, guild_member_check
+from level_roles import LevelRoleSync, assignable_mapping, role_changes, apply_role_changes
+from pipeline import MessageContext, ORDER_LEVELING
+import asyncio
+import random
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class Leveling(commands.Cog):
+    """Système de niveaux basé sur l'activité"""
+    
+    def __init__(self, bot):
+        self.bot = bot
+        # Cooldown XP par serveur et utilisateur (expiré automatiquement)
+        self.xp_cooldowns = CooldownStore(Config.XP_COOLDOWN)
+        # XP des membres actifs en mémoire, écrite par lots
+        self.levels = LevelTable()
+        self.xp = XPAccumulator(self.levels)
+        # Top XP par serveur tenu à jour à chaque flush
+        self.board = TopKCache(
+            Config.LEADERBOARD_CACHE_SIZE, database.get_level_board, database.get_level_board_after,
+            present=guild_member_check(bot)
+        )
+        self.xp.listeners.append(self._update_board)
+        self.voice_metrics = {"ticks": 0, "awarded": 0, "last_members": 0, "last_ms": 0.0, "max_ms": 0.0}
+        # Synchronisations des rôles de niveau en cours {guild_id: (LevelRoleSync, tâche)}
+        self.role_syncs = {}
+        self._role_tasks = set()  # rôles des level up vocaux, appliqués hors du passage
+        self._resume_task = None
+    
+    async def cog_load(self):
+        """Enregistre l'étape XP dans le pipeline des messages"""
+        self.bot.pipeline.register("leveling", self.process_message, ORDER_LEVELING)
+        self.flush_xp.start()
+        self.voice_xp.start()
+        self._resume_task = asyncio.create_task(self.resume_role_syncs())
+    
+    async def cog_unload(self):
+        """Retire l'étape du pipeline et écrit l'XP en attente"""
+        self.bot.pipeline.unregister("leveling")
+        self.flush_xp.cancel()
+        self.voice_xp.cancel()
+        if self._resume_task:
+            self._resume_task.cancel()
+        # Les synchronisations reprendront depuis leur dernier point de reprise
+        for _, task in self.role_syncs.values():
+            task.cancel()
+        for task in self._role_tasks:
+            task.cancel()
+        await self.xp.flush()
+    
+    @tasks.loop(seconds=Config.LEVEL_FLUSH_INTERVAL)
+    async def flush_xp(self):
+        """Écrit l'XP modifiée en une transaction et oublie les membres inactifs"""
+        try:
+            await self.xp.flush()
+        except Exception as e:
+            logger.error(f"Leveling: échec de l'écriture de l'XP: {e}")
+            return
+        self.xp.evict_idle(Config.LEVEL_CACHE_IDLE)
+    
+    def _update_board(self, rows):
+        for guild_id, user_id, xp, level, _ in rows:
+            self.board.update(guild_id, user_id, xp, level)
+    
+    @commands.Cog.listener()
+    async def on_membership_update(self, guild_id: int, user_id: int, present: bool, returning: bool):
+        """Départ : retiré du classement ; retour : son XP (restaurée) peut y revenir"""
+        if not present:
+            self.board.discard(guild_id, user_id)
+        elif returning:
+            self.board.invalidate(guild_id)
+    
+    @commands.Cog.listener()
+    async def on_members_synced(self, guild_ids: list):
+        for guild_id in guild_ids:
+            self.board.invalidate(guild_id)
+    
+    @staticmethod
+    def _voice_members(guild: discord.Guild) -> list:
+        """Membres éligibles à l'XP vocale, lus dans le cache du gateway (aucun appel REST)"""
+        user_ids = []
+        afk_channel = guild.afk_channel
+        for channel in guild.voice_channels:
+            if channel == afk_channel:
+                continue
+            eligible = [
+                member.id for member in channel.members
+                if not member.bot and not (member.voice and (member.voice.self_deaf or member.voice.deaf))
+            ]
+            # Seul (ou avec des bots) : pas d'XP
+            if len(eligible) >= Config.VOICE_XP_MIN_MEMBERS:
+                user_ids.extend(eligible)
+        return user_ids
+    
+    @tasks.loop(minutes=1)
+    async def voice_xp(self):
+        """Donne l'XP vocale de la minute à tous les serveurs, écrite en une transaction"""
+        start = time.perf_counter()
+        awarded = 0
+        role_updates = []
+        for guild in self.bot.guilds:
+            # Une erreur sur un serveur ne doit ni arrêter la boucle ni priver les autres d'XP
+            try:
+                user_ids = self._voice_members(guild)
+                if not user_ids:
+                    continue
+                config = await database.get_guild_config(guild.id)
+                if not config['leveling_enabled']:
+                    continue
+                level_ups = await self.xp.add_many(guild.id, user_ids, Config.VOICE_XP_PER_MINUTE)
+                awarded += len(user_ids)
+                for user_id, level in level_ups:
+                    logger.info(f"{user_id} a atteint le niveau {level} en vocal ({guild})")
+                    member = guild.get_member(user_id)
+                    if member:
+                        role_updates.append((member, level))
+            except Exception as e:
+                logger.error(f"Leveling: échec de l'XP vocale dans {guild}: {e}")
+        
+        if awarded:
+            try:
+                await self.xp.flush()
+            except Exception as e:
+                logger.error(f"Leveling: échec de l'écriture de l'XP vocale: {e}")
+        
+        if role_updates:
+            # La latence des appels REST ne retarde ni l'écriture ni le passage suivant
+            task = asyncio.create_task(self._apply_voice_level_roles(role_updates))
+            self._role_tasks.add(task)
+            task.add_done_callback(self._role_tasks.discard)
+        
+        elapsed = (time.perf_counter() - start) * 1000
+        metrics = self.voice_metrics
+        metrics["ticks"] += 1
+        metrics["awarded"] += awarded
+        metrics["last_members"] = awarded
+        metrics["last_ms"] = elapsed
+        metrics["max_ms"] = max(metrics["max_ms"], elapsed)
+    
+    @voice_xp.before_loop
+    async def before_voice_xp(self):
+        """Attend que le bot soit prêt (cache des salons vocaux rempli)"""
+        await self.bot.wait_until_ready()
+    
+    async def process_message(self, ctx: MessageContext):
+        """Étape du pipeline : gagne de l'XP en envoyant des messages"""
+        message = ctx.message
+        
+        # Vérifier si le leveling est activé
+        if not ctx.config['leveling_enabled']:
+            return
+        
+        # Encore en cooldown : aucun accès à la base
+        # (démarré avant l'écriture pour que deux messages rapprochés ne gagnent pas deux fois)
+        if not self.xp_cooldowns.try_acquire(message.guild.id, message.author.id):
+            return
+        
+        # Donner de l'XP
+        xp_gain = random.randint(Config.XP_MIN, Config.XP_MAX)
+        leveled_up, new_level = await self.xp.add(message.guild.id, message.author.id, xp_gain)
+        
+        # Si level up, envoyer un message
+        if leveled_up:
+            embed = discord.Embed(
+                title=f"{Emojis.LEVEL_UP} LEVEL UP!",
+                description=f"Bravo {message.author.mention} ! Tu es maintenant **niveau {new_level}** !",
+                color=Colors.SUCCESS
+            )
+            
+            await message.channel.send(embed=embed, delete_after=10)
+            logger.info(f"{message.author} a atteint le niveau {new_level}")
+            await self._update_level_roles(message.author, new_level)
+    
+    # ===== RÔLES DE NIVEAU =====
+    async def _update_level_roles(self, member: discord.Member, level: int):
+        """Ajoute/retire les rôles de niveau d'un membre (rien si le serveur n'en a pas)"""
+        mapping = await database.get_level_roles(member.guild.id)
+        if not mapping:
+            return
+        add, remove = role_changes(assignable_mapping(member.guild, mapping), level, [role.id for role in member.roles])
+        if not add and not remove:
+            return
+        try:
+            await apply_role_changes(member, add, remove, f"Niveau {level}")
+        except discord.HTTPException as e:
+            logger.warning(f"Rôles de niveau: impossible de mettre à jour {member}: {e}")
+    
+    async def _apply_voice_level_roles(self, updates: list):
+        """Rôles des level up vocaux d'un passage, quelques requêtes à la fois"""
+        semaphore = asyncio.Semaphore(Config.LEVEL_ROLE_SYNC_CONCURRENCY)
+        
+        async def update(member, level):
+            async with semaphore:
+                try:
+                    await self._update_level_roles(member, level)
+                except Exception as e:
+                    logger.error(f"Rôles de niveau: erreur pour {member}: {e}")
+        
+        await asyncio.gather(*(update(member, level) for member, level in updates))
+    
+    async def _current_levels(self, guild_id: int, user_ids: list) -> dict:
+        """Niveaux actuels {user_id: niveau} : l'XP en mémoire (pas encore écrite) prime sur la base"""
+        levels = {row['user_id']: row['level'] for row in await database.get_level_rows(guild_id, user_ids)}
+        levels.update(self.xp.cached_levels(guild_id, user_ids))
+        return levels
+    
+    def _sync_embed(self, sync: LevelRoleSync, done: bool = False) -> discord.Embed:
+        percent = sync.processed / sync.total * 100 if sync.total else 100
+        return discord.Embed(
+            title=f"{Emojis.SUCCESS if done else Emojis.LOADING} Synchronisation des rôles de niveau",
+            description=f"Membres vérifiés: **{sync.processed:,}/{sync.total:,}** ({percent:.0f}%)\n"
+                        f"Membres modifiés: **{sync.changed:,}** • échecs: {sync.failed:,}",
+            color=Colors.SUCCESS if done else Colors.INFO
+        )
+    
+    async def _start_role_sync(self, guild: discord.Guild, channel_id: int, checkpoint: dict = None) -> LevelRoleSync:
+        """Lance (ou reprend) la synchronisation d'un serveur en tâche de fond"""
+        mapping = assignable_mapping(guild, await database.get_level_roles(guild.id))
+        sync = LevelRoleSync(
+            guild, mapping, self._current_levels, channel_id,
+            concurrency=Config.LEVEL_ROLE_SYNC_CONCURRENCY,
+            checkpoint=checkpoint
+        )
+        task = asyncio.create_task(self._run_role_sync(sync))
+        self.role_syncs[guild.id] = (sync, task)
+        return sync
+    
+    async def _run_role_sync(self, sync: LevelRoleSync):
+        """Exécute la synchronisation en tenant à jour un message de progression"""
+        channel = sync.guild.get_channel(sync.channel_id) if sync.channel_id else None
+        progress = None
+        last_update = 0.0
+        
+        async def on_progress(sync):
+            nonlocal progress, last_update
+            now = time.monotonic()
+            if now - last_update < Config.LEVEL_ROLE_SYNC_PROGRESS:
+                return
+            last_update = now
+            try:
+                if progress is None:
+                    if channel:
+                        progress = await channel.send(embed=self._sync_embed(sync))
+                else:
+                    await progress.edit(embed=self._sync_embed(sync))
+            except discord.HTTPException:
+                pass  # La progression est indicative
+        
+        try:
+            await sync.run(on_progress)
+            if progress:
+                await progress.edit(embed=self._sync_embed(sync, done=True))
+            elif channel:
+                await channel.send(embed=self._sync_embed(sync, done=True))
+            logger.info(f"Rôles de niveau synchronisés dans {sync.guild}: {sync.changed} membres modifiés")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Rôles de niveau: synchronisation interrompue dans {sync.guild}: {e}")
+        finally:
+            self.role_syncs.pop(sync.guild.id, None)
+    
+    async def resume_role_syncs(self):
+        """Reprend les synchronisations interrompues par un redémarrage"""
+        await self.bot.wait_until_ready()
+        for checkpoint in await database.get_level_role_syncs():
+            guild = self.bot.get_guild(checkpoint['guild_id'])
+            if guild is None or not await database.get_level_roles(guild.id):
+                await database.delete_level_role_sync(checkpoint['guild_id'])
+                continue
+            logger.info(f"Rôles de niveau: reprise de la synchronisation de {guild} ({checkpoint['processed']} membres déjà vérifiés)")
+            await self._start_role_sync(guild, checkpoint['channel_id'], dict(checkpoint))
+    
+    @app_commands.command(name="levelrole", description="Associer un rôle à un niveau (admin)")
+    @app_commands.describe(
+        level="Le niveau à atteindre",
+        role="Le rôle attribué (vide pour retirer l'association)"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def level_role(self, interaction: discord.Interaction, level: app_commands.Range[int, 0, 1000], role: discord.Role = None):
+        """Ajoute, remplace ou retire le rôle d'un palier"""
+        if role and (role.managed or role >= interaction.guild.me.top_role):
+            return await interaction.response.send_message(
+                f"{Emojis.ERROR} Je ne peux pas attribuer {role.mention} (rôle géré ou au-dessus du mien).",
+                ephemeral=True
+            )
+        
+        await database.set_level_role(interaction.guild.id, level, role.id if role else None)
+        
+        description = (
+            f"Le rôle {role.mention} sera attribué au **niveau {level}**."
+            if role else f"Plus de rôle au **niveau {level}**."
+        )
+        embed = discord.Embed(
+            title=f"{Emojis.SUCCESS} Rôles de niveau",
+            description=description + "\nUtilisez `/levelroles sync` pour l'appliquer aux membres actuels.",
+            color=Colors.SUCCESS
+        )
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"{interaction.user} a associé le niveau {level} au rôle {role}")
+    
+    @app_commands.command(name="levelroles", description="Voir ou synchroniser les rôles de niveau (admin)")
+    @app_commands.describe(action="list : voir les paliers • sync : corriger les rôles de tous les membres")
+    @app_commands.choices(action=[
+        app_commands.Choice(name="list", value="list"),
+        app_commands.Choice(name="sync", value="sync"),
+    ])
+    @app_commands.checks.has_permissions(administrator=True)
+    async def level_roles(self, interaction: discord.Interaction, action: str = "list"):
+        """Liste les paliers ou lance la réconciliation de tous les membres"""
+        mapping = await database.get_level_roles(interaction.guild.id)
+        
+        if action == "list":
+            embed = discord.Embed(title="🏅 Rôles de niveau", color=Colors.INFO)
+            embed.description = "\n".join(
+                f"Niveau **{level}** → <@&{role_id}>" for level, role_id in mapping
+            ) or "Aucun rôle de niveau. Utilisez `/levelrole` pour en ajouter."
+            running = self.role_syncs.get(interaction.guild.id)
+            if running:
+                sync = running[0]
+                embed.add_field(name="Synchronisation en cours", value=f"{sync.processed:,}/{sync.total:,} membres vérifiés")
+            return await interaction.response.send_message(embed=embed, ephemeral=True)
+        
+        if not mapping:
+            return await interaction.response.send_message(
+                f"{Emojis.ERROR} Aucun rôle de niveau configuré.",
+                ephemeral=True
+            )
+        running = self.role_syncs.get(interaction.guild.id)
+        if running:
+            sync = running[0]
+            return await interaction.response.send_message(
+                f"{Emojis.INFO} Synchronisation déjà en cours ({sync.processed:,}/{sync.total:,} membres).",
+                ephemeral=True
+            )
+        
+        await interaction.response.defer()
+        try:
+            await self._start_role_sync(interaction.guild, interaction.channel.id)
+        except Exception as e:
+            logger.error(f"Rôles de niveau: impossible de lancer la synchronisation de {interaction.guild}: {e}")
+            return await interaction.followup.send(f"{Emojis.ERROR} Erreur: {str(e)}")
+        await interaction.followup.send(
+            f"{Emojis.LOADING} Synchronisation lancée pour **{len(interaction.guild.members):,}** membres ; "
+            f"seules les différences sont appliquées, la progression s'affichera ici."
+        )
+        logger.info(f"{interaction.user} a lancé la synchronisation des rôles de niveau de {interaction.guild}")
+    
+    # ===== RANK =====
+    @app_commands.command(name="rank", description="Voir votre niveau et XP")
+    @app_commands.describe(member="Le membre à vérifier (vous par défaut)")
+    async def rank(self, interaction: discord.Interaction, member: discord.Member = None):
+        """Affiche le niveau et l'XP d'un utilisateur"""
+        member = member or interaction.user
+        
+        data = await self.xp.get(interaction.guild.id, member.id)
+        
+        if not data:
+            return await interaction.response.send_message(
+                f"{Emojis.INFO} **{member.display_name}** n'a pas encore gagné d'XP.",
+                ephemeral=True
+            )
+        
+        level = data.level
+        xp = data.xp
+        
+        # Calculer l'XP nécessaire pour le prochain niveau
+        current_level_xp = self.levels.xp_for(level)
+        next_level_xp = self.levels.xp_for(level + 1)
+        xp_for_next = next_level_xp - current_level_xp
+        current_xp = xp - current_level_xp
+        
+        # Calculer le pourcentage
+        progress_percent = int((current_xp / xp_for_next) * 100)
+        
+        # Barre de progression
+        filled = "█" * (progress_percent // 10)
+        empty = "░" * (10 - (progress_percent // 10))
+        progress_bar = f"[{filled}{empty}] {progress_percent}%"
+        
+        embed = discord.Embed(
+            title=f"📊 Niveau de {member.display_name}",
+            color=member.color if member.color != discord.Color.default() else Colors.INFO
+        )
+        
+        embed.set_thumbnail(url=member.display_avatar.url)
+        
+        embed.add_field(
+            name="🎖️ Niveau",
+            value=f"**{level}**",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="✨ XP Total",
+            value=f"**{xp}**",
+            inline=True
+        )
+        
+        embed.add_field(
+            name="📈 Progression",
+            value=f"{current_xp}/{xp_for_next} XP\n{progress_bar}",
+            inline=False
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    # ===== LEADERBOARD =====
+    @app_commands.command(name="leaderboard", description="Voir le classement du serveur")
+    @app_commands.describe(limit="Nombre de personnes par page (max 20)")
+    async def leaderboard(self, interaction: discord.Interaction, limit: int = 10):
+        """Affiche le classement des membres les plus actifs"""
+        if limit < 1 or limit > 20:
+            return await interaction.response.send_message(
+                f"{Emojis.ERROR} Veuillez spécifier un nombre entre 1 et 20.",
+                ephemeral=True
+            )
+        
+        # Le cache est mis à jour par le flush : y écrire d'abord l'XP en attente
+        await self.xp.flush()
+        guild = interaction.guild
+        rows, next_cursor = await self.board.page(guild.id, limit)
+        
+        if not rows:
+            return await interaction.response.send_message(
+                f"{Emojis.INFO} Aucune donnée de classement disponible.",
+                ephemeral=True
+            )
+        
+        def render(rows, page):
+            embed = discord.Embed(
+                title=f"🏆 Classement de {guild.name}",
+                description=f"Membres les plus actifs • Page {page}",
+                color=Colors.INFO
+            )
+            medals = ["🥇", "🥈", "🥉"]
+            for rank, user_id, xp, level in rows:
+                member = guild.get_member(user_id)
+                medal = medals[rank-1] if rank <= 3 else f"**#{rank}**"
+                embed.add_field(
+                    name=f"{medal} {member.display_name if member else user_id}",
+                    value=f"Niveau {level} • {xp} XP",
+                    inline=False
+                )
+            return embed
+        
+        view = LeaderboardView(self.board, guild, interaction.user.id, limit, render, next_cursor)
+        await interaction.response.send_message(embed=render(rows, 1), view=view)
+    
+    # ===== SETLEVEL (ADMIN) =====
+    @app_commands.command(name="setlevel", description="Définir le niveau d'un membre (admin)")
+    @app_commands.describe(
+        member="Le membre",
+        level="Le nouveau niveau"
+    )
+    @app_commands.checks.has_permissions(administrator=True)
+    async def setlevel(self, interaction: discord.Interaction, member: discord.Member, level: int):
+        """Définit manuellement le niveau d'un membre"""
+        if level < 0:
+            return await interaction.response.send_message(
+                f"{Emojis.ERROR} Le niveau doit être positif.",
+                ephemeral=True
+            )
+        
+        self.xp.set(interaction.guild.id, member.id, self.levels.xp_for(level))
+        try:
+            await self.xp.flush()
+        except Exception as e:
+            # L'entrée reste en mémoire : elle sera écrite au prochain flush
+            logger.error(f"Erreur dans setlevel: {e}")
+            return await interaction.response.send_message(
+                f"{Emojis.ERROR} Erreur lors de l'enregistrement: {str(e)}",
+                ephemeral=True
+            )
+        await self._update_level_roles(member, level)
+        
+        embed = discord.Embed(
+            title=f"{Emojis.SUCCESS} Niveau modifié",
+            description=f"{member.mention} est maintenant **niveau {level}**.",
+            color=Colors.SUCCESS
+        )
+        
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"{interaction.user} a défini le niveau de {member} à {level}")
+    
+    # ===== RECALCUL / IMPORT (ADMIN) =====
+    @app_commands.command(name="recomputelevels", description="Recalculer les niveaux du serveur après un changement de formule (admin)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def recompute(self, interaction: discord.Interaction):
+        """Recalcule les niveaux stockés à partir de l'XP"""
+        await interaction.response.defer()
+        
+        try:
+            async with self.xp.exclusive(interaction.guild.id):
+                scanned, changed = await recompute_levels(self.levels, interaction.guild.id)
+        except Exception as e:
+            logger.error(f"Erreur dans recomputelevels: {e}")
+            return await interaction.followup.send(f"{Emojis.ERROR} Erreur: {str(e)}")
+        finally:
+            self.board.invalidate(interaction.guild.id)
+        
+        embed = discord.Embed(
+            title=f"{Emojis.SUCCESS} Niveaux recalculés",
+            description=f"**{changed:,}** niveau(x) corrigé(s) sur {scanned:,} membres.",
+            color=Colors.SUCCESS
+        )
+        await interaction.followup.send(embed=embed)
+        logger.info(f"{interaction.user} a recalculé les niveaux de {interaction.guild} ({changed}/{scanned})")
+    
+    @app_commands.command(name="importxp", description="Importer l'XP depuis un autre bot, fichier CSV ou JSON (admin)")
+    @app_commands.describe(file="Export CSV (colonnes user_id, xp) ou JSON")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def import_levels(self, interaction: discord.Interaction, file: discord.Attachment):
+        """Remplace l'XP des membres présents dans le fichier"""
+        await interaction.response.defer()
+        
+        try:
+            data = await file.read()
+            # Analyse hors de la boucle : les exports peuvent compter des centaines de milliers de lignes
+            pairs = await asyncio.to_thread(parse_xp_import, data)
+        except (ValueError, UnicodeDecodeError) as e:
+            return await interaction.followup.send(f"{Emojis.ERROR} Fichier illisible: {e}")
+        
+        try:
+            async with self.xp.exclusive(interaction.guild.id):
+                count = await import_xp(self.levels, interaction.guild.id, pairs)
+        except Exception as e:
+            logger.error(f"Erreur dans importxp: {e}")
+            return await interaction.followup.send(f"{Emojis.ERROR} Erreur: {str(e)}")
+        finally:
+            # Une partie de l'import a pu être écrite avant l'erreur
+            self.board.invalidate(interaction.guild.id)
+        
+        embed = discord.Embed(
+            title=f"{Emojis.SUCCESS} XP importée",
+            description=f"XP et niveau de **{count:,}** membres mis à jour depuis `{file.filename}`.",
+            color=Colors.SUCCESS
+        )
+        await interaction.followup.send(embed=embed)
+        logger.info(f"{interaction.user} a importé l'XP de {count} membres dans {interaction.guild}")
+    
+    # ===== TOGGLE LEVELING =====
+    @app_commands.command(name="leveling", description="Activer/désactiver le système de niveaux")
+    @app_commands.describe(enabled="Activer (True) ou désactiver (False)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def leveling_toggle(self, interaction: discord.Interaction, enabled: bool):
+        """Active ou désactive le système de niveaux"""
+        await database.update_guild_config(interaction.guild.id, leveling_enabled=enabled)
+        
+        status = "activé" if enabled else "désactivé"
+        emoji = Emojis.SUCCESS if enabled else Emojis.ERROR
+        
+        embed = discord.Embed(
+            title=f"{emoji} Système de Niveaux",
+            description=f"Le système de niveaux a été **{status}**.",
+            color=Colors.SUCCESS if enabled else Colors.WARNING
+        )
+        
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"{interaction.user} a {status} le système de niveaux")
+
+async def setup(bot):
+    await bot.add_cog(Leveling(bot))
@@ -0,0 +1,114 @@
+"""
+Cog de Présence des membres - Arrivées et départs suivis en base, archivage des anciens membres
+"""
+
+import discord
+from discord.ext import commands, tasks
+import database
+from config import Config
+import logging
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+class Members(commands.Cog):
+    """Tient la table guild_members à jour pour que classements et statistiques ignorent les membres partis"""
+    
+    def __init__(self, bot):
+        self.bot = bot
+        self.metrics = {"synced_guilds": 0, "skipped_guilds": 0, "joins": 0, "leaves": 0, "departed_offline": 0, "archived": 0}
+    
+    async def cog_load(self):
+        if Config.MEMBER_ARCHIVE_DAYS:
+            self.archive_members.start()
+    
+    async def cog_unload(self):
+        self.archive_members.cancel()
+    
+    async def sync_guilds(self, guilds):
+        """
+        Aligne la présence sur le cache du gateway (arrivées et départs pendant que le bot
+        était hors ligne) puis prévient les cogs : on_members_synced(guild_ids)
+        """
+        synced = []
+        departed = 0
+        for guild in guilds:
+            # Liste incomplète : tous les absents seraient marqués partis à tort
+            if not guild.chunked:
+                self.metrics["skipped_guilds"] += 1
+                logger.warning(f"Présence: membres de {guild} non chargés, synchronisation ignorée")
+                continue
+            try:
+                departed += await self._sync_guild(guild)
+            except Exception as e:
+                logger.error(f"Présence: échec de la synchronisation de {guild}: {e}")
+                continue
+            synced.append(guild.id)
+        
+        self.metrics["synced_guilds"] += len(synced)
+        self.metrics["departed_offline"] += departed
+        if synced:
+            self.bot.dispatch("members_synced", synced)
+            logger.info(f"Présence: {len(synced)} serveur(s) synchronisé(s), {departed} départ(s) constaté(s)")
+    
+    async def _sync_guild(self, guild: discord.Guild) -> int:
+        """
+        Synchronise un serveur ; l'XP en mémoire est écrite et relue autour de l'opération,
+        sinon un flush écraserait l'XP archivée fusionnée à la restauration
+        """
+        leveling = self.bot.get_cog("Leveling")
+        if leveling is None:
+            return await database.sync_guild_members(guild.id, [member.id for member in guild.members])
+        async with leveling.xp.exclusive(guild.id):
+            return await database.sync_guild_members(guild.id, [member.id for member in guild.members])
+    
+    @commands.Cog.listener()
+    async def on_ready(self):
+        await self.sync_guilds(self.bot.guilds)
+    
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        await self.sync_guilds([guild])
+    
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        """Membre arrivé ou revenu : de nouveau classé, données archivées restaurées"""
+        try:
+            returning = await database.mark_member_joined(member.guild.id, member.id)
+        except Exception as e:
+            logger.error(f"Présence: erreur à l'arrivée de {member}: {e}")
+            return
+        self.metrics["joins"] += 1
+        self.bot.dispatch("membership_update", member.guild.id, member.id, True, returning)
+    
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        """Membre parti : retiré des classements (ses données restent en base)"""
+        try:
+            await database.mark_member_left(member.guild.id, member.id)
+        except Exception as e:
+            logger.error(f"Présence: erreur au départ de {member}: {e}")
+            return
+        self.metrics["leaves"] += 1
+        self.bot.dispatch("membership_update", member.guild.id, member.id, False, False)
+    
+    @tasks.loop(hours=24)
+    async def archive_members(self):
+        """Déplace l'XP et les statistiques des membres partis depuis longtemps vers les tables d'archive"""
+        before = datetime.now() - timedelta(days=Config.MEMBER_ARCHIVE_DAYS)
+        try:
+            count = await database.archive_departed_members(before)
+        except Exception as e:
+            logger.error(f"Présence: erreur lors de l'archivage: {e}")
+            return
+        self.metrics["archived"] += count
+        if count:
+            logger.info(f"Présence: {count} ancien(s) membre(s) archivé(s)")
+    
+    @archive_members.before_loop
+    async def before_archive_members(self):
+        """Attend que le bot soit prêt avant de démarrer"""
+        await self.bot.wait_until_ready()
+
+async def setup(bot):
+    await bot.add_cog(Members(bot))
@@ -0,0 +1,139 @@
+"""
+Cog de Logs de messages - Messages supprimés et modifiés, envoyés dans le canal de logs
+"""
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+import database
+from config import Config, Colors, Emojis
+from message_cache import MessageCache
+from pipeline import MessageContext, ORDER_MESSAGE_CACHE
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Longueur max d'un contenu cité dans un champ d'embed
+FIELD_LIMIT = 1024
+
+def _quote(content: str, limit: int = FIELD_LIMIT) -> str:
+    if not content:
+        return "*(vide)*"
+    return content if len(content) <= limit else content[:limit - 1] + "…"
+
+class MessageLogs(commands.Cog):
+    """Journalise les suppressions et modifications de messages"""
+
+    def __init__(self, bot):
+        self.bot = bot
+        # Instantanés des messages récents, indépendants du cache de discord.py
+        self.cache = MessageCache(Config.MESSAGE_CACHE_MAX_BYTES, Config.MESSAGE_CACHE_GUILD_BYTES)
+
+    async def cog_load(self):
+        """S'enregistre dans le pipeline des messages"""
+        self.bot.pipeline.register("message_cache", self.process_message, ORDER_MESSAGE_CACHE)
+
+    async def cog_unload(self):
+        self.bot.pipeline.unregister("message_cache")
+
+    async def process_message(self, ctx: MessageContext):
+        """Étape du pipeline : garde un instantané du message (après l'auto-mod)"""
+        kb = ctx.config.get('message_cache_kb')
+        self.cache.add(ctx.message, kb * 1024 if kb is not None else None)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """Message supprimé : retrouvé dans le cache même s'il n'est plus dans celui de discord.py"""
+        if payload.guild_id is None:
+            return
+        record = self.cache.pop(payload.guild_id, payload.message_id)
+        if record is None:
+            return
+
+        embed = discord.Embed(
+            title="🗑️ Message supprimé",
+            description=f"Auteur: <@{record.author_id}> ({record.author_name})\n"
+                        f"Salon: <#{record.channel_id}>",
+            color=Colors.ERROR,
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="Contenu", value=_quote(record.content), inline=False)
+        if record.attachments:
+            embed.add_field(name="Pièces jointes", value=_quote("\n".join(record.attachments)), inline=False)
+        embed.set_footer(text=f"ID: {record.id}")
+        await database.send_mod_log(self.bot, payload.guild_id, embed)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        """Suppression groupée : un seul log avec les messages connus"""
+        if payload.guild_id is None:
+            return
+        records = self.cache.pop_many(payload.guild_id, payload.message_ids)
+        if not records:
+            return
+
+        lines = [f"<@{record.author_id}>: {record.content or '*(pièce jointe)*'}" for record in records]
+        embed = discord.Embed(
+            title="🗑️ Suppression groupée",
+            description=f"Salon: <#{payload.channel_id}>\n"
+                        f"Messages supprimés: **{len(payload.message_ids)}** "
+                        f"(dont {len(records)} en cache)\n\n"
+                        + _quote("\n".join(lines), 3500),
+            color=Colors.ERROR,
+            timestamp=discord.utils.utcnow()
+        )
+        await database.send_mod_log(self.bot, payload.guild_id, embed)
+
+    @commands.Cog.listener()
+    async def on_raw_message_edit(self, payload: discord.RawMessageUpdateEvent):
+        """Message modifié : ancien contenu tiré du cache, nouveau contenu de l'événement"""
+        if payload.guild_id is None or "content" not in payload.data:
+            return  # Ignorer les mises à jour sans texte (aperçus de liens, épingles...)
+        content = payload.data["content"]
+        record, old_content = self.cache.update(payload.guild_id, payload.message_id, content)
+        if record is None or old_content == content:
+            return
+
+        embed = discord.Embed(
+            title="✏️ Message modifié",
+            description=f"Auteur: <@{record.author_id}> ({record.author_name})\n"
+                        f"Salon: <#{payload.channel_id}> • "
+                        f"[Aller au message](https://discord.com/channels/{payload.guild_id}/{payload.channel_id}/{payload.message_id})",
+            color=Colors.WARNING,
+            timestamp=discord.utils.utcnow()
+        )
+        embed.add_field(name="Avant", value=_quote(old_content), inline=False)
+        embed.add_field(name="Après", value=_quote(content), inline=False)
+        embed.set_footer(text=f"ID: {payload.message_id}")
+        await database.send_mod_log(self.bot, payload.guild_id, embed)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.cache.drop_guild(guild.id)
+
+    @app_commands.command(name="messagecache", description="Mémoire réservée aux logs de messages supprimés/modifiés")
+    @app_commands.describe(kilobytes="Plafond en Ko (0 = désactivé, vide = valeur par défaut)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def message_cache(self, interaction: discord.Interaction, kilobytes: app_commands.Range[int, 0, 65536] = None):
+        """Configure le plafond du cache de messages du serveur"""
+        await database.update_guild_config(interaction.guild.id, message_cache_kb=kilobytes)
+        if kilobytes == 0:
+            self.cache.drop_guild(interaction.guild.id)
+
+        if kilobytes is None:
+            description = f"Plafond par défaut : **{Config.MESSAGE_CACHE_GUILD_BYTES // 1024:,} Ko**."
+        elif kilobytes == 0:
+            description = "Les logs de messages supprimés/modifiés sont **désactivés**."
+        else:
+            description = f"Plafond du cache : **{kilobytes:,} Ko**."
+
+        embed = discord.Embed(
+            title=f"{Emojis.SUCCESS} Logs de messages",
+            description=description,
+            color=Colors.SUCCESS
+        )
+        await interaction.response.send_message(embed=embed)
+        logger.info(f"{interaction.user} a réglé le cache de messages à {kilobytes} Ko")
+
+async def setup(bot):
+    await bot.add_cog(MessageLogs(bot))
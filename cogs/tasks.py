@@ -1,110 +1,148 @@
-"""
-Cog de Tâches en Arrière-Plan
-Gère les actions automatiques : unban temporaire, backup, etc.
-"""
-
-import discord
-from discord.ext import commands, tasks
-import database
-import logging
-from datetime import datetime
-from pathlib import Path
-import shutil
-
-logger = logging.getLogger(__name__)
-
-class Tasks(commands.Cog):
-    """Tâches automatisées en arrière-plan"""
-    
-    def __init__(self, bot):
-        self.bot = bot
-        self.check_temp_actions.start()
-        self.backup_database.start()
-    
-    def cog_unload(self):
-        """Arrête les tâches lors du déchargement"""
-        self.check_temp_actions.cancel()
-        self.backup_database.cancel()
-    
-    @tasks.loop(minutes=1)
-    async def check_temp_actions(self):
-        """Vérifie et exécute les actions temporaires expirées"""
-        try:
-            expired_actions = await database.get_expired_actions()
-            
-            for action in expired_actions:
-                guild = self.bot.get_guild(action['guild_id'])
-                if not guild:
-                    await database.remove_temp_action(action['id'])
-                    continue
-                
-                if action['action_type'] == 'TEMPBAN':
-                    try:
-                        # Débannir l'utilisateur
-                        user = await self.bot.fetch_user(action['user_id'])
-                        await guild.unban(user, reason="Tempban expiré")
-                        
-                        # Log
-                        await database.add_mod_log(
-                            guild.id,
-                            "AUTO_UNBAN",
-                            self.bot.user.id,
-                            user.id,
-                            "Tempban expiré"
-                        )
-                        
-                        logger.info(f"Auto-unban: {user} dans {guild.name}")
-                        
-                    except discord.NotFound:
-                        logger.warning(f"Utilisateur {action['user_id']} non trouvé pour unban")
-                    except discord.Forbidden:
-                        logger.error(f"Pas la permission de unban dans {guild.name}")
-                    except Exception as e:
-                        logger.error(f"Erreur lors du auto-unban: {e}")
-                
-                # Supprimer l'action de la base de données
-                await database.remove_temp_action(action['id'])
-                
-        except Exception as e:
-            logger.error(f"Erreur lors de la vérification des actions temporaires: {e}")
-    
-    @check_temp_actions.before_loop
-    async def before_check_temp_actions(self):
-        """Attend que le bot soit prêt avant de démarrer"""
-        await self.bot.wait_until_ready()
-        logger.info("✅ Tâche check_temp_actions démarrée")
-    
-    @tasks.loop(hours=24)
-    async def backup_database(self):
-        """Crée une sauvegarde quotidienne de la base de données"""
-        try:
-            db_path = Path(__file__).parent.parent / "data" / "bot.db"
-            backup_dir = Path(__file__).parent.parent / "backups"
-            backup_dir.mkdir(exist_ok=True)
-            
-            # Nom du fichier de backup avec date
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = backup_dir / f"bot_backup_{timestamp}.db"
-            
-            # Copier la base de données
-            shutil.copy2(db_path, backup_path)
-            
-            # Garder seulement les 7 derniers backups
-            backups = sorted(backup_dir.glob("bot_backup_*.db"), key=lambda p: p.stat().st_mtime, reverse=True)
-            for old_backup in backups[7:]:
-                old_backup.unlink()
-                logger.info(f"Ancien backup supprimé: {old_backup.name}")
-            
-            logger.info(f"✅ Backup créé: {backup_path.name}")
-            
-        except Exception as e:
-            logger.error(f"Erreur lors du backup de la base de données: {e}")
-    
-    @backup_database.before_loop
-    async def before_backup_database(self):
-        """Attend que le bot soit prêt avant de démarrer"""
-        await self.bot.wait_until_ready()
-        logger.info("✅ Tâche backup_database démarrée")
-
-async def setup(bot):
-    await bot.add_cog(Tasks(bot))
+"""
+Cog de Tâches en Arrière-Plan
+Gère les actions automatiques : unban temporaire, backup, etc.
+"""
+
+import discord
+from discord.ext import commands, tasks
+import database
+from scheduler import ActionScheduler
+import asyncio
+import logging
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+class Tasks(commands.Cog):
+    """Tâches automatisées en arrière-plan"""
+    
+    def __init__(self, bot):
+        self.bot = bot
+        # Actions temporaires : exécutées à leur échéance exacte
+        self.scheduler = ActionScheduler(self.execute_temp_action)
+        self._scheduler_start = None
+        self.backup_database.start()
+        self.sync_guild_configs.start()
+    
+    async def cog_load(self):
+        """Charge les actions temporaires en attente une fois le bot prêt"""
+        self._scheduler_start = asyncio.create_task(self.start_scheduler())
+    
+    def cog_unload(self):
+        """Arrête les tâches lors du déchargement"""
+        if self._scheduler_start:
+            self._scheduler_start.cancel()
+        self.scheduler.stop()
+        self.backup_database.cancel()
+        self.sync_guild_configs.cancel()
+    
+    async def start_scheduler(self):
+        """Recharge les actions persistées puis démarre le planificateur"""
+        await self.bot.wait_until_ready()
+        try:
+            for action in await database.get_pending_actions():
+                await self.schedule_temp_action(dict(action))
+        except Exception as e:
+            logger.error(f"Erreur lors du chargement des actions temporaires: {e}")
+        self.scheduler.start()
+        logger.info(f"✅ Planificateur démarré ({len(self.scheduler)} action(s) en attente)")
+    
+    async def schedule_temp_action(self, action: dict):
+        """Planifie une action déjà enregistrée en base"""
+        replaced = self.scheduler.schedule(action)
+        if replaced is not None:
+            # Une seule action par membre et par type : l'ancienne n'a plus lieu d'être
+            await database.remove_temp_action(replaced)
+    
+    async def cancel_temp_action(self, guild_id: int, user_id: int, action_type: str):
+        """Annule l'action temporaire d'un membre (unban ou unmute manuel)"""
+        action_id = self.scheduler.cancel_for(guild_id, user_id, action_type)
+        if action_id is not None:
+            await database.remove_temp_action(action_id)
+            logger.info(f"Action {action_type} annulée pour {user_id} (serveur {guild_id})")
+    
+    @commands.Cog.listener()
+    async def on_member_unban(self, guild: discord.Guild, user: discord.User):
+        """Un unban manuel (commande ou Discord) annule le tempban en attente"""
+        await self.cancel_temp_action(guild.id, user.id, "TEMPBAN")
+    
+    async def execute_temp_action(self, action: dict):
+        """Exécute une action temporaire arrivée à échéance"""
+        guild = self.bot.get_guild(action['guild_id'])
+        
+        if guild and action['action_type'] == 'TEMPBAN':
+            try:
+                # Débannir l'utilisateur (pas besoin de récupérer le profil)
+                user = discord.Object(id=action['user_id'])
+                await guild.unban(user, reason="Tempban expiré")
+                
+                # Log
+                await database.add_mod_log(
+                    guild.id,
+                    "AUTO_UNBAN",
+                    self.bot.user.id,
+                    user.id,
+                    "Tempban expiré"
+                )
+                
+                logger.info(f"Auto-unban: {user.id} dans {guild.name}")
+                
+            except discord.NotFound:
+                logger.warning(f"Utilisateur {action['user_id']} non trouvé pour unban")
+            except discord.Forbidden:
+                logger.error(f"Pas la permission de unban dans {guild.name}")
+            except Exception as e:
+                logger.error(f"Erreur lors du auto-unban: {e}")
+        
+        # Supprimer l'action de la base de données (Discord lève lui-même les mutes)
+        await database.remove_temp_action(action['id'])
+    
+    @tasks.loop(seconds=30)
+    async def sync_guild_configs(self):
+        """Recharge les configurations modifiées depuis le dashboard"""
+        try:
+            count = await database.apply_config_invalidations()
+            if count:
+                logger.info(f"{count} configuration(s) de serveur rechargée(s)")
+        except Exception as e:
+            logger.error(f"Erreur lors de la synchronisation des configurations: {e}")
+    
+    @sync_guild_configs.before_loop
+    async def before_sync_guild_configs(self):
+        """Attend que le bot soit prêt avant de démarrer"""
+        await self.bot.wait_until_ready()
+    
+    @tasks.loop(hours=24)
+    async def backup_database(self):
+        """Crée une sauvegarde quotidienne de la base de données"""
+        try:
+            backup_dir = Path(__file__).parent.parent / "backups"
+            backup_dir.mkdir(exist_ok=True)
+            
+            # Nom du fichier de backup avec date
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_path = backup_dir / f"bot_backup_{timestamp}.db"
+            
+            # Copier la base de données (les pages encore dans le WAL sont incluses)
+            await database.backup_database(backup_path)
+            
+            # Garder seulement les 7 derniers backups
+            backups = sorted(backup_dir.glob("bot_backup_*.db"), key=lambda p: p.stat().st_mtime, reverse=True)
+            for old_backup in backups[7:]:
+                old_backup.unlink()
+                logger.info(f"Ancien backup supprimé: {old_backup.name}")
+            
+            logger.info(f"✅ Backup créé: {backup_path.name}")
+            
+        except Exception as e:
+            logger.error(f"Erreur lors du backup de la base de données: {e}")
+    
+    @backup_database.before_loop
+    async def before_backup_database(self):
+        """Attend que le bot soit prêt avant de démarrer"""
+        await self.bot.wait_until_ready()
+        logger.info("✅ Tâche backup_database démarrée")
+
+async def setup(bot):
+    await bot.add_cog(Tasks(bot))
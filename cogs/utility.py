@@ -1,311 +1,529 @@
-"""
-Cog Utilitaires - Commandes d'information et outils pratiques
-"""
-
-import discord
-from discord import app_commands
-from discord.ext import commands
-from config import Colors, Emojis
-from datetime import datetime
-import logging
-
-logger = logging.getLogger(__name__)
-
-class Utility(commands.Cog):
-    """Commandes utilitaires et d'information"""
-    
-    def __init__(self, bot):
-        self.bot = bot
-    
-    # ===== PING =====
-    @app_commands.command(name="ping", description="Vérifier la latence du bot")
-    async def ping(self, interaction: discord.Interaction):
-        """Affiche la latence du bot"""
-        latency = round(self.bot.latency * 1000)
-        
-        embed = discord.Embed(
-            title="🏓 Pong!",
-            description=f"Latence: **{latency}ms**",
-            color=Colors.SUCCESS if latency < 200 else Colors.WARNING
-        )
-        
-        await interaction.response.send_message(embed=embed)
-    
-    # ===== SERVERINFO =====
-    @app_commands.command(name="serverinfo", description="Informations sur le serveur")
-    async def serverinfo(self, interaction: discord.Interaction):
-        """Affiche les informations du serveur"""
-        guild = interaction.guild
-        
-        # Statistiques des membres
-        total_members = guild.member_count
-        humans = len([m for m in guild.members if not m.bot])
-        bots = total_members - humans
-        
-        # Statistiques des salons
-        text_channels = len(guild.text_channels)
-        voice_channels = len(guild.voice_channels)
-        categories = len(guild.categories)
-        
-        # Autres stats
-        roles = len(guild.roles)
-        emojis = len(guild.emojis)
-        
-        embed = discord.Embed(
-            title=f"📊 Informations sur {guild.name}",
-            color=Colors.INFO,
-            timestamp=datetime.now()
-        )
-        
-        if guild.icon:
-            embed.set_thumbnail(url=guild.icon.url)
-        
-        # Propriétaire
-        embed.add_field(
-            name="👑 Propriétaire",
-            value=guild.owner.mention if guild.owner else "Inconnu",
-            inline=True
-        )
-        
-        # Date de création
-        created_at = guild.created_at.strftime("%d/%m/%Y")
-        embed.add_field(
-            name="📅 Créé le",
-            value=created_at,
-            inline=True
-        )
-        
-        # Membres
-        embed.add_field(
-            name=f"👥 Membres ({total_members})",
-            value=f"👤 Humains: {humans}\n🤖 Bots: {bots}",
-            inline=True
-        )
-        
-        # Salons
-        embed.add_field(
-            name=f"💬 Salons ({text_channels + voice_channels})",
-            value=f"📝 Texte: {text_channels}\n🔊 Vocal: {voice_channels}\n📁 Catégories: {categories}",
-            inline=True
-        )
-        
-        # Autres
-        embed.add_field(
-            name="🎭 Rôles",
-            value=str(roles),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="😀 Emojis",
-            value=str(emojis),
-            inline=True
-        )
-        
-        # Boost
-        if guild.premium_subscription_count:
-            embed.add_field(
-                name=f"✨ Niveau de boost {guild.premium_tier}",
-                value=f"{guild.premium_subscription_count} boost(s)",
-                inline=True
-            )
-        
-        embed.set_footer(text=f"ID: {guild.id}")
-        
-        await interaction.response.send_message(embed=embed)
-    
-    # ===== USERINFO =====
-    @app_commands.command(name="userinfo", description="Informations sur un utilisateur")
-    @app_commands.describe(member="Le membre à examiner (vous par défaut)")
-    async def userinfo(self, interaction: discord.Interaction, member: discord.Member = None):
-        """Affiche les informations d'un utilisateur"""
-        member = member or interaction.user
-        
-        embed = discord.Embed(
-            title=f"👤 Informations sur {member.display_name}",
-            color=member.color if member.color != discord.Color.default() else Colors.INFO,
-            timestamp=datetime.now()
-        )
-        
-        embed.set_thumbnail(url=member.display_avatar.url)
-        
-        # Nom et discriminateur
-        embed.add_field(
-            name="🏷️ Nom complet",
-            value=str(member),
-            inline=True
-        )
-        
-        # Surnom
-        if member.nick:
-            embed.add_field(
-                name="✏️ Surnom",
-                value=member.nick,
-                inline=True
-            )
-        
-        # Création du compte
-        created = member.created_at.strftime("%d/%m/%Y à %H:%M")
-        embed.add_field(
-            name="📅 Compte créé le",
-            value=created,
-            inline=False
-        )
-        
-        # Arrivée sur le serveur
-        joined = member.joined_at.strftime("%d/%m/%Y à %H:%M")
-        embed.add_field(
-            name="📆 A rejoint le",
-            value=joined,
-            inline=False
-        )
-        
-        # Rôles (max 10)
-        roles = [role.mention for role in member.roles[1:]][:10]  # Exclure @everyone
-        if roles:
-            embed.add_field(
-                name=f"🎭 Rôles ({len(member.roles) - 1})",
-                value=" ".join(roles) if roles else "Aucun",
-                inline=False
-            )
-        
-        # Badges
-        badges = []
-        if member.premium_since:
-            badges.append("✨ Booster")
-        if member.guild_permissions.administrator:
-            badges.append("👑 Administrateur")
-        if member.bot:
-            badges.append("🤖 Bot")
-        
-        if badges:
-            embed.add_field(
-                name="🏅 Badges",
-                value=" • ".join(badges),
-                inline=False
-            )
-        
-        embed.set_footer(text=f"ID: {member.id}")
-        
-        await interaction.response.send_message(embed=embed)
-    
-    # ===== AVATAR =====
-    @app_commands.command(name="avatar", description="Afficher l'avatar d'un utilisateur")
-    @app_commands.describe(member="Le membre (vous par défaut)")
-    async def avatar(self, interaction: discord.Interaction, member: discord.Member = None):
-        """Affiche l'avatar d'un utilisateur"""
-        member = member or interaction.user
-        
-        embed = discord.Embed(
-            title=f"Avatar de {member.display_name}",
-            color=member.color if member.color != discord.Color.default() else Colors.INFO
-        )
-        
-        embed.set_image(url=member.display_avatar.url)
-        embed.add_field(
-            name="🔗 Lien",
-            value=f"[Cliquez ici]({member.display_avatar.url})",
-            inline=False
-        )
-        
-        await interaction.response.send_message(embed=embed)
-    
-    # ===== POLL =====
-    @app_commands.command(name="poll", description="Créer un sondage")
-    @app_commands.describe(
-        question="La question du sondage",
-        option1="Option 1",
-        option2="Option 2",
-        option3="Option 3 (optionnel)",
-        option4="Option 4 (optionnel)",
-        option5="Option 5 (optionnel)"
-    )
-    async def poll(
-        self,
-        interaction: discord.Interaction,
-        question: str,
-        option1: str,
-        option2: str,
-        option3: str = None,
-        option4: str = None,
-        option5: str = None
-    ):
-        """Crée un sondage avec réactions"""
-        options = [option1, option2]
-        if option3:
-            options.append(option3)
-        if option4:
-            options.append(option4)
-        if option5:
-            options.append(option5)
-        
-        # Emojis de réaction
-        emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣"]
-        
-        # Créer l'embed
-        embed = discord.Embed(
-            title=f"{Emojis.POLL} {question}",
-            color=Colors.INFO,
-            timestamp=datetime.now()
-        )
-        
-        description = ""
-        for i, option in enumerate(options):
-            description += f"\n{emojis[i]} {option}"
-        
-        embed.description = description
-        embed.set_footer(text=f"Sondage créé par {interaction.user.display_name}")
-        
-        await interaction.response.send_message(embed=embed)
-        message = await interaction.original_response()
-        
-        # Ajouter les réactions
-        for i in range(len(options)):
-            await message.add_reaction(emojis[i])
-        
-        logger.info(f"{interaction.user} a créé un sondage: {question}")
-    
-    # ===== EMBED CREATOR =====
-    @app_commands.command(name="embed", description="Créer un embed personnalisé")
-    @app_commands.describe(
-        title="Titre de l'embed",
-        description="Description de l'embed",
-        color="Couleur (hex sans #, ex: FF0000 pour rouge)"
-    )
-    @app_commands.checks.has_permissions(manage_messages=True)
-    async def create_embed(
-        self,
-        interaction: discord.Interaction,
-        title: str,
-        description: str,
-        color: str = None
-    ):
-        """Crée un embed personnalisé"""
-        try:
-            # Parser la couleur
-            if color:
-                color_value = int(color, 16)
-                embed_color = discord.Color(color_value)
-            else:
-                embed_color = Colors.DEFAULT
-            
-            embed = discord.Embed(
-                title=title,
-                description=description,
-                color=embed_color,
-                timestamp=datetime.now()
-            )
-            
-            embed.set_footer(text=f"Créé par {interaction.user.display_name}")
-            
-            await interaction.response.send_message(embed=embed)
-            logger.info(f"{interaction.user} a créé un embed: {title}")
-            
-        except ValueError:
-            await interaction.response.send_message(
-                f"{Emojis.ERROR} Couleur invalide. Utilisez le format hexadécimal (ex: FF0000).",
-                ephemeral=True
-            )
-
-async def setup(bot):
-    await bot.add_cog(Utility(bot))
+"""
+Cog Utilitaires - Commandes d'information et outils pratiques
+"""
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from config import Colors, Emojis
+from datetime import datetime
+import database
+import logging
+
+logger = logging.getLogger(__name__)
+
+class Utility(commands.Cog):
+    """Commandes utilitaires et d'information"""
+    
+    def __init__(self, bot):
+        self.bot = bot
+    
+    # ===== PING =====
+    @app_commands.command(name="ping", description="Vérifier la latence du bot")
+    async def ping(self, interaction: discord.Interaction):
+        """Affiche la latence du bot"""
+        latency = round(self.bot.latency * 1000)
+        
+        embed = discord.Embed(
+            title="🏓 Pong!",
+            description=f"Latence: **{latency}ms**",
+            color=Colors.SUCCESS if latency < 200 else Colors.WARNING
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    # ===== METRICS =====
+    @app_commands.command(name="metrics", description="Métriques internes du bot (admin)")
+    @app_commands.checks.has_permissions(administrator=True)
+    async def metrics(self, interaction: discord.Interaction):
+        """Affiche les compteurs de performance internes"""
+        embed = discord.Embed(
+            title="📈 Métriques internes",
+            color=Colors.INFO,
+            timestamp=discord.utils.utcnow()
+        )
+        
+        # Pool de connexions SQLite
+        pool_stats = database.pool.stats()
+        db_value = f"Lecteurs libres: **{pool_stats['readers_idle']}**\n"
+        for kind, label in (("read", "Lectures"), ("write", "Écritures")):
+            s = pool_stats[kind]
+            db_value += (
+                f"{label}: **{s['count']:,}** • attente {s['wait_avg_ms']:.2f}ms "
+                f"(max {s['wait_max_ms']:.1f}) • durée {s['time_avg_ms']:.2f}ms "
+                f"(max {s['time_max_ms']:.1f})\n"
+            )
+        embed.add_field(name="🗄️ Base de données", value=db_value, inline=False)
+        
+        # Cache des configurations de serveur
+        s = database.guild_configs.stats()
+        embed.add_field(
+            name="⚙️ Cache de configuration",
+            value=(
+                f"Serveurs: **{s['size']}** • succès {s['hits']:,} • échecs {s['misses']:,} "
+                f"({s['hit_rate']:.1%}) • invalidations {s['invalidations']}"
+            ),
+            inline=False
+        )
+        
+        # File d'ingestion des messages
+        analytics = self.bot.get_cog("Analytics")
+        if analytics:
+            s = analytics.ingestor.stats()
+            embed.add_field(
+                name="📥 Ingestion des messages",
+                value=(
+                    f"File: **{s['depth']}** (max {s['max_depth']}) • attentes {s['backpressure']}\n"
+                    f"Écrits: **{s['flushed']:,}** en {s['flushes']:,} lots • échecs {s['failed']}\n"
+                    f"Flush: {s['last_flush_ms']:.1f}ms (moy {s['avg_flush_ms']:.1f}, max {s['max_flush_ms']:.1f})"
+                ),
+                inline=False
+            )
+            
+            s = analytics.ranks.stats()
+            embed.add_field(
+                name="🏅 Index des rangs (7j)",
+                value=(
+                    f"{'Prêt' if s['ready'] else 'En construction'} • "
+                    f"{s['indexes']} index • **{s['entries']:,}** entrées"
+                ),
+                inline=False
+            )
+        
+        # Anti-spam
+        automod = self.bot.get_cog("AutoMod")
+        if automod:
+            s = automod.spam_tracker.stats()
+            embed.add_field(
+                name="🛡️ Anti-spam",
+                value=f"Utilisateurs suivis: **{s['users']:,}** • messages {s['messages']:,} • oubliés {s['swept']:,}",
+                inline=False
+            )
+            s = automod.flood_detector.stats()
+            embed.add_field(
+                name="🌊 Anti-flood",
+                value=f"Salons suivis: **{s['channels']}** • messages {s['messages']:,} • floods détectés {s['detections']} • suites {s['follow_ups']}",
+                inline=False
+            )
+            s = automod.link_filter.stats()
+            embed.add_field(
+                name="🔗 Anti-liens",
+                value=(
+                    f"Domaines de phishing: **{s['blocklist']:,}** • phishing {s['phishing']} • "
+                    f"interdits {s['denied']} • liens {s['link']}"
+                ),
+                inline=False
+            )
+            rule_stats = automod.rule_engine.stats()
+            if rule_stats:
+                hits = automod.rule_engine.hits
+                embed.add_field(
+                    name="📏 Règles auto-mod",
+                    value="\n".join(
+                        [f"`{name}`: {s['count']:,} • moy {s['avg_ms']:.3f}ms • max {s['max_ms']:.2f}ms" for name, s in rule_stats.items()]
+                        + [f"Déclenchements: " + (" • ".join(f"{rule} {count}" for rule, count in hits.items()) or "aucun")]
+                    ),
+                    inline=False
+                )
+            if automod.check_pool:
+                s = automod.check_pool.stats()
+                embed.add_field(
+                    name="🧵 Pool de contrôles",
+                    value=(
+                        f"Mode **{s['mode']}** • en file **{s['pending']}** • "
+                        f"p50 {s['p50_ms']:.2f}ms • p99 **{s['p99_ms']:.2f}ms**\n"
+                        f"Soumis: {s['submitted']:,} • hors délai: {s['timeouts']} • "
+                        f"abandonnés (file pleine): {s['shed']} • erreurs: {s['errors']}"
+                    ),
+                    inline=False
+                )
+            s = automod.violations.stats()
+            embed.add_field(
+                name="⚖️ Violations",
+                value=f"Scores en mémoire: **{s['scores']:,}** • à sauvegarder {s['dirty']}",
+                inline=False
+            )
+        
+        # Logs de modération
+        s = self.bot.mod_logs.stats()
+        embed.add_field(
+            name="📜 Logs de modération",
+            value=(
+                f"En attente: **{s['buffered']}** ({s['channels']} salon(s))\n"
+                f"Envoyés: **{s['sent']:,}** en {s['messages']:,} messages • abandonnés {s['dropped']} • échecs {s['failed']}"
+            ),
+            inline=False
+        )
+        
+        # Cooldowns XP et XP en mémoire
+        leveling = self.bot.get_cog("Leveling")
+        if leveling:
+            s = leveling.xp.stats()
+            embed.add_field(
+                name="✨ XP en mémoire",
+                value=f"Membres: **{s['cached']:,}** • à écrire {s['dirty']} • gains {s['awards']:,}\n"
+                      f"Écritures: {s['flushes']:,} lots, {s['rows_written']:,} lignes • chargements {s['loads']:,}",
+                inline=False
+            )
+            v = leveling.voice_metrics
+            embed.add_field(
+                name="🎙️ XP vocale",
+                value=f"Dernier passage: **{v['last_members']:,}** membres en {v['last_ms']:.1f}ms (max {v['max_ms']:.1f}ms)\n"
+                      f"Passages: {v['ticks']:,} • XP distribuée à {v['awarded']:,} membres",
+                inline=False
+            )
+            s = leveling.xp_cooldowns.stats()
+            embed.add_field(
+                name="⏱️ Cooldowns XP",
+                value=f"Actifs: **{s['active']:,}** ({s['buckets']} tranche(s)) • accordés {s['granted']:,} • "
+                      f"bloqués {s['blocked']:,} • expirés {s['expired']:,}",
+                inline=False
+            )
+        
+        # Classements en mémoire (/leaderboard, /activityboard)
+        boards = [(name, cog.board.stats()) for name, cog in (("XP", leveling), ("Messages", analytics)) if cog]
+        if boards:
+            embed.add_field(
+                name="🏆 Classements en cache",
+                value="\n".join(
+                    f"{name}: **{s['guilds']}** serveur(s), {s['entries']:,} entrées • "
+                    f"lectures {s['hits']:,} • reconstructions {s['rebuilds']:,} • "
+                    f"lectures en base {s['fallbacks']:,} • mises à jour {s['updates']:,}"
+                    for name, s in boards
+                ),
+                inline=False
+            )
+        
+        # Présence des membres (arrivées/départs, archivage)
+        members = self.bot.get_cog("Members")
+        if members:
+            s = members.metrics
+            embed.add_field(
+                name="👥 Présence des membres",
+                value=f"Serveurs synchronisés: **{s['synced_guilds']}** (ignorés {s['skipped_guilds']}) • "
+                      f"départs hors ligne {s['departed_offline']:,}\n"
+                      f"Arrivées {s['joins']:,} • départs {s['leaves']:,} • archivés {s['archived']:,}",
+                inline=False
+            )
+        
+        # Cache des messages (logs de suppression/modification)
+        message_logs = self.bot.get_cog("MessageLogs")
+        if message_logs:
+            s = message_logs.cache.stats()
+            embed.add_field(
+                name="🗃️ Cache de messages",
+                value=(
+                    f"**{s['messages']:,}** messages ({s['guilds']} serveur(s)) • "
+                    f"{s['bytes'] / 1024 / 1024:.1f} / {s['max_bytes'] / 1024 / 1024:.0f} Mo\n"
+                    f"Retrouvés: {s['hits']:,} • inconnus: {s['misses']:,} • évincés: {s['evictions']:,}"
+                ),
+                inline=False
+            )
+        
+        # Planificateur des actions temporaires
+        tasks_cog = self.bot.get_cog("Tasks")
+        if tasks_cog:
+            s = tasks_cog.scheduler.stats()
+            next_deadline = s['next_deadline'].strftime('%Y-%m-%d %H:%M:%S') if s['next_deadline'] else "aucune"
+            embed.add_field(
+                name="⏱️ Actions temporaires",
+                value=(
+                    f"En attente: **{s['pending']}** • prochaine échéance {next_deadline}\n"
+                    f"Exécutées: {s['executed']} • annulées {s['cancelled']} • échecs {s['failed']}\n"
+                    f"Retard: {s['last_lag']:.2f}s (moy {s['avg_lag']:.2f}, max {s['max_lag']:.2f})"
+                ),
+                inline=False
+            )
+        
+        # Durée des étapes du pipeline des messages
+        pipeline_stats = self.bot.pipeline.stats()
+        if pipeline_stats:
+            embed.add_field(
+                name="🧵 Pipeline des messages",
+                value="\n".join(
+                    f"`{name}`: {s['count']:,} • moy {s['avg_ms']:.2f}ms • max {s['max_ms']:.1f}ms"
+                    for name, s in pipeline_stats.items()
+                ),
+                inline=False
+            )
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    # ===== SERVERINFO =====
+    @app_commands.command(name="serverinfo", description="Informations sur le serveur")
+    async def serverinfo(self, interaction: discord.Interaction):
+        """Affiche les informations du serveur"""
+        guild = interaction.guild
+        
+        # Statistiques des membres
+        total_members = guild.member_count
+        humans = len([m for m in guild.members if not m.bot])
+        bots = total_members - humans
+        
+        # Statistiques des salons
+        text_channels = len(guild.text_channels)
+        voice_channels = len(guild.voice_channels)
+        categories = len(guild.categories)
+        
+        # Autres stats
+        roles = len(guild.roles)
+        emojis = len(guild.emojis)
+        
+        embed = discord.Embed(
+            title=f"📊 Informations sur {guild.name}",
+            color=Colors.INFO,
+            timestamp=datetime.now()
+        )
+        
+        if guild.icon:
+            embed.set_thumbnail(url=guild.icon.url)
+        
+        # Propriétaire
+        embed.add_field(
+            name="👑 Propriétaire",
+            value=guild.owner.mention if guild.owner else "Inconnu",
+            inline=True
+        )
+        
+        # Date de création
+        created_at = guild.created_at.strftime("%d/%m/%Y")
+        embed.add_field(
+            name="📅 Créé le",
+            value=created_at,
+            inline=True
+        )
+        
+        # Membres
+        embed.add_field(
+            name=f"👥 Membres ({total_members})",
+            value=f"👤 Humains: {humans}\n🤖 Bots: {bots}",
+            inline=True
+        )
+        
+        # Salons
+        embed.add_field(
+            name=f"💬 Salons ({text_channels + voice_channels})",
+            value=f"📝 Texte: {text_channels}\n🔊 Vocal: {voice_channels}\n📁 Catégories: {categories}",
+            inline=True
+        )
+        
+        # Autres
+        embed.add_field(
+            name="🎭 Rôles",
+            value=str(roles),
+            inline=True
+        )
+        
+        embed.add_field(
+            name="😀 Emojis",
+            value=str(emojis),
+            inline=True
+        )
+        
+        # Boost
+        if guild.premium_subscription_count:
+            embed.add_field(
+                name=f"✨ Niveau de boost {guild.premium_tier}",
+                value=f"{guild.premium_subscription_count} boost(s)",
+                inline=True
+            )
+        
+        embed.set_footer(text=f"ID: {guild.id}")
+        
+        await interaction.response.send_message(embed=embed)
+    
+    # ===== USERINFO =====
+    @app_commands.command(name="userinfo", description="Informations sur un utilisateur")
+    @app_commands.describe(member="Le membre à examiner (vous par défaut)")
+    async def userinfo(self, interaction: discord.Interaction, member: discord.Member = None):
+        """Affiche les informations d'un utilisateur"""
+        member = member or interaction.user
+        
+        embed = discord.Embed(
+            title=f"👤 Informations sur {member.display_name}",
+            color=member.color if member.color != discord.Color.default() else Colors.INFO,
+            timestamp=datetime.now()
+        )
+        
+        embed.set_thumbnail(url=member.display_avatar.url)
+        
+        # Nom et discriminateur
+        embed.add_field(
+            name="🏷️ Nom complet",
+            value=str(member),
+            inline=True
+        )
+        
+        # Surnom
+        if member.nick:
+            embed.add_field(
+                name="✏️ Surnom",
+                value=member.nick,
+                inline=True
+            )
+        
+        # Création du compte
+        created = member.created_at.strftime("%d/%m/%Y à %H:%M")
+        embed.add_field(
+            name="📅 Compte créé le",
+            value=created,
+            inline=False
+        )
+        
+        # Arrivée sur le serveur
+        joined = member.joined_at.strftime("%d/%m/%Y à %H:%M")
+        embed.add_field(
+            name="📆 A rejoint le",
+            value=joined,
+            inline=False
+        )
+        
+        # Rôles (max 10)
+        roles = [role.mention for role in member.roles[1:]][:10]  # Exclure @everyone
+        if roles:
+            embed.add_field(
+                name=f"🎭 Rôles ({len(member.roles) - 1})",
+                value=" ".join(roles) if roles else "Aucun",
+                inline=False
+            )
+        
+        # Badges
+        badges = []
+        if member.premium_since:
+            badges.append("✨ Booster")
+        if member.guild_permissions.administrator:
+            badges.append("👑 Administrateur")
+        if member.bot:
+            badges.append("🤖 Bot")
+        
+        if badges:
+            embed.add_field(
+                name="🏅 Badges",
+                value=" • ".join(badges),
+                inline=False
+            )
+        
+        embed.set_footer(text=f"ID: {member.id}")
+        
+        await interaction.response.send_message(embed=embed)
+    
+    # ===== AVATAR =====
+    @app_commands.command(name="avatar", description="Afficher l'avatar d'un utilisateur")
+    @app_commands.describe(member="Le membre (vous par défaut)")
+    async def avatar(self, interaction: discord.Interaction, member: discord.Member = None):
+        """Affiche l'avatar d'un utilisateur"""
+        member = member or interaction.user
+        
+        embed = discord.Embed(
+            title=f"Avatar de {member.display_name}",
+            color=member.color if member.color != discord.Color.default() else Colors.INFO
+        )
+        
+        embed.set_image(url=member.display_avatar.url)
+        embed.add_field(
+            name="🔗 Lien",
+            value=f"[Cliquez ici]({member.display_avatar.url})",
+            inline=False
+        )
+        
+        await interaction.response.send_message(embed=embed)
+    
+    # ===== POLL =====
+    @app_commands.command(name="poll", description="Créer un sondage")
+    @app_commands.describe(
+        question="La question du sondage",
+        option1="Option 1",
+        option2="Option 2",
+        option3="Option 3 (optionnel)",
+        option4="Option 4 (optionnel)",
+        option5="Option 5 (optionnel)"
+    )
+    async def poll(
+        self,
+        interaction: discord.Interaction,
+        question: str,
+        option1: str,
+        option2: str,
+        option3: str = None,
+        option4: str = None,
+        option5: str = None
+    ):
+        """Crée un sondage avec réactions"""
+        options = [option1, option2]
+        if option3:
+            options.append(option3)
+        if option4:
+            options.append(option4)
+        if option5:
+            options.append(option5)
+        
+        # Emojis de réaction
+        emojis = ["1️⃣", "2️⃣", "3️⃣", "4️⃣", "5️⃣"]
+        
+        # Créer l'embed
+        embed = discord.Embed(
+            title=f"{Emojis.POLL} {question}",
+            color=Colors.INFO,
+            timestamp=datetime.now()
+        )
+        
+        description = ""
+        for i, option in enumerate(options):
+            description += f"\n{emojis[i]} {option}"
+        
+        embed.description = description
+        embed.set_footer(text=f"Sondage créé par {interaction.user.display_name}")
+        
+        await interaction.response.send_message(embed=embed)
+        message = await interaction.original_response()
+        
+        # Ajouter les réactions
+        for i in range(len(options)):
+            await message.add_reaction(emojis[i])
+        
+        logger.info(f"{interaction.user} a créé un sondage: {question}")
+    
+    # ===== EMBED CREATOR =====
+    @app_commands.command(name="embed", description="Créer un embed personnalisé")
+    @app_commands.describe(
+        title="Titre de l'embed",
+        description="Description de l'embed",
+        color="Couleur (hex sans #, ex: FF0000 pour rouge)"
+    )
+    @app_commands.checks.has_permissions(manage_messages=True)
+    async def create_embed(
+        self,
+        interaction: discord.Interaction,
+        title: str,
+        description: str,
+        color: str = None
+    ):
+        """Crée un embed personnalisé"""
+        try:
+            # Parser la couleur
+            if color:
+                color_value = int(color, 16)
+                embed_color = discord.Color(color_value)
+            else:
+                embed_color = Colors.DEFAULT
+            
+            embed = discord.Embed(
+                title=title,
+                description=description,
+                color=embed_color,
+                timestamp=datetime.now()
+            )
+            
+            embed.set_footer(text=f"Créé par {interaction.user.display_name}")
+            
+            await interaction.response.send_message(embed=embed)
+            logger.info(f"{interaction.user} a créé un embed: {title}")
+            
+        except ValueError:
+            await interaction.response.send_message(
+                f"{Emojis.ERROR} Couleur invalide. Utilisez le format hexadécimal (ex: FF0000).",
+                ephemeral=True
+            )
+
+async def setup(bot):
+    await bot.add_cog(Utility(bot))
@@ -1,66 +1,111 @@
-"""
-Configuration centralisée pour le bot Discord
-"""
-
-import discord
-
-# ===== COULEURS =====
-class Colors:
-    """Couleurs pour les embeds"""
-    SUCCESS = discord.Color.green()
-    ERROR = discord.Color.red()
-    WARNING = discord.Color.orange()
-    INFO = discord.Color.blue()
-    DEFAULT = discord.Color.blurple()
-
-# ===== EMOJIS =====
-class Emojis:
-    """Emojis personnalisés"""
-    SUCCESS = "✅"
-    ERROR = "❌"
-    WARNING = "⚠️"
-    INFO = "ℹ️"
-    LOADING = "⏳"
-    LOCK = "🔒"
-    UNLOCK = "🔓"
-    BAN = "🔨"
-    KICK = "👢"
-    MUTE = "🔇"
-    UNMUTE = "🔊"
-    WARN = "⚠️"
-    LEVEL_UP = "⬆️"
-    TICKET = "🎫"
-    POLL = "📊"
-    TRASH = "🗑️"
-
-# ===== CONFIGURATION =====
-class Config:
-    """Configuration générale"""
-    # XP System
-    XP_MIN = 5
-    XP_MAX = 15
-    XP_COOLDOWN = 60  # secondes entre chaque gain d'XP
-    
-    # Auto-modération
-    SPAM_THRESHOLD = 5  # messages identiques en X secondes
-    SPAM_TIME_WINDOW = 10  # secondes
-    MENTION_THRESHOLD = 5  # mentions max par message
-    
-    # Tickets
-    TICKET_CATEGORY_NAME = "🎫 Tickets"
-    TICKET_LOG_CHANNEL = "ticket-logs"
-    
-    # Leveling
-    LEVEL_FORMULA = lambda xp: int(0.1 * (xp ** 0.5))
-    XP_FORMULA = lambda level: int((level / 0.1) ** 2)
-
-# ===== MESSAGES =====
-class Messages:
-    """Messages prédéfinis"""
-    NO_PERMISSION = f"{Emojis.ERROR} Vous n'avez pas la permission d'utiliser cette commande."
-    MISSING_ARGS = f"{Emojis.WARNING} Arguments manquants. Utilisez `/help <commande>` pour plus d'infos."
-    USER_NOT_FOUND = f"{Emojis.ERROR} Utilisateur introuvable."
-    ROLE_NOT_FOUND = f"{Emojis.ERROR} Rôle introuvable."
-    CHANNEL_NOT_FOUND = f"{Emojis.ERROR} Salon introuvable."
-    ERROR_OCCURRED = f"{Emojis.ERROR} Une erreur s'est produite. Veuillez réessayer."
-    SUCCESS = f"{Emojis.SUCCESS} Opération effectuée avec succès !"
+"""
+Configuration centralisée pour le bot Discord
+"""
+
+import discord
+from pathlib import Path
+
+# ===== COULEURS =====
+class Colors:
+    """Couleurs pour les embeds"""
+    SUCCESS = discord.Color.green()
+    ERROR = discord.Color.red()
+    WARNING = discord.Color.orange()
+    INFO = discord.Color.blue()
+    DEFAULT = discord.Color.blurple()
+
+# ===== EMOJIS =====
+class Emojis:
+    """Emojis personnalisés"""
+    SUCCESS = "✅"
+    ERROR = "❌"
+    WARNING = "⚠️"
+    INFO = "ℹ️"
+    LOADING = "⏳"
+    LOCK = "🔒"
+    UNLOCK = "🔓"
+    BAN = "🔨"
+    KICK = "👢"
+    MUTE = "🔇"
+    UNMUTE = "🔊"
+    WARN = "⚠️"
+    LEVEL_UP = "⬆️"
+    TICKET = "🎫"
+    POLL = "📊"
+    TRASH = "🗑️"
+
+# ===== CONFIGURATION =====
+class Config:
+    """Configuration générale"""
+    # XP System
+    XP_MIN = 5
+    XP_MAX = 15
+    XP_COOLDOWN = 60  # secondes entre chaque gain d'XP
+    LEVEL_FLUSH_INTERVAL = 5  # secondes entre deux écritures groupées de l'XP
+    VOICE_XP_PER_MINUTE = 10  # XP par minute passée en vocal (hors AFK, sourdine de casque, seul)
+    VOICE_XP_MIN_MEMBERS = 2  # membres éligibles minimum dans le salon
+    LEVEL_ROLE_SYNC_CONCURRENCY = 3  # modifications de rôles simultanées pendant /levelroles sync
+    LEVEL_ROLE_SYNC_PROGRESS = 5  # secondes minimum entre deux mises à jour du message de progression
+    LEVEL_CACHE_IDLE = 600  # secondes d'inactivité avant d'oublier l'XP en mémoire d'un utilisateur
+    LEADERBOARD_CACHE_SIZE = 100  # entrées gardées par serveur pour /leaderboard et /activityboard (marge pour les membres partis)
+    
+    # Auto-modération
+    SPAM_THRESHOLD = 5  # messages identiques en X secondes
+    SPAM_TIME_WINDOW = 10  # secondes
+    MENTION_THRESHOLD = 5  # mentions max par message
+    FLOOD_MIN_MESSAGES = 5  # messages quasi identiques dans un salon...
+    FLOOD_MIN_AUTHORS = 3  # ...envoyés par au moins autant de comptes différents...
+    FLOOD_TIME_WINDOW = 30  # ...en X secondes
+    FLOOD_SIMILARITY = 0.6  # similarité (Jaccard estimée) à partir de laquelle deux messages sont quasi identiques
+    PHISHING_DOMAINS_FILE = Path(__file__).parent / "data" / "phishing_domains.txt"  # un domaine par ligne (optionnel)
+    VIOLATION_TIMEOUT_SCORE = 1.5  # score de violations à partir duquel l'auto-mod mute
+    VIOLATION_KICK_SCORE = 2.5  # score de violations à partir duquel l'auto-mod expulse
+    VIOLATION_CHECKPOINT_INTERVAL = 30  # secondes entre deux sauvegardes des scores
+    # Contrôles du texte hors de la boucle : "process", "thread" ou "" (sur place).
+    # Seul "process" protège la boucle (et les heartbeats) d'un contrôle qui déborde : en "thread",
+    # le délai ne borne que l'attente, le calcul garde le GIL jusqu'à sa fin.
+    AUTOMOD_OFFLOAD_MODE = "process"
+    AUTOMOD_WORKERS = 2  # threads ou processus du pool
+    AUTOMOD_CHECK_DEADLINE = 0.25  # secondes ; au-delà le contrôle est abandonné et le message passe
+    AUTOMOD_MAX_PENDING = 64  # contrôles en file au-delà desquels les nouveaux sont abandonnés
+    AUTOMOD_OFFLOAD_MIN_LENGTH = 200  # les messages plus courts sont analysés sur place (moins cher qu'un envoi au pool)
+    
+    # Modération de masse
+    MASSBAN_MAX_USERS = 300  # ~6000 caractères d'IDs, la limite d'une option de commande
+    BULK_BAN_CHUNK_SIZE = 200  # maximum accepté par Discord par appel bulk_ban
+    
+    # Logs de modération (regroupés par salon)
+    MODLOG_FLUSH_INTERVAL = 1.0  # secondes d'attente pour regrouper les embeds
+    MODLOG_BUFFER_SIZE = 100  # embeds en attente max par salon (les plus anciens sont abandonnés)
+    
+    # Cache des messages (logs de suppression/modification)
+    MESSAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # plafond global (octets estimés)
+    MESSAGE_CACHE_GUILD_BYTES = 2 * 1024 * 1024  # plafond par défaut d'un serveur (/messagecache pour le changer)
+    
+    # Analytics (écriture différée des messages)
+    INGEST_FLUSH_INTERVAL = 2.0  # secondes max entre deux écritures
+    INGEST_BATCH_SIZE = 500  # messages max par transaction
+    INGEST_QUEUE_SIZE = 10000  # au-delà, l'ingestion attend (backpressure)
+    STATS_CACHE_TTL = 15  # secondes pendant lesquelles /stats peut resservir un résultat
+    
+    # Présence des membres
+    MEMBER_ARCHIVE_DAYS = None  # jours après un départ avant d'archiver XP et statistiques (None = jamais)
+    
+    # Tickets
+    TICKET_CATEGORY_NAME = "🎫 Tickets"
+    TICKET_LOG_CHANNEL = "ticket-logs"
+    
+    # Leveling
+    LEVEL_FORMULA = lambda xp: int(0.1 * (xp ** 0.5))
+    XP_FORMULA = lambda level: int((level / 0.1) ** 2)
+
+# ===== MESSAGES =====
+class Messages:
+    """Messages prédéfinis"""
+    NO_PERMISSION = f"{Emojis.ERROR} Vous n'avez pas la permission d'utiliser cette commande."
+    MISSING_ARGS = f"{Emojis.WARNING} Arguments manquants. Utilisez `/help <commande>` pour plus d'infos."
+    USER_NOT_FOUND = f"{Emojis.ERROR} Utilisateur introuvable."
+    ROLE_NOT_FOUND = f"{Emojis.ERROR} Rôle introuvable."
+    CHANNEL_NOT_FOUND = f"{Emojis.ERROR} Salon introuvable."
+    ERROR_OCCURRED = f"{Emojis.ERROR} Une erreur s'est produite. Veuillez réessayer."
+    SUCCESS = f"{Emojis.SUCCESS} Opération effectuée avec succès !"
@@ -0,0 +1,64 @@
+"""
+Cooldowns par (serveur, utilisateur) - Horloge monotone et expiration par tranches
+"""
+
+import time
+
+class CooldownStore:
+    """
+    Échéances de cooldown indexées par un entier (serveur << 64 | utilisateur).
+    Les clés sont rangées dans des tranches de temps : chaque tranche écoulée
+    est purgée d'un coup, sans parcourir tout le dictionnaire.
+    """
+
+    def __init__(self, duration: float, bucket_seconds: float = None):
+        self.duration = duration
+        self.bucket_seconds = bucket_seconds or max(duration, 1.0)
+        self._expires = {}  # clé -> échéance (time.monotonic())
+        self._buckets = {}  # numéro de tranche -> [clés]
+        self._next_sweep = time.monotonic() + self.bucket_seconds
+        self.metrics = {"granted": 0, "blocked": 0, "expired": 0}
+
+    def __len__(self):
+        return len(self._expires)
+
+    @staticmethod
+    def key(guild_id: int, user_id: int) -> int:
+        return guild_id << 64 | user_id
+
+    def try_acquire(self, guild_id: int, user_id: int) -> bool:
+        """Vrai (et cooldown démarré) si l'utilisateur n'est pas en cooldown dans ce serveur"""
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self.sweep(now)
+
+        key = self.key(guild_id, user_id)
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at > now:
+            self.metrics["blocked"] += 1
+            return False
+
+        expires_at = now + self.duration
+        self._expires[key] = expires_at
+        self._buckets.setdefault(int(expires_at // self.bucket_seconds), []).append(key)
+        self.metrics["granted"] += 1
+        return True
+
+    def sweep(self, now: float = None) -> int:
+        """Retire les cooldowns des tranches entièrement écoulées"""
+        now = time.monotonic() if now is None else now
+        current = int(now // self.bucket_seconds)
+        removed = 0
+        for bucket in [bucket for bucket in self._buckets if bucket < current]:
+            for key in self._buckets.pop(bucket):
+                # La clé a pu être renouvelée entre-temps (elle est alors dans une tranche plus récente)
+                expires_at = self._expires.get(key)
+                if expires_at is not None and expires_at <= now:
+                    del self._expires[key]
+                    removed += 1
+        self._next_sweep = (current + 1) * self.bucket_seconds
+        self.metrics["expired"] += removed
+        return removed
+
+    def stats(self) -> dict:
+        return {"active": len(self._expires), "buckets": len(self._buckets), **self.metrics}
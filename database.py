@@ -1,634 +1,1569 @@
-"""
-Gestion de la base de données SQLite pour le bot Discord
-"""
-
-import aiosqlite
-import logging
-from datetime import datetime
-from pathlib import Path
-
-logger = logging.getLogger(__name__)
-
-DB_PATH = Path(__file__).parent / "data" / "bot.db"
-
-# ===== INITIALISATION =====
-async def init_db():
-    """Initialise la base de données et crée les tables"""
-    DB_PATH.parent.mkdir(exist_ok=True)
-    
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Table des avertissements
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS warns (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                moderator_id INTEGER NOT NULL,
-                reason TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Table des logs de modération
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS mod_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                action_type TEXT NOT NULL,
-                moderator_id INTEGER NOT NULL,
-                target_id INTEGER NOT NULL,
-                reason TEXT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Table des niveaux/XP
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS levels (
-                guild_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                xp INTEGER DEFAULT 0,
-                level INTEGER DEFAULT 0,
-                last_message DATETIME,
-                PRIMARY KEY (guild_id, user_id)
-            )
-        """)
-        
-        # Table des tickets
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS tickets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                channel_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                ticket_number INTEGER,
-                status TEXT DEFAULT 'open',
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                closed_at DATETIME
-            )
-        """)
-        
-        # Table de configuration des serveurs
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS guild_config (
-                guild_id INTEGER PRIMARY KEY,
-                log_channel_id INTEGER,
-                ticket_category_id INTEGER,
-                automod_enabled BOOLEAN DEFAULT 0,
-                antilink_enabled BOOLEAN DEFAULT 0,
-                leveling_enabled BOOLEAN DEFAULT 1,
-                antiraid_enabled BOOLEAN DEFAULT 0
-            )
-        """)
-        
-        # Table des actions temporaires (tempban, tempmute)
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS temporary_actions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                action_type TEXT NOT NULL,
-                moderator_id INTEGER NOT NULL,
-                reason TEXT,
-                expires_at DATETIME NOT NULL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Table des statistiques de messages
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS message_stats (
-                guild_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                message_count INTEGER DEFAULT 0,
-                last_message_at DATETIME,
-                PRIMARY KEY (guild_id, user_id)
-            )
-        """)
-        
-        # Table des logs d'activité
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS activity_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                activity_type TEXT NOT NULL,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Table des sessions vocales
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS voice_sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                join_time DATETIME NOT NULL,
-                leave_time DATETIME,
-                duration_seconds INTEGER
-            )
-        """)
-        
-        # Table de l'historique des messages avec timestamps
-        await db.execute("""
-            CREATE TABLE IF NOT EXISTS message_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                guild_id INTEGER NOT NULL,
-                user_id INTEGER NOT NULL,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Créer des index pour optimiser les requêtes par période
-        await db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_voice_sessions_time 
-            ON voice_sessions(guild_id, user_id, join_time)
-        """)
-        
-        await db.execute("""
-            CREATE INDEX IF NOT EXISTS idx_message_logs_time 
-            ON message_logs(guild_id, user_id, timestamp)
-        """)
-        
-        await db.commit()
-        logger.info("Base de données initialisée avec succès")
-
-# ===== WARNS =====
-async def add_warn(guild_id: int, user_id: int, moderator_id: int, reason: str = None):
-    """Ajoute un avertissement"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "INSERT INTO warns (guild_id, user_id, moderator_id, reason) VALUES (?, ?, ?, ?)",
-            (guild_id, user_id, moderator_id, reason)
-        )
-        await db.commit()
-
-async def get_warns(guild_id: int, user_id: int):
-    """Récupère tous les avertissements d'un utilisateur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM warns WHERE guild_id = ? AND user_id = ? ORDER BY timestamp DESC",
-            (guild_id, user_id)
-        ) as cursor:
-            return await cursor.fetchall()
-
-async def get_warn_count(guild_id: int, user_id: int):
-    """Compte les avertissements d'un utilisateur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        async with db.execute(
-            "SELECT COUNT(*) FROM warns WHERE guild_id = ? AND user_id = ?",
-            (guild_id, user_id)
-        ) as cursor:
-            result = await cursor.fetchone()
-            return result[0] if result else 0
-
-# ===== LOGS DE MODÉRATION =====
-async def add_mod_log(guild_id: int, action_type: str, moderator_id: int, target_id: int, reason: str = None):
-    """Ajoute un log de modération"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "INSERT INTO mod_logs (guild_id, action_type, moderator_id, target_id, reason) VALUES (?, ?, ?, ?, ?)",
-            (guild_id, action_type, moderator_id, target_id, reason)
-        )
-        await db.commit()
-
-# ===== NIVEAUX/XP =====
-async def add_xp(guild_id: int, user_id: int, xp: int):
-    """Ajoute de l'XP à un utilisateur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        from config import Config
-        
-        # Vérifier si l'utilisateur existe
-        async with db.execute(
-            "SELECT xp, level FROM levels WHERE guild_id = ? AND user_id = ?",
-            (guild_id, user_id)
-        ) as cursor:
-            result = await cursor.fetchone()
-        
-        if result:
-            new_xp = result[0] + xp
-            new_level = Config.LEVEL_FORMULA(new_xp)
-            old_level = result[1]
-            
-            await db.execute(
-                "UPDATE levels SET xp = ?, level = ?, last_message = ? WHERE guild_id = ? AND user_id = ?",
-                (new_xp, new_level, datetime.now(), guild_id, user_id)
-            )
-            await db.commit()
-            
-            # Retourne True si level up
-            return new_level > old_level, new_level
-        else:
-            # Créer l'utilisateur
-            await db.execute(
-                "INSERT INTO levels (guild_id, user_id, xp, level, last_message) VALUES (?, ?, ?, ?, ?)",
-                (guild_id, user_id, xp, 0, datetime.now())
-            )
-            await db.commit()
-            return False, 0
-
-async def get_level_data(guild_id: int, user_id: int):
-    """Récupère les données de niveau d'un utilisateur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM levels WHERE guild_id = ? AND user_id = ?",
-            (guild_id, user_id)
-        ) as cursor:
-            return await cursor.fetchone()
-
-async def get_leaderboard(guild_id: int, limit: int = 10):
-    """Récupère le classement des membres"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM levels WHERE guild_id = ? ORDER BY xp DESC LIMIT ?",
-            (guild_id, limit)
-        ) as cursor:
-            return await cursor.fetchall()
-
-async def set_level(guild_id: int, user_id: int, level: int):
-    """Définit le niveau d'un utilisateur"""
-    from config import Config
-    xp = Config.XP_FORMULA(level)
-    
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "INSERT OR REPLACE INTO levels (guild_id, user_id, xp, level, last_message) VALUES (?, ?, ?, ?, ?)",
-            (guild_id, user_id, xp, level, datetime.now())
-        )
-        await db.commit()
-
-# ===== TICKETS =====
-async def create_ticket(guild_id: int, channel_id: int, user_id: int):
-    """Crée un nouveau ticket"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Obtenir le prochain numéro de ticket
-        async with db.execute(
-            "SELECT MAX(ticket_number) FROM tickets WHERE guild_id = ?",
-            (guild_id,)
-        ) as cursor:
-            result = await cursor.fetchone()
-            next_number = (result[0] or 0) + 1
-        
-        await db.execute(
-            "INSERT INTO tickets (guild_id, channel_id, user_id, ticket_number) VALUES (?, ?, ?, ?)",
-            (guild_id, channel_id, user_id, next_number)
-        )
-        await db.commit()
-        return next_number
-
-async def close_ticket(channel_id: int):
-    """Ferme un ticket"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "UPDATE tickets SET status = 'closed', closed_at = ? WHERE channel_id = ?",
-            (datetime.now(), channel_id)
-        )
-        await db.commit()
-
-async def get_ticket(channel_id: int):
-    """Récupère les informations d'un ticket"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM tickets WHERE channel_id = ?",
-            (channel_id,)
-        ) as cursor:
-            return await cursor.fetchone()
-
-# ===== CONFIGURATION DES SERVEURS =====
-async def get_guild_config(guild_id: int):
-    """Récupère la configuration d'un serveur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM guild_config WHERE guild_id = ?",
-            (guild_id,)
-        ) as cursor:
-            result = await cursor.fetchone()
-            if not result:
-                # Créer une config par défaut
-                await db.execute(
-                    "INSERT INTO guild_config (guild_id) VALUES (?)",
-                    (guild_id,)
-                )
-                await db.commit()
-                return await get_guild_config(guild_id)
-            return result
-
-async def update_guild_config(guild_id: int, **kwargs):
-    """Met à jour la configuration d'un serveur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        # S'assurer que le serveur existe
-        await get_guild_config(guild_id)
-        
-        # Construire la requête de mise à jour
-        fields = ", ".join([f"{key} = ?" for key in kwargs.keys()])
-        values = list(kwargs.values()) + [guild_id]
-        
-        await db.execute(
-            f"UPDATE guild_config SET {fields} WHERE guild_id = ?",
-            values
-        )
-        await db.commit()
-
-# ===== ACTIONS TEMPORAIRES =====
-async def add_temp_action(guild_id: int, user_id: int, action_type: str, moderator_id: int, expires_at: datetime, reason: str = None):
-    """Ajoute une action temporaire (tempban, tempmute)"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "INSERT INTO temporary_actions (guild_id, user_id, action_type, moderator_id, expires_at, reason) VALUES (?, ?, ?, ?, ?, ?)",
-            (guild_id, user_id, action_type, moderator_id, expires_at, reason)
-        )
-        await db.commit()
-
-async def get_expired_actions():
-    """Récupère toutes les actions expirées"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM temporary_actions WHERE expires_at <= ?",
-            (datetime.now(),)
-        ) as cursor:
-            return await cursor.fetchall()
-
-async def remove_temp_action(action_id: int):
-    """Supprime une action temporaire"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "DELETE FROM temporary_actions WHERE id = ?",
-            (action_id,)
-        )
-        await db.commit()
-
-async def get_user_temp_action(guild_id: int, user_id: int, action_type: str):
-    """Récupère une action temporaire spécifique pour un utilisateur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM temporary_actions WHERE guild_id = ? AND user_id = ? AND action_type = ?",
-            (guild_id, user_id, action_type)
-        ) as cursor:
-            return await cursor.fetchone()
-
-async def send_mod_log(bot, guild_id: int, embed):
-    """Envoie un log de modération dans le canal configuré"""
-    try:
-        config = await get_guild_config(guild_id)
-        if not config or not config['log_channel_id']:
-            return  # Pas de canal de logs configuré
-        
-        import discord
-        guild = bot.get_guild(guild_id)
-        if not guild:
-            return
-        
-        log_channel = guild.get_channel(config['log_channel_id'])
-        if log_channel:
-            await log_channel.send(embed=embed)
-    except Exception as e:
-        logger.error(f"Erreur lors de l'envoi du log de modération: {e}")
-
-# ===== ANALYTICS =====
-async def increment_message_count(guild_id: int, user_id: int):
-    """Incrémente le compteur de messages d'un utilisateur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        now = datetime.now()
-        # Incrémenter le compteur total
-        await db.execute("""
-            INSERT INTO message_stats (guild_id, user_id, message_count, last_message_at)
-            VALUES (?, ?, 1, ?)
-            ON CONFLICT(guild_id, user_id) DO UPDATE SET
-                message_count = message_count + 1,
-                last_message_at = ?
-        """, (guild_id, user_id, now, now))
-        
-        # Logger le timestamp pour les stats par période
-        await db.execute("""
-            INSERT INTO message_logs (guild_id, user_id, timestamp)
-            VALUES (?, ?, ?)
-        """, (guild_id, user_id, now))
-        
-        await db.commit()
-
-async def log_activity(guild_id: int, user_id: int, activity_type: str):
-    """Enregistre une activité utilisateur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute(
-            "INSERT INTO activity_logs (guild_id, user_id, activity_type) VALUES (?, ?, ?)",
-            (guild_id, user_id, activity_type)
-        )
-        await db.commit()
-
-async def get_user_stats(guild_id: int, user_id: int):
-    """Récupère les statistiques d'un utilisateur"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM message_stats WHERE guild_id = ? AND user_id = ?",
-            (guild_id, user_id)
-        ) as cursor:
-            return await cursor.fetchone()
-
-async def get_activity_leaderboard(guild_id: int, limit: int = 10):
-    """Récupère le classement d'activité"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        async with db.execute(
-            "SELECT * FROM message_stats WHERE guild_id = ? ORDER BY message_count DESC LIMIT ?",
-            (guild_id, limit)
-        ) as cursor:
-            return await cursor.fetchall()
-
-# ===== VOICE SESSIONS =====
-async def log_voice_join(guild_id: int, user_id: int):
-    """Enregistre l'entrée d'un utilisateur dans un canal vocal"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        await db.execute("""
-            INSERT INTO voice_sessions (guild_id, user_id, join_time)
-            VALUES (?, ?, ?)
-        """, (guild_id, user_id, datetime.now()))
-        await db.commit()
-
-async def log_voice_leave(guild_id: int, user_id: int):
-    """Enregistre la sortie d'un utilisateur d'un canal vocal"""
-    async with aiosqlite.connect(DB_PATH) as db:
-        # Trouver la dernière session ouverte (sans leave_time)
-        async with db.execute("""
-            SELECT id, join_time FROM voice_sessions 
-            WHERE guild_id = ? AND user_id = ? AND leave_time IS NULL
-            ORDER BY join_time DESC LIMIT 1
-        """, (guild_id, user_id)) as cursor:
-            session = await cursor.fetchone()
-        
-        if session:
-            leave_time = datetime.now()
-            join_time = datetime.fromisoformat(session[1])
-            duration = int((leave_time - join_time).total_seconds())
-            
-            await db.execute("""
-                UPDATE voice_sessions 
-                SET leave_time = ?, duration_seconds = ?
-                WHERE id = ?
-            """, (leave_time, duration, session[0]))
-            await db.commit()
-
-async def get_voice_time(guild_id: int, user_id: int, hours: int = None):
-    """
-    Calcule le temps vocal d'un utilisateur
-    hours: None pour total, 24 pour 24h, 168 pour 7 jours
-    """
-    async with aiosqlite.connect(DB_PATH) as db:
-        if hours is None:
-            # Temps total
-            async with db.execute("""
-                SELECT SUM(duration_seconds) FROM voice_sessions
-                WHERE guild_id = ? AND user_id = ? AND leave_time IS NOT NULL
-            """, (guild_id, user_id)) as cursor:
-                result = await cursor.fetchone()
-                return result[0] or 0
-        else:
-            # Temps sur une période
-            from datetime import timedelta
-            cutoff_time = datetime.now() - timedelta(hours=hours)
-            
-            async with db.execute("""
-                SELECT SUM(duration_seconds) FROM voice_sessions
-                WHERE guild_id = ? AND user_id = ? 
-                AND leave_time IS NOT NULL 
-                AND join_time >= ?
-            """, (guild_id, user_id, cutoff_time)) as cursor:
-                result = await cursor.fetchone()
-                return result[0] or 0
-
-async def get_message_count_period(guild_id: int, user_id: int, hours: int):
-    """
-    Compte les messages d'un utilisateur sur une période
-    hours: 24 pour 24h, 168 pour 7 jours
-    """
-    from datetime import timedelta
-    async with aiosqlite.connect(DB_PATH) as db:
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        
-        async with db.execute("""
-            SELECT COUNT(*) FROM message_logs
-            WHERE guild_id = ? AND user_id = ? AND timestamp >= ?
-        """, (guild_id, user_id, cutoff_time)) as cursor:
-            result = await cursor.fetchone()
-            return result[0] if result else 0
-
-async def get_voice_leaderboard_7d(guild_id: int, limit: int = 10):
-    """Récupère le classement vocal sur 7 jours"""
-    from datetime import timedelta
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cutoff_time = datetime.now() - timedelta(days=7)
-        
-        async with db.execute("""
-            SELECT user_id, SUM(duration_seconds) as total_seconds
-            FROM voice_sessions
-            WHERE guild_id = ? AND leave_time IS NOT NULL AND join_time >= ?
-            GROUP BY user_id
-            ORDER BY total_seconds DESC
-            LIMIT ?
-        """, (guild_id, cutoff_time, limit)) as cursor:
-            return await cursor.fetchall()
-
-async def get_message_leaderboard_7d(guild_id: int, limit: int = 10):
-    """Récupère le classement messages sur 7 jours"""
-    from datetime import timedelta
-    async with aiosqlite.connect(DB_PATH) as db:
-        db.row_factory = aiosqlite.Row
-        cutoff_time = datetime.now() - timedelta(days=7)
-        
-        async with db.execute("""
-            SELECT user_id, COUNT(*) as message_count
-            FROM message_logs
-            WHERE guild_id = ? AND timestamp >= ?
-            GROUP BY user_id
-            ORDER BY message_count DESC
-            LIMIT ?
-        """, (guild_id, cutoff_time, limit)) as cursor:
-            return await cursor.fetchall()
-
-async def get_user_voice_rank_7d(guild_id: int, user_id: int):
-    """Récupère le rang vocal d'un utilisateur sur 7 jours"""
-    from datetime import timedelta
-    async with aiosqlite.connect(DB_PATH) as db:
-        cutoff_time = datetime.now() - timedelta(days=7)
-        
-        # Obtenir le total de secondes de l'utilisateur
-        async with db.execute("""
-            SELECT SUM(duration_seconds) as total_seconds
-            FROM voice_sessions
-            WHERE guild_id = ? AND user_id = ? AND leave_time IS NOT NULL AND join_time >= ?
-        """, (guild_id, user_id, cutoff_time)) as cursor:
-            user_result = await cursor.fetchone()
-            user_seconds = user_result[0] if user_result and user_result[0] else 0
-        
-        # Compter combien d'utilisateurs ont plus de temps
-        async with db.execute("""
-            SELECT COUNT(DISTINCT user_id) as rank
-            FROM (
-                SELECT user_id, SUM(duration_seconds) as total_seconds
-                FROM voice_sessions
-                WHERE guild_id = ? AND leave_time IS NOT NULL AND join_time >= ?
-                GROUP BY user_id
-                HAVING total_seconds > ?
-            )
-        """, (guild_id, cutoff_time, user_seconds)) as cursor:
-            rank_result = await cursor.fetchone()
-            rank = rank_result[0] + 1 if rank_result else 1
-        
-        # Compter le total d'utilisateurs actifs
-        async with db.execute("""
-            SELECT COUNT(DISTINCT user_id) as total
-            FROM voice_sessions
-            WHERE guild_id = ? AND leave_time IS NOT NULL AND join_time >= ?
-        """, (guild_id, cutoff_time)) as cursor:
-            total_result = await cursor.fetchone()
-            total = total_result[0] if total_result else 0
-        
-        return rank, total
-
-async def get_user_message_rank_7d(guild_id: int, user_id: int):
-    """Récupère le rang messages d'un utilisateur sur 7 jours"""
-    from datetime import timedelta
-    async with aiosqlite.connect(DB_PATH) as db:
-        cutoff_time = datetime.now() - timedelta(days=7)
-        
-        # Obtenir le nombre de messages de l'utilisateur
-        async with db.execute("""
-            SELECT COUNT(*) as message_count
-            FROM message_logs
-            WHERE guild_id = ? AND user_id = ? AND timestamp >= ?
-        """, (guild_id, user_id, cutoff_time)) as cursor:
-            user_result = await cursor.fetchone()
-            user_count = user_result[0] if user_result else 0
-        
-        # Compter combien d'utilisateurs ont plus de messages
-        async with db.execute("""
-            SELECT COUNT(DISTINCT user_id) as rank
-            FROM (
-                SELECT user_id, COUNT(*) as message_count
-                FROM message_logs
-                WHERE guild_id = ? AND timestamp >= ?
-                GROUP BY user_id
-                HAVING message_count > ?
-            )
-        """, (guild_id, cutoff_time, user_count)) as cursor:
-            rank_result = await cursor.fetchone()
-            rank = rank_result[0] + 1 if rank_result else 1
-        
-        # Compter le total d'utilisateurs actifs
-        async with db.execute("""
-            SELECT COUNT(DISTINCT user_id) as total
-            FROM message_logs
-            WHERE guild_id = ? AND timestamp >= ?
-        """, (guild_id, cutoff_time)) as cursor:
-            total_result = await cursor.fetchone()
-            total = total_result[0] if total_result else 0
-        
-        return rank, total
+"""
+Gestion de la base de données SQLite pour le bot Discord
+"""
+
+import aiosqlite
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DB_PATH = Path(__file__).parent / "data" / "bot.db"
+DB_READERS = 4  # connexions de lecture ouvertes en parallèle de l'écrivain
+
+# ===== POOL DE CONNEXIONS =====
+class ConnectionPool:
+    """Connexions SQLite longue durée : un écrivain unique et N lecteurs (WAL)"""
+    
+    def __init__(self, path: Path, readers: int = DB_READERS):
+        self.path = path
+        self.reader_count = readers
+        self._writer = None
+        self._readers = None
+        self._connections = []
+        self._write_lock = asyncio.Lock()
+        self._open_lock = asyncio.Lock()
+        self._counters = {
+            kind: {"count": 0, "wait_total": 0.0, "wait_max": 0.0, "time_total": 0.0, "time_max": 0.0}
+            for kind in ("read", "write")
+        }
+    
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+    
+    async def _connect(self, readonly: bool):
+        """Ouvre une connexion configurée pour le pool"""
+        db = await aiosqlite.connect(self.path)
+        db.row_factory = aiosqlite.Row
+        await db.execute("PRAGMA busy_timeout = 5000")
+        if readonly:
+            await db.execute("PRAGMA query_only = ON")
+        else:
+            await db.execute("PRAGMA journal_mode = WAL")
+            await db.execute("PRAGMA synchronous = NORMAL")
+        self._connections.append(db)
+        return db
+    
+    async def open(self):
+        """Ouvre l'écrivain et les lecteurs (sans effet si déjà ouvert)"""
+        async with self._open_lock:
+            if self.is_open:
+                return
+            self.path.parent.mkdir(exist_ok=True)
+            # L'écrivain d'abord : il active le mode WAL avant l'ouverture des lecteurs
+            self._writer = await self._connect(readonly=False)
+            self._readers = asyncio.Queue()
+            for _ in range(self.reader_count):
+                self._readers.put_nowait(await self._connect(readonly=True))
+            logger.info(f"Pool SQLite ouvert (1 écrivain, {self.reader_count} lecteurs)")
+    
+    async def close(self):
+        """Ferme toutes les connexions du pool"""
+        async with self._open_lock:
+            if not self.is_open:
+                return
+            async with self._write_lock:
+                for db in self._connections:
+                    try:
+                        await db.close()
+                    except Exception as e:
+                        logger.error(f"Erreur lors de la fermeture d'une connexion: {e}")
+                self._connections.clear()
+                self._writer = None
+                self._readers = None
+            logger.info("Pool SQLite fermé")
+    
+    def _record(self, kind: str, waited: float, held: float):
+        counters = self._counters[kind]
+        counters["count"] += 1
+        counters["wait_total"] += waited
+        counters["wait_max"] = max(counters["wait_max"], waited)
+        counters["time_total"] += held
+        counters["time_max"] = max(counters["time_max"], held)
+    
+    @asynccontextmanager
+    async def read(self):
+        """Emprunte une connexion de lecture"""
+        if not self.is_open:
+            await self.open()
+        readers = self._readers
+        requested = time.perf_counter()
+        db = await readers.get()
+        acquired = time.perf_counter()
+        try:
+            yield db
+        finally:
+            readers.put_nowait(db)
+            self._record("read", acquired - requested, time.perf_counter() - acquired)
+    
+    @asynccontextmanager
+    async def write(self):
+        """Emprunte l'écrivain : commit à la sortie, rollback en cas d'erreur"""
+        if not self.is_open:
+            await self.open()
+        requested = time.perf_counter()
+        async with self._write_lock:
+            acquired = time.perf_counter()
+            try:
+                yield self._writer
+                await self._writer.commit()
+            except BaseException:
+                await self._writer.rollback()
+                raise
+            finally:
+                self._record("write", acquired - requested, time.perf_counter() - acquired)
+    
+    @asynccontextmanager
+    async def snapshot(self, on_pinned=None):
+        """
+        Emprunte un lecteur figé dans une transaction de lecture (WAL) : il voit la base telle qu'au
+        moment de l'ouverture. Le verrou d'écriture n'est tenu que le temps de fixer cet état ;
+        on_pinned est appelé à cet instant, avant tout commit postérieur.
+        """
+        async with self.read() as db:
+            async with self._write_lock:
+                await db.execute("BEGIN")
+                # La première lecture fixe l'état visible jusqu'à la fin de la transaction
+                await db.execute("SELECT 1 FROM sqlite_master LIMIT 1")
+                if on_pinned:
+                    on_pinned()
+            try:
+                yield db
+            finally:
+                await db.rollback()
+    
+    def stats(self) -> dict:
+        """Compteurs d'attente et de durée des requêtes (en millisecondes)"""
+        result = {
+            "readers_idle": self._readers.qsize() if self._readers else 0,
+            "writer_busy": self._write_lock.locked(),
+        }
+        for kind, counters in self._counters.items():
+            count = counters["count"] or 1
+            result[kind] = {
+                "count": counters["count"],
+                "wait_avg_ms": counters["wait_total"] / count * 1000,
+                "wait_max_ms": counters["wait_max"] * 1000,
+                "time_avg_ms": counters["time_total"] / count * 1000,
+                "time_max_ms": counters["time_max"] * 1000,
+            }
+        return result
+
+pool = ConnectionPool(DB_PATH)
+
+# ===== INITIALISATION =====
+async def _add_missing_columns(db, table: str, columns: dict):
+    """Ajoute aux tables existantes les colonnes apparues dans une mise à jour"""
+    async with db.execute(f"PRAGMA table_info({table})") as cursor:
+        existing = {row[1] for row in await cursor.fetchall()}
+    for name, definition in columns.items():
+        if name not in existing:
+            await db.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+async def init_db():
+    """Initialise la base de données et crée les tables"""
+    async with pool.write() as db:
+        # Table des avertissements
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS warns (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                moderator_id INTEGER NOT NULL,
+                reason TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Table des logs de modération
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS mod_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                action_type TEXT NOT NULL,
+                moderator_id INTEGER NOT NULL,
+                target_id INTEGER NOT NULL,
+                reason TEXT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Table des niveaux/XP
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS levels (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                xp INTEGER DEFAULT 0,
+                level INTEGER DEFAULT 0,
+                last_message DATETIME,
+                PRIMARY KEY (guild_id, user_id)
+            )
+        """)
+        
+        # Table des tickets
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS tickets (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                channel_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                ticket_number INTEGER,
+                status TEXT DEFAULT 'open',
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                closed_at DATETIME
+            )
+        """)
+        
+        # Table de configuration des serveurs
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS guild_config (
+                guild_id INTEGER PRIMARY KEY,
+                log_channel_id INTEGER,
+                ticket_category_id INTEGER,
+                automod_enabled BOOLEAN DEFAULT 0,
+                antilink_enabled BOOLEAN DEFAULT 0,
+                leveling_enabled BOOLEAN DEFAULT 1,
+                antiraid_enabled BOOLEAN DEFAULT 0,
+                violation_half_life REAL DEFAULT 24,
+                message_cache_kb INTEGER
+            )
+        """)
+        await _add_missing_columns(db, "guild_config", {
+            "violation_half_life": "REAL DEFAULT 24",
+            "message_cache_kb": "INTEGER",
+        })
+        
+        # Règles d'auto-modération par serveur (valeurs JSON)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS automod_rules (
+                guild_id INTEGER NOT NULL,
+                rule TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (guild_id, rule)
+            )
+        """)
+        
+        # Rôles attribués à partir d'un niveau
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS level_roles (
+                guild_id INTEGER NOT NULL,
+                level INTEGER NOT NULL,
+                role_id INTEGER NOT NULL,
+                PRIMARY KEY (guild_id, level)
+            )
+        """)
+        
+        # Synchronisations des rôles de niveau en cours (reprises après un redémarrage)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS level_role_syncs (
+                guild_id INTEGER PRIMARY KEY,
+                channel_id INTEGER,
+                last_user_id INTEGER DEFAULT 0,
+                processed INTEGER DEFAULT 0,
+                changed INTEGER DEFAULT 0,
+                failed INTEGER DEFAULT 0,
+                started_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Domaines autorisés/interdits par serveur (anti-liens)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS link_rules (
+                guild_id INTEGER NOT NULL,
+                domain TEXT NOT NULL,
+                action TEXT NOT NULL,
+                PRIMARY KEY (guild_id, domain)
+            )
+        """)
+        
+        # Scores de violation de l'auto-modération (sauvegardés par lots)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS automod_violations (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                score REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                half_life REAL NOT NULL,
+                PRIMARY KEY (guild_id, user_id)
+            )
+        """)
+        
+        # Demandes de rechargement de config (ex: modifications depuis le dashboard)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS guild_config_invalidations (
+                guild_id INTEGER PRIMARY KEY,
+                requested_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Table des actions temporaires (tempban, tempmute)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS temporary_actions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                action_type TEXT NOT NULL,
+                moderator_id INTEGER NOT NULL,
+                reason TEXT,
+                expires_at DATETIME NOT NULL,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Table des statistiques de messages
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS message_stats (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                message_count INTEGER DEFAULT 0,
+                last_message_at DATETIME,
+                PRIMARY KEY (guild_id, user_id)
+            )
+        """)
+        
+        # Table des logs d'activité
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS activity_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                activity_type TEXT NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Table des sessions vocales
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS voice_sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                join_time DATETIME NOT NULL,
+                leave_time DATETIME,
+                duration_seconds INTEGER
+            )
+        """)
+        
+        # Table de l'historique des messages avec timestamps
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS message_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Agrégats horaires des messages (alimentés par l'ingestion)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS message_rollups (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                hour_bucket TEXT NOT NULL,
+                message_count INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, user_id, hour_bucket)
+            )
+        """)
+        
+        # Agrégats horaires du temps vocal (alimentés à la sortie du vocal)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS voice_rollups (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                hour_bucket TEXT NOT NULL,
+                voice_seconds INTEGER DEFAULT 0,
+                PRIMARY KEY (guild_id, user_id, hour_bucket)
+            )
+        """)
+        
+        # Présence des membres : les classements et rangs ignorent les membres partis
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS guild_members (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                present INTEGER NOT NULL DEFAULT 1,
+                seen_at DATETIME,
+                left_at DATETIME,
+                archived_at DATETIME,
+                PRIMARY KEY (guild_id, user_id)
+            )
+        """)
+        
+        # Données froides des membres partis depuis longtemps (restaurées s'ils reviennent)
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS levels_archive (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                xp INTEGER DEFAULT 0,
+                level INTEGER DEFAULT 0,
+                last_message DATETIME,
+                PRIMARY KEY (guild_id, user_id)
+            )
+        """)
+        
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS message_stats_archive (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                message_count INTEGER DEFAULT 0,
+                last_message_at DATETIME,
+                PRIMARY KEY (guild_id, user_id)
+            )
+        """)
+        
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS voice_sessions_archive (
+                id INTEGER PRIMARY KEY,
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                join_time DATETIME NOT NULL,
+                leave_time DATETIME,
+                duration_seconds INTEGER
+            )
+        """)
+        
+        # Créer des index pour optimiser les requêtes par période
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_voice_sessions_time 
+            ON voice_sessions(guild_id, user_id, join_time)
+        """)
+        
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_message_logs_time 
+            ON message_logs(guild_id, user_id, timestamp)
+        """)
+        
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_message_rollups_bucket
+            ON message_rollups(guild_id, hour_bucket)
+        """)
+        
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_voice_rollups_bucket
+            ON voice_rollups(guild_id, hour_bucket)
+        """)
+        
+        # Les actions temporaires sont relues en entier, par ordre de création, au démarrage :
+        # l'index sur expires_at n'était utilisé par aucune requête
+        await db.execute("DROP INDEX IF EXISTS idx_temporary_actions_expires")
+        
+        # Départs à archiver : seuls les membres partis et pas encore archivés sont indexés
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_guild_members_departed
+            ON guild_members(left_at) WHERE present = 0 AND archived_at IS NULL
+        """)
+        
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_voice_sessions_archive_member
+            ON voice_sessions_archive(guild_id, user_id)
+        """)
+        
+        # Classements : top et pages par curseur sans tri de toute la table
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_levels_guild_xp
+            ON levels(guild_id, xp DESC, user_id)
+        """)
+        
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_message_stats_guild_count
+            ON message_stats(guild_id, message_count DESC, user_id)
+        """)
+        
+    logger.info("Base de données initialisée avec succès")
+
+async def backup_database(target_path: Path):
+    """Copie cohérente de la base (API de backup SQLite, compatible WAL)"""
+    async with pool.read() as db:
+        async with aiosqlite.connect(target_path) as target:
+            await db.backup(target)
+
+# ===== WARNS =====
+async def add_warn(guild_id: int, user_id: int, moderator_id: int, reason: str = None):
+    """Ajoute un avertissement"""
+    async with pool.write() as db:
+        await db.execute(
+            "INSERT INTO warns (guild_id, user_id, moderator_id, reason) VALUES (?, ?, ?, ?)",
+            (guild_id, user_id, moderator_id, reason)
+        )
+
+async def get_warns(guild_id: int, user_id: int):
+    """Récupère tous les avertissements d'un utilisateur"""
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT * FROM warns WHERE guild_id = ? AND user_id = ? ORDER BY timestamp DESC",
+            (guild_id, user_id)
+        ) as cursor:
+            return await cursor.fetchall()
+
+async def get_warn_count(guild_id: int, user_id: int):
+    """Compte les avertissements d'un utilisateur"""
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT COUNT(*) FROM warns WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        ) as cursor:
+            result = await cursor.fetchone()
+            return result[0] if result else 0
+
+# ===== LOGS DE MODÉRATION =====
+async def add_mod_log(guild_id: int, action_type: str, moderator_id: int, target_id: int, reason: str = None):
+    """Ajoute un log de modération"""
+    async with pool.write() as db:
+        await db.execute(
+            "INSERT INTO mod_logs (guild_id, action_type, moderator_id, target_id, reason) VALUES (?, ?, ?, ?, ?)",
+            (guild_id, action_type, moderator_id, target_id, reason)
+        )
+
+async def add_mod_logs(guild_id: int, action_type: str, moderator_id: int, target_ids: list, reason: str = None):
+    """Ajoute un log de modération par cible, en une seule transaction"""
+    async with pool.write() as db:
+        await db.executemany(
+            "INSERT INTO mod_logs (guild_id, action_type, moderator_id, target_id, reason) VALUES (?, ?, ?, ?, ?)",
+            [(guild_id, action_type, moderator_id, target_id, reason) for target_id in target_ids]
+        )
+
+# ===== VIOLATIONS AUTO-MOD =====
+async def get_automod_violations():
+    """Récupère tous les scores de violation sauvegardés"""
+    async with pool.read() as db:
+        async with db.execute("SELECT * FROM automod_violations") as cursor:
+            return await cursor.fetchall()
+
+async def save_automod_violations(upserts: list, deletes: list):
+    """
+    Sauvegarde les scores modifiés en une transaction
+    upserts: [(guild_id, user_id, score, updated_at, half_life)], deletes: [(guild_id, user_id)]
+    """
+    async with pool.write() as db:
+        if upserts:
+            await db.executemany("""
+                INSERT INTO automod_violations (guild_id, user_id, score, updated_at, half_life)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(guild_id, user_id) DO UPDATE SET
+                    score = excluded.score,
+                    updated_at = excluded.updated_at,
+                    half_life = excluded.half_life
+            """, upserts)
+        if deletes:
+            await db.executemany(
+                "DELETE FROM automod_violations WHERE guild_id = ? AND user_id = ?",
+                deletes
+            )
+
+# ===== NIVEAUX/XP =====
+async def save_levels(rows):
+    """Écrit en une transaction des lignes (guild_id, user_id, xp, level, last_message)"""
+    async with pool.write() as db:
+        await db.executemany("""
+            INSERT INTO levels (guild_id, user_id, xp, level, last_message)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                xp = excluded.xp,
+                level = excluded.level,
+                last_message = COALESCE(excluded.last_message, levels.last_message)
+        """, rows)
+
+async def iter_level_chunks(guild_id: int = None, chunk_size: int = 5000):
+    """Parcourt la table levels par pages (guild_id, user_id, xp, level) sans la charger entière"""
+    where = "guild_id = ? AND user_id > ?" if guild_id is not None else "(guild_id, user_id) > (?, ?)"
+    last = (guild_id, -1) if guild_id is not None else (-1, -1)
+    while True:
+        # Pagination par clé : chaque page reprend après la dernière ligne lue
+        async with pool.read() as db:
+            async with db.execute(
+                f"SELECT guild_id, user_id, xp, level FROM levels WHERE {where} "
+                f"ORDER BY guild_id, user_id LIMIT ?",
+                (*last, chunk_size)
+            ) as cursor:
+                rows = await cursor.fetchall()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < chunk_size:
+            return
+        last = (rows[-1]['guild_id'], rows[-1]['user_id']) if guild_id is None else (guild_id, rows[-1]['user_id'])
+
+async def update_levels(rows):
+    """Écrit en une transaction des niveaux recalculés (level, guild_id, user_id)"""
+    async with pool.write() as db:
+        await db.executemany(
+            "UPDATE levels SET level = ? WHERE guild_id = ? AND user_id = ?",
+            rows
+        )
+
+async def get_level_data(guild_id: int, user_id: int):
+    """Récupère les données de niveau d'un utilisateur"""
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT * FROM levels WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        ) as cursor:
+            return await cursor.fetchone()
+
+async def get_level_rows(guild_id: int, user_ids: list):
+    """Lignes levels de plusieurs utilisateurs d'un serveur (une connexion, requêtes par 500)"""
+    rows = []
+    async with pool.read() as db:
+        for i in range(0, len(user_ids), 500):
+            chunk = user_ids[i:i + 500]
+            async with db.execute(
+                f"SELECT * FROM levels WHERE guild_id = ? AND user_id IN ({', '.join('?' * len(chunk))})",
+                (guild_id, *chunk)
+            ) as cursor:
+                rows.extend(await cursor.fetchall())
+    return rows
+
+def _board_query(table: str, column: str, extra: str, guild_id: int, after, limit: int):
+    """Requête des lignes (user_id, score, extra) d'un classement, après le curseur (score, user_id) s'il est donné"""
+    where = f"guild_id = ? AND {_present(table)}"
+    params = [guild_id]
+    if after is not None:
+        where += f" AND ({column} < ? OR ({column} = ? AND user_id > ?))"
+        params += [after[0], after[0], after[1]]
+    return f"""
+        SELECT user_id, {column}, {extra} FROM {table} WHERE {where}
+        ORDER BY {column} DESC, user_id LIMIT ?
+    """, (*params, limit)
+
+async def get_level_board(guild_id: int, limit: int):
+    """
+    Top du classement XP [(user_id, xp, niveau)]. Lu sous le verrou d'écriture :
+    aucun flush ne peut s'intercaler entre la lecture et l'installation du cache.
+    """
+    query, params = _board_query("levels", "xp", "level", guild_id, None, limit)
+    async with pool.write() as db:
+        async with db.execute(query, params) as cursor:
+            return [tuple(row) for row in await cursor.fetchall()]
+
+async def get_level_board_after(guild_id: int, after, limit: int):
+    """Suite du classement XP après le curseur (xp, user_id)"""
+    query, params = _board_query("levels", "xp", "level", guild_id, after, limit)
+    async with pool.read() as db:
+        async with db.execute(query, params) as cursor:
+            return [tuple(row) for row in await cursor.fetchall()]
+
+# ===== PRÉSENCE DES MEMBRES =====
+# Tables (et colonnes) dont les lignes des membres partis depuis longtemps passent dans {table}_archive
+ARCHIVED_TABLES = {
+    "levels": "guild_id, user_id, xp, level, last_message",
+    "message_stats": "guild_id, user_id, message_count, last_message_at",
+    "voice_sessions": "id, guild_id, user_id, join_time, leave_time, duration_seconds",
+}
+
+# Restauration d'un membre qui a déjà une ligne vivante (revenu et actif avant la restauration) : fusion
+ARCHIVE_MERGE = {
+    "levels": """ON CONFLICT (guild_id, user_id) DO UPDATE SET
+        xp = levels.xp + excluded.xp,
+        level = MAX(levels.level, excluded.level),
+        last_message = COALESCE(levels.last_message, excluded.last_message)""",
+    "message_stats": """ON CONFLICT (guild_id, user_id) DO UPDATE SET
+        message_count = message_stats.message_count + excluded.message_count,
+        last_message_at = COALESCE(message_stats.last_message_at, excluded.last_message_at)""",
+    "voice_sessions": "ON CONFLICT (id) DO NOTHING",  # identifiants jamais réutilisés
+}
+
+def _present(alias: str) -> str:
+    """
+    Filtre SQL excluant les membres partis (recherche par clé primaire de guild_members) ;
+    un utilisateur sans ligne de présence est considéré présent
+    """
+    return (
+        f"NOT EXISTS (SELECT 1 FROM guild_members AS gm WHERE gm.guild_id = {alias}.guild_id "
+        f"AND gm.user_id = {alias}.user_id AND gm.present = 0)"
+    )
+
+async def _restore_archived(db, guild_id: int, user_id: int = None):
+    """
+    Remet en place les données archivées des membres revenus, fusionnées avec leurs
+    lignes vivantes s'il y en a (le niveau est recalculé au prochain gain d'XP)
+    """
+    where = "guild_id = ? AND present = 1 AND archived_at IS NOT NULL"
+    params = [guild_id]
+    if user_id is not None:
+        where += " AND user_id = ?"
+        params.append(user_id)
+    members = f"SELECT guild_id, user_id FROM guild_members WHERE {where}"
+    for table, columns in ARCHIVED_TABLES.items():
+        await db.execute(
+            f"INSERT INTO {table} ({columns}) "
+            f"SELECT {columns} FROM {table}_archive WHERE (guild_id, user_id) IN ({members}) "
+            f"{ARCHIVE_MERGE[table]}",
+            params
+        )
+        await db.execute(f"DELETE FROM {table}_archive WHERE (guild_id, user_id) IN ({members})", params)
+    await db.execute(f"UPDATE guild_members SET archived_at = NULL WHERE {where}", params)
+
+async def mark_member_joined(guild_id: int, user_id: int) -> bool:
+    """Marque un membre présent (données archivées restaurées) ; vrai s'il était connu comme parti"""
+    async with pool.write() as db:
+        async with db.execute(
+            "SELECT present FROM guild_members WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        ) as cursor:
+            row = await cursor.fetchone()
+        await db.execute("""
+            INSERT INTO guild_members (guild_id, user_id, present, seen_at)
+            VALUES (?, ?, 1, ?)
+            ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                present = 1, left_at = NULL, seen_at = excluded.seen_at
+        """, (guild_id, user_id, datetime.now()))
+        returning = row is not None and not row['present']
+        if returning:
+            await _restore_archived(db, guild_id, user_id)
+    return returning
+
+async def mark_member_left(guild_id: int, user_id: int):
+    """Marque un membre parti (exclu des classements)"""
+    async with pool.write() as db:
+        await db.execute("""
+            INSERT INTO guild_members (guild_id, user_id, present, left_at)
+            VALUES (?, ?, 0, ?)
+            ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                present = 0, left_at = excluded.left_at
+        """, (guild_id, user_id, datetime.now()))
+
+async def sync_guild_members(guild_id: int, user_ids, chunk_size: int = 5000) -> int:
+    """
+    Aligne la présence d'un serveur sur la liste complète de ses membres (cache du gateway).
+    Les absents sont marqués partis, y compris les anciens membres sans ligne de présence
+    qui ont encore de l'XP ou des statistiques. Retourne le nombre de départs constatés.
+    """
+    now = datetime.now()
+    user_ids = list(user_ids)
+    for i in range(0, len(user_ids), chunk_size):
+        async with pool.write() as db:
+            await db.executemany("""
+                INSERT INTO guild_members (guild_id, user_id, present, seen_at)
+                VALUES (?, ?, 1, ?)
+                ON CONFLICT (guild_id, user_id) DO UPDATE SET
+                    present = 1, left_at = NULL, seen_at = excluded.seen_at
+            """, [(guild_id, user_id, now) for user_id in user_ids[i:i + chunk_size]])
+    
+    async with pool.write() as db:
+        # Partis pendant que le bot était hors ligne (les arrivées depuis ont un seen_at plus récent)
+        cursor = await db.execute("""
+            UPDATE guild_members SET present = 0, left_at = ?
+            WHERE guild_id = ? AND present = 1 AND (seen_at IS NULL OR seen_at < ?)
+        """, (now, guild_id, now))
+        departed = cursor.rowcount
+        cursor = await db.execute("""
+            INSERT OR IGNORE INTO guild_members (guild_id, user_id, present, left_at)
+            SELECT guild_id, user_id, 0, ? FROM levels WHERE guild_id = ?
+            UNION SELECT guild_id, user_id, 0, ? FROM message_stats WHERE guild_id = ?
+            UNION SELECT guild_id, user_id, 0, ? FROM voice_sessions WHERE guild_id = ?
+        """, (now, guild_id) * 3)
+        departed += cursor.rowcount
+        # Revenus pendant que le bot était hors ligne
+        await _restore_archived(db, guild_id)
+    return departed
+
+async def archive_departed_members(before: datetime, batch_size: int = 500) -> int:
+    """
+    Déplace vers les tables *_archive les lignes des membres partis avant `before`,
+    par transactions de batch_size membres. Retourne le nombre de membres archivés.
+    """
+    archived = 0
+    while True:
+        async with pool.write() as db:
+            async with db.execute("""
+                SELECT guild_id, user_id FROM guild_members
+                WHERE present = 0 AND archived_at IS NULL AND left_at < ?
+                LIMIT ?
+            """, (before, batch_size)) as cursor:
+                rows = await cursor.fetchall()
+            if not rows:
+                break
+            
+            members = f"VALUES {', '.join(['(?, ?)'] * len(rows))}"
+            params = [value for row in rows for value in row]
+            for table, columns in ARCHIVED_TABLES.items():
+                await db.execute(
+                    f"INSERT OR REPLACE INTO {table}_archive ({columns}) "
+                    f"SELECT {columns} FROM {table} WHERE (guild_id, user_id) IN ({members})",
+                    params
+                )
+                await db.execute(f"DELETE FROM {table} WHERE (guild_id, user_id) IN ({members})", params)
+            await db.execute(
+                f"UPDATE guild_members SET archived_at = ? WHERE (guild_id, user_id) IN ({members})",
+                [datetime.now(), *params]
+            )
+        archived += len(rows)
+        if len(rows) < batch_size:
+            break
+    return archived
+
+# ===== TICKETS =====
+async def create_ticket(guild_id: int, channel_id: int, user_id: int):
+    """Crée un nouveau ticket"""
+    async with pool.write() as db:
+        # Obtenir le prochain numéro de ticket
+        async with db.execute(
+            "SELECT MAX(ticket_number) FROM tickets WHERE guild_id = ?",
+            (guild_id,)
+        ) as cursor:
+            result = await cursor.fetchone()
+            next_number = (result[0] or 0) + 1
+        
+        await db.execute(
+            "INSERT INTO tickets (guild_id, channel_id, user_id, ticket_number) VALUES (?, ?, ?, ?)",
+            (guild_id, channel_id, user_id, next_number)
+        )
+        return next_number
+
+async def close_ticket(channel_id: int):
+    """Ferme un ticket"""
+    async with pool.write() as db:
+        await db.execute(
+            "UPDATE tickets SET status = 'closed', closed_at = ? WHERE channel_id = ?",
+            (datetime.now(), channel_id)
+        )
+
+async def get_ticket(channel_id: int):
+    """Récupère les informations d'un ticket"""
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT * FROM tickets WHERE channel_id = ?",
+            (channel_id,)
+        ) as cursor:
+            return await cursor.fetchone()
+
+# ===== CONFIGURATION DES SERVEURS =====
+class GuildConfigCache:
+    """Cache mémoire des configurations de serveur (lecture à travers, mis à jour à l'écriture)"""
+    
+    def __init__(self):
+        self._configs = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def get(self, guild_id: int):
+        config = self._configs.get(guild_id)
+        if config is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return config
+    
+    def set(self, guild_id: int, config: dict):
+        self._configs[guild_id] = config
+    
+    def invalidate(self, guild_id: int = None):
+        """Oublie la config d'un serveur (ou de tous si guild_id est None)"""
+        if guild_id is None:
+            self._configs.clear()
+        else:
+            self._configs.pop(guild_id, None)
+        self.invalidations += 1
+    
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._configs),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+guild_configs = GuildConfigCache()
+
+async def get_guild_config(guild_id: int):
+    """Récupère la configuration d'un serveur (dict partagé, ne pas modifier)"""
+    config = guild_configs.get(guild_id)
+    if config is not None:
+        return config
+    
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT * FROM guild_config WHERE guild_id = ?",
+            (guild_id,)
+        ) as cursor:
+            result = await cursor.fetchone()
+    
+    if not result:
+        # Créer une config par défaut
+        async with pool.write() as db:
+            await db.execute(
+                "INSERT OR IGNORE INTO guild_config (guild_id) VALUES (?)",
+                (guild_id,)
+            )
+            async with db.execute(
+                "SELECT * FROM guild_config WHERE guild_id = ?",
+                (guild_id,)
+            ) as cursor:
+                result = await cursor.fetchone()
+    
+    config = dict(result)
+    guild_configs.set(guild_id, config)
+    return config
+
+async def preload_guild_configs(guild_ids):
+    """Charge en une requête la configuration de tous les serveurs donnés"""
+    guild_ids = set(guild_ids)
+    async with pool.write() as db:
+        # Créer les configs par défaut manquantes
+        await db.executemany(
+            "INSERT OR IGNORE INTO guild_config (guild_id) VALUES (?)",
+            [(guild_id,) for guild_id in guild_ids]
+        )
+        async with db.execute("SELECT * FROM guild_config") as cursor:
+            rows = await cursor.fetchall()
+    
+    for row in rows:
+        if row['guild_id'] in guild_ids:
+            guild_configs.set(row['guild_id'], dict(row))
+    logger.info(f"{len(guild_ids)} configurations de serveur préchargées")
+
+async def update_guild_config(guild_id: int, **kwargs):
+    """Met à jour la configuration d'un serveur"""
+    async with pool.write() as db:
+        # S'assurer que le serveur existe
+        await db.execute(
+            "INSERT OR IGNORE INTO guild_config (guild_id) VALUES (?)",
+            (guild_id,)
+        )
+        
+        # Construire la requête de mise à jour
+        fields = ", ".join([f"{key} = ?" for key in kwargs.keys()])
+        values = list(kwargs.values()) + [guild_id]
+        
+        await db.execute(
+            f"UPDATE guild_config SET {fields} WHERE guild_id = ?",
+            values
+        )
+        
+        # Mettre le cache à jour avec la ligne écrite
+        async with db.execute(
+            "SELECT * FROM guild_config WHERE guild_id = ?",
+            (guild_id,)
+        ) as cursor:
+            result = await cursor.fetchone()
+    
+    guild_configs.set(guild_id, dict(result))
+
+async def apply_config_invalidations():
+    """Invalide les configs modifiées par un autre processus (dashboard)"""
+    async with pool.read() as db:
+        async with db.execute("SELECT guild_id FROM guild_config_invalidations") as cursor:
+            rows = await cursor.fetchall()
+    if not rows:
+        return 0
+    
+    async with pool.write() as db:
+        await db.executemany(
+            "DELETE FROM guild_config_invalidations WHERE guild_id = ?",
+            [(row['guild_id'],) for row in rows]
+        )
+    
+    for row in rows:
+        guild_configs.invalidate(row['guild_id'])
+        guild_link_rules.invalidate(row['guild_id'])
+        guild_automod_rules.invalidate(row['guild_id'])
+        guild_level_roles.invalidate(row['guild_id'])
+    return len(rows)
+
+# ===== RÈGLES D'AUTO-MODÉRATION =====
+guild_automod_rules = GuildConfigCache()
+
+async def get_automod_rules(guild_id: int):
+    """Règles d'auto-mod modifiées par un serveur {règle: valeur} (cache mémoire, ne pas modifier)"""
+    rules = guild_automod_rules.get(guild_id)
+    if rules is not None:
+        return rules
+    
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT rule, value FROM automod_rules WHERE guild_id = ?",
+            (guild_id,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+    
+    rules = {row['rule']: json.loads(row['value']) for row in rows}
+    guild_automod_rules.set(guild_id, rules)
+    return rules
+
+async def set_automod_rule(guild_id: int, rule: str, value):
+    """Modifie une règle d'auto-mod (None pour revenir à la valeur par défaut)"""
+    async with pool.write() as db:
+        if value is None:
+            await db.execute(
+                "DELETE FROM automod_rules WHERE guild_id = ? AND rule = ?",
+                (guild_id, rule)
+            )
+        else:
+            await db.execute("""
+                INSERT INTO automod_rules (guild_id, rule, value) VALUES (?, ?, ?)
+                ON CONFLICT(guild_id, rule) DO UPDATE SET value = excluded.value
+            """, (guild_id, rule, json.dumps(value)))
+    guild_automod_rules.invalidate(guild_id)
+
+# ===== RÔLES DE NIVEAU =====
+guild_level_roles = GuildConfigCache()
+
+async def get_level_roles(guild_id: int):
+    """Rôles de niveau d'un serveur ((niveau, role_id), ...) triés par niveau (cache mémoire)"""
+    roles = guild_level_roles.get(guild_id)
+    if roles is not None:
+        return roles
+    
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT level, role_id FROM level_roles WHERE guild_id = ? ORDER BY level",
+            (guild_id,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+    
+    roles = tuple((row['level'], row['role_id']) for row in rows)
+    guild_level_roles.set(guild_id, roles)
+    return roles
+
+async def set_level_role(guild_id: int, level: int, role_id: int = None):
+    """Associe un rôle à un niveau (None pour retirer l'association)"""
+    async with pool.write() as db:
+        if role_id is None:
+            await db.execute(
+                "DELETE FROM level_roles WHERE guild_id = ? AND level = ?",
+                (guild_id, level)
+            )
+        else:
+            await db.execute("""
+                INSERT INTO level_roles (guild_id, level, role_id) VALUES (?, ?, ?)
+                ON CONFLICT(guild_id, level) DO UPDATE SET role_id = excluded.role_id
+            """, (guild_id, level, role_id))
+    guild_level_roles.invalidate(guild_id)
+
+async def save_level_role_sync(guild_id: int, channel_id: int, last_user_id: int, processed: int, changed: int, failed: int):
+    """Point de reprise d'une synchronisation des rôles de niveau"""
+    async with pool.write() as db:
+        await db.execute("""
+            INSERT INTO level_role_syncs (guild_id, channel_id, last_user_id, processed, changed, failed)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(guild_id) DO UPDATE SET
+                channel_id = excluded.channel_id,
+                last_user_id = excluded.last_user_id,
+                processed = excluded.processed,
+                changed = excluded.changed,
+                failed = excluded.failed
+        """, (guild_id, channel_id, last_user_id, processed, changed, failed))
+
+async def get_level_role_syncs():
+    """Synchronisations interrompues à reprendre"""
+    async with pool.read() as db:
+        async with db.execute("SELECT * FROM level_role_syncs") as cursor:
+            return await cursor.fetchall()
+
+async def delete_level_role_sync(guild_id: int):
+    async with pool.write() as db:
+        await db.execute("DELETE FROM level_role_syncs WHERE guild_id = ?", (guild_id,))
+
+# ===== RÈGLES DE LIENS =====
+guild_link_rules = GuildConfigCache()
+
+async def get_link_rules(guild_id: int):
+    """Domaines autorisés et interdits d'un serveur {"allow": frozenset, "deny": frozenset} (cache mémoire)"""
+    rules = guild_link_rules.get(guild_id)
+    if rules is not None:
+        return rules
+    
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT domain, action FROM link_rules WHERE guild_id = ?",
+            (guild_id,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+    
+    rules = {
+        "allow": frozenset(row['domain'] for row in rows if row['action'] == "allow"),
+        "deny": frozenset(row['domain'] for row in rows if row['action'] == "deny"),
+    }
+    guild_link_rules.set(guild_id, rules)
+    return rules
+
+async def set_link_rule(guild_id: int, domain: str, action: str):
+    """Autorise ("allow") ou interdit ("deny") un domaine et ses sous-domaines"""
+    async with pool.write() as db:
+        await db.execute("""
+            INSERT INTO link_rules (guild_id, domain, action) VALUES (?, ?, ?)
+            ON CONFLICT(guild_id, domain) DO UPDATE SET action = excluded.action
+        """, (guild_id, domain, action))
+    guild_link_rules.invalidate(guild_id)
+
+async def remove_link_rule(guild_id: int, domain: str) -> bool:
+    """Retire un domaine des listes du serveur"""
+    async with pool.write() as db:
+        cursor = await db.execute(
+            "DELETE FROM link_rules WHERE guild_id = ? AND domain = ?",
+            (guild_id, domain)
+        )
+        removed = cursor.rowcount > 0
+    guild_link_rules.invalidate(guild_id)
+    return removed
+
+# ===== ACTIONS TEMPORAIRES =====
+async def add_temp_action(guild_id: int, user_id: int, action_type: str, moderator_id: int, expires_at: datetime, reason: str = None):
+    """Ajoute une action temporaire (tempban, tempmute) et retourne son id"""
+    async with pool.write() as db:
+        cursor = await db.execute(
+            "INSERT INTO temporary_actions (guild_id, user_id, action_type, moderator_id, expires_at, reason) VALUES (?, ?, ?, ?, ?, ?)",
+            (guild_id, user_id, action_type, moderator_id, expires_at, reason)
+        )
+        return cursor.lastrowid
+
+async def get_pending_actions():
+    """Récupère toutes les actions temporaires en attente (ordre de création)"""
+    async with pool.read() as db:
+        async with db.execute("SELECT * FROM temporary_actions ORDER BY id") as cursor:
+            return await cursor.fetchall()
+
+async def remove_temp_action(action_id: int):
+    """Supprime une action temporaire"""
+    async with pool.write() as db:
+        await db.execute(
+            "DELETE FROM temporary_actions WHERE id = ?",
+            (action_id,)
+        )
+
+async def get_user_temp_action(guild_id: int, user_id: int, action_type: str):
+    """Récupère une action temporaire spécifique pour un utilisateur"""
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT * FROM temporary_actions WHERE guild_id = ? AND user_id = ? AND action_type = ?",
+            (guild_id, user_id, action_type)
+        ) as cursor:
+            return await cursor.fetchone()
+
+async def send_mod_log(bot, guild_id: int, embed):
+    """Envoie un log de modération dans le canal configuré"""
+    try:
+        config = await get_guild_config(guild_id)
+        if not config or not config['log_channel_id']:
+            return  # Pas de canal de logs configuré
+        
+        import discord
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return
+        
+        log_channel = guild.get_channel(config['log_channel_id'])
+        if not log_channel:
+            return
+        
+        # Regrouper les embeds par salon quand le bot dispose du dispatcher
+        dispatcher = getattr(bot, "mod_logs", None)
+        if dispatcher:
+            dispatcher.submit(log_channel, embed)
+        else:
+            await log_channel.send(embed=embed)
+    except Exception as e:
+        logger.error(f"Erreur lors de l'envoi du log de modération: {e}")
+
+# ===== ANALYTICS =====
+def hour_bucket(timestamp: datetime) -> str:
+    """Tranche horaire d'un instant, clé des tables d'agrégats"""
+    return timestamp.strftime("%Y-%m-%d %H:00:00")
+
+def split_by_hour(start: datetime, end: datetime):
+    """Découpe un intervalle en [(tranche horaire, secondes)]"""
+    parts = []
+    current = start
+    while current < end:
+        next_hour = current.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        part_end = min(next_hour, end)
+        seconds = int((part_end - current).total_seconds())
+        if seconds > 0:
+            parts.append((hour_bucket(current), seconds))
+        current = part_end
+    return parts
+
+async def increment_message_count(guild_id: int, user_id: int):
+    """Incrémente le compteur de messages d'un utilisateur"""
+    now = datetime.now()
+    await record_message_batch(
+        [(guild_id, user_id, 1, now)],
+        [(guild_id, user_id, now)],
+        [(guild_id, user_id, hour_bucket(now), 1)]
+    )
+
+async def record_message_batch(stats: list, logs: list, rollups: list):
+    """
+    Écrit un lot de messages en une seule transaction
+    stats: [(guild_id, user_id, nombre, dernier_message)] déjà cumulés par utilisateur
+    logs: [(guild_id, user_id, timestamp)] un par message
+    rollups: [(guild_id, user_id, tranche_horaire, nombre)] cumulés par heure
+    Retourne [(guild_id, user_id, total)] : compteurs totaux après l'écriture
+    """
+    async with pool.write() as db:
+        # Incrémenter les compteurs totaux
+        await db.executemany("""
+            INSERT INTO message_stats (guild_id, user_id, message_count, last_message_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(guild_id, user_id) DO UPDATE SET
+                message_count = message_count + excluded.message_count,
+                last_message_at = excluded.last_message_at
+        """, stats)
+        
+        # Logger les timestamps (historique brut)
+        await db.executemany("""
+            INSERT INTO message_logs (guild_id, user_id, timestamp)
+            VALUES (?, ?, ?)
+        """, logs)
+        
+        # Incrémenter les agrégats horaires utilisés par les stats par période
+        await db.executemany("""
+            INSERT INTO message_rollups (guild_id, user_id, hour_bucket, message_count)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(guild_id, user_id, hour_bucket) DO UPDATE SET
+                message_count = message_count + excluded.message_count
+        """, rollups)
+        
+        # Relire les totaux dans la même transaction (pour les classements en mémoire)
+        totals = []
+        for i in range(0, len(stats), 400):
+            chunk = stats[i:i + 400]
+            async with db.execute(
+                f"SELECT guild_id, user_id, message_count FROM message_stats "
+                f"WHERE (guild_id, user_id) IN (VALUES {', '.join(['(?, ?)'] * len(chunk))})",
+                [value for guild_id, user_id, _, _ in chunk for value in (guild_id, user_id)]
+            ) as cursor:
+                totals.extend(tuple(row) for row in await cursor.fetchall())
+    return totals
+
+async def log_activity(guild_id: int, user_id: int, activity_type: str):
+    """Enregistre une activité utilisateur"""
+    async with pool.write() as db:
+        await db.execute(
+            "INSERT INTO activity_logs (guild_id, user_id, activity_type) VALUES (?, ?, ?)",
+            (guild_id, user_id, activity_type)
+        )
+
+async def get_user_stats(guild_id: int, user_id: int):
+    """Récupère les statistiques d'un utilisateur"""
+    async with pool.read() as db:
+        async with db.execute(
+            "SELECT * FROM message_stats WHERE guild_id = ? AND user_id = ?",
+            (guild_id, user_id)
+        ) as cursor:
+            return await cursor.fetchone()
+
+async def get_activity_board(guild_id: int, limit: int):
+    """Top du classement d'activité [(user_id, messages, None)], lu sous le verrou d'écriture"""
+    query, params = _board_query("message_stats", "message_count", "NULL", guild_id, None, limit)
+    async with pool.write() as db:
+        async with db.execute(query, params) as cursor:
+            return [tuple(row) for row in await cursor.fetchall()]
+
+async def get_activity_board_after(guild_id: int, after, limit: int):
+    """Suite du classement d'activité après le curseur (messages, user_id)"""
+    query, params = _board_query("message_stats", "message_count", "NULL", guild_id, after, limit)
+    async with pool.read() as db:
+        async with db.execute(query, params) as cursor:
+            return [tuple(row) for row in await cursor.fetchall()]
+
+# ===== VOICE SESSIONS =====
+async def log_voice_join(guild_id: int, user_id: int):
+    """Enregistre l'entrée d'un utilisateur dans un canal vocal"""
+    async with pool.write() as db:
+        await db.execute("""
+            INSERT INTO voice_sessions (guild_id, user_id, join_time)
+            VALUES (?, ?, ?)
+        """, (guild_id, user_id, datetime.now()))
+
+async def log_voice_leave(guild_id: int, user_id: int):
+    """Enregistre la sortie d'un utilisateur d'un canal vocal (retourne les agrégats ajoutés)"""
+    async with pool.write() as db:
+        # Trouver la dernière session ouverte (sans leave_time)
+        async with db.execute("""
+            SELECT id, join_time FROM voice_sessions 
+            WHERE guild_id = ? AND user_id = ? AND leave_time IS NULL
+            ORDER BY join_time DESC LIMIT 1
+        """, (guild_id, user_id)) as cursor:
+            session = await cursor.fetchone()
+        
+        if session:
+            leave_time = datetime.now()
+            join_time = datetime.fromisoformat(session[1])
+            duration = int((leave_time - join_time).total_seconds())
+            
+            await db.execute("""
+                UPDATE voice_sessions 
+                SET leave_time = ?, duration_seconds = ?
+                WHERE id = ?
+            """, (leave_time, duration, session[0]))
+            
+            # Répartir la session sur les tranches horaires traversées
+            rollups = [(guild_id, user_id, bucket, seconds) for bucket, seconds in split_by_hour(join_time, leave_time)]
+            await db.executemany("""
+                INSERT INTO voice_rollups (guild_id, user_id, hour_bucket, voice_seconds)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(guild_id, user_id, hour_bucket) DO UPDATE SET
+                    voice_seconds = voice_seconds + excluded.voice_seconds
+            """, rollups)
+            return rollups
+    return []
+
+# ===== STATS PAR PÉRIODE (AGRÉGATS HORAIRES) =====
+def _cutoff_bucket(hours: int) -> str:
+    """Première tranche horaire incluse dans une période (précision à l'heure)"""
+    return hour_bucket(datetime.now() - timedelta(hours=hours))
+
+async def get_voice_time(guild_id: int, user_id: int, hours: int = None):
+    """
+    Calcule le temps vocal d'un utilisateur
+    hours: None pour total, 24 pour 24h, 168 pour 7 jours
+    """
+    async with pool.read() as db:
+        if hours is None:
+            # Temps total
+            async with db.execute("""
+                SELECT SUM(voice_seconds) FROM voice_rollups
+                WHERE guild_id = ? AND user_id = ?
+            """, (guild_id, user_id)) as cursor:
+                result = await cursor.fetchone()
+                return result[0] or 0
+        else:
+            # Temps sur une période
+            async with db.execute("""
+                SELECT SUM(voice_seconds) FROM voice_rollups
+                WHERE guild_id = ? AND user_id = ? AND hour_bucket >= ?
+            """, (guild_id, user_id, _cutoff_bucket(hours))) as cursor:
+                result = await cursor.fetchone()
+                return result[0] or 0
+
+async def get_message_count_period(guild_id: int, user_id: int, hours: int):
+    """
+    Compte les messages d'un utilisateur sur une période
+    hours: 24 pour 24h, 168 pour 7 jours
+    """
+    async with pool.read() as db:
+        async with db.execute("""
+            SELECT SUM(message_count) FROM message_rollups
+            WHERE guild_id = ? AND user_id = ? AND hour_bucket >= ?
+        """, (guild_id, user_id, _cutoff_bucket(hours))) as cursor:
+            result = await cursor.fetchone()
+            return result[0] or 0
+
+async def get_voice_leaderboard_7d(guild_id: int, limit: int = 10):
+    """Récupère le classement vocal sur 7 jours"""
+    async with pool.read() as db:
+        async with db.execute(f"""
+            SELECT user_id, SUM(voice_seconds) as total_seconds
+            FROM voice_rollups
+            WHERE guild_id = ? AND hour_bucket >= ? AND {_present("voice_rollups")}
+            GROUP BY user_id
+            ORDER BY total_seconds DESC
+            LIMIT ?
+        """, (guild_id, _cutoff_bucket(168), limit)) as cursor:
+            return await cursor.fetchall()
+
+async def get_message_leaderboard_7d(guild_id: int, limit: int = 10):
+    """Récupère le classement messages sur 7 jours"""
+    async with pool.read() as db:
+        async with db.execute(f"""
+            SELECT user_id, SUM(message_count) as message_count
+            FROM message_rollups
+            WHERE guild_id = ? AND hour_bucket >= ? AND {_present("message_rollups")}
+            GROUP BY user_id
+            ORDER BY message_count DESC
+            LIMIT ?
+        """, (guild_id, _cutoff_bucket(168), limit)) as cursor:
+            return await cursor.fetchall()
+
+async def _get_rollup_rank_7d(table: str, column: str, guild_id: int, user_id: int):
+    """Rang d'un utilisateur sur 7 jours dans une table d'agrégats"""
+    cutoff = _cutoff_bucket(168)
+    async with pool.read() as db:
+        # Obtenir le total de l'utilisateur
+        async with db.execute(f"""
+            SELECT SUM({column}) FROM {table}
+            WHERE guild_id = ? AND user_id = ? AND hour_bucket >= ?
+        """, (guild_id, user_id, cutoff)) as cursor:
+            user_result = await cursor.fetchone()
+            user_total = user_result[0] or 0
+        
+        # Compter les utilisateurs actifs et ceux qui ont un total supérieur
+        async with db.execute(f"""
+            SELECT COUNT(*), SUM(total > ?)
+            FROM (
+                SELECT SUM({column}) as total
+                FROM {table}
+                WHERE guild_id = ? AND hour_bucket >= ? AND {_present(table)}
+                GROUP BY user_id
+            )
+        """, (user_total, guild_id, cutoff)) as cursor:
+            total, above = await cursor.fetchone()
+        
+        return (above or 0) + 1, total or 0
+
+async def get_user_voice_rank_7d(guild_id: int, user_id: int):
+    """Récupère le rang vocal d'un utilisateur sur 7 jours"""
+    return await _get_rollup_rank_7d("voice_rollups", "voice_seconds", guild_id, user_id)
+
+async def get_user_message_rank_7d(guild_id: int, user_id: int):
+    """Récupère le rang messages d'un utilisateur sur 7 jours"""
+    return await _get_rollup_rank_7d("message_rollups", "message_count", guild_id, user_id)
+
+# Cache court des instantanés d'activité : {(guild_id, user_id, avec_rangs): (expiration, instantané)}
+_activity_snapshots = {}
+ACTIVITY_SNAPSHOT_CACHE_SIZE = 4096
+
+async def get_user_activity_snapshot(guild_id: int, user_id: int, with_ranks: bool = True, ttl: float = 0):
+    """
+    Récupère en une fois toutes les statistiques d'activité d'un utilisateur (/stats)
+    Une requête pour les totaux, une seconde pour les rangs 7 jours (si with_ranks).
+    ttl: durée en secondes pendant laquelle le résultat peut être resservi (0 = pas de cache)
+    """
+    key = (guild_id, user_id, with_ranks)
+    now = time.monotonic()
+    if ttl > 0:
+        cached = _activity_snapshots.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+    
+    params = {
+        "guild_id": guild_id,
+        "user_id": user_id,
+        "cutoff_24h": _cutoff_bucket(24),
+        "cutoff_7d": _cutoff_bucket(168),
+    }
+    async with pool.read() as db:
+        # Totaux : agrégation conditionnelle sur les tables d'agrégats
+        async with db.execute("""
+            WITH messages AS (
+                SELECT
+                    COALESCE(SUM(CASE WHEN hour_bucket >= :cutoff_24h THEN message_count END), 0) AS messages_24h,
+                    COALESCE(SUM(message_count), 0) AS messages_7d
+                FROM message_rollups
+                WHERE guild_id = :guild_id AND user_id = :user_id AND hour_bucket >= :cutoff_7d
+            ),
+            voice AS (
+                SELECT
+                    COALESCE(SUM(voice_seconds), 0) AS voice_total,
+                    COALESCE(SUM(CASE WHEN hour_bucket >= :cutoff_24h THEN voice_seconds END), 0) AS voice_24h,
+                    COALESCE(SUM(CASE WHEN hour_bucket >= :cutoff_7d THEN voice_seconds END), 0) AS voice_7d
+                FROM voice_rollups
+                WHERE guild_id = :guild_id AND user_id = :user_id
+            )
+            SELECT
+                COALESCE(stats.message_count, 0) AS message_count,
+                stats.last_message_at AS last_message_at,
+                messages.messages_24h, messages.messages_7d,
+                voice.voice_total, voice.voice_24h, voice.voice_7d
+            FROM messages CROSS JOIN voice
+            LEFT JOIN message_stats AS stats
+                ON stats.guild_id = :guild_id AND stats.user_id = :user_id
+        """, params) as cursor:
+            snapshot = dict(await cursor.fetchone())
+        
+        if with_ranks:
+            # Rangs : utilisateurs actifs et utilisateurs devant (membres présents), pour les deux métriques
+            params["messages_7d"] = snapshot["messages_7d"]
+            params["voice_7d"] = snapshot["voice_7d"]
+            async with db.execute(f"""
+                WITH messages AS (
+                    SELECT SUM(message_count) AS total FROM message_rollups
+                    WHERE guild_id = :guild_id AND hour_bucket >= :cutoff_7d AND {_present("message_rollups")}
+                    GROUP BY user_id
+                ),
+                voice AS (
+                    SELECT SUM(voice_seconds) AS total FROM voice_rollups
+                    WHERE guild_id = :guild_id AND hour_bucket >= :cutoff_7d AND {_present("voice_rollups")}
+                    GROUP BY user_id
+                )
+                SELECT
+                    (SELECT COUNT(*) FROM messages),
+                    (SELECT COUNT(*) FROM messages WHERE total > :messages_7d),
+                    (SELECT COUNT(*) FROM voice),
+                    (SELECT COUNT(*) FROM voice WHERE total > :voice_7d)
+            """, params) as cursor:
+                message_users, message_above, voice_users, voice_above = await cursor.fetchone()
+            snapshot["message_rank"] = (message_above + 1, message_users)
+            snapshot["voice_rank"] = (voice_above + 1, voice_users)
+    
+    if ttl > 0:
+        if len(_activity_snapshots) >= ACTIVITY_SNAPSHOT_CACHE_SIZE:
+            # Retirer les entrées expirées, sinon repartir de zéro
+            for expired in [k for k, (expires, _) in _activity_snapshots.items() if expires <= now]:
+                del _activity_snapshots[expired]
+            if len(_activity_snapshots) >= ACTIVITY_SNAPSHOT_CACHE_SIZE:
+                _activity_snapshots.clear()
+        _activity_snapshots[key] = (now + ttl, snapshot)
+    return snapshot
+
+async def iter_activity_rollups(hours: int, on_snapshot=None):
+    """
+    Parcourt les agrégats messages et vocaux d'une période
+    Produit (métrique, guild_id, user_id, hour_bucket, quantité) des membres présents, lus sur un
+    lecteur figé : les écritures continuent pendant le parcours. on_snapshot est appelé au moment
+    où l'état lu est fixé ; les lots écrits ensuite n'apparaissent pas dans le parcours.
+    """
+    cutoff = _cutoff_bucket(hours)
+    async with pool.snapshot(on_snapshot) as db:
+        for metric, table, column in (
+            ("messages", "message_rollups", "message_count"),
+            ("voice", "voice_rollups", "voice_seconds"),
+        ):
+            async with db.execute(f"""
+                SELECT guild_id, user_id, hour_bucket, {column} FROM {table}
+                WHERE hour_bucket >= ? AND {_present(table)}
+            """, (cutoff,)) as cursor:
+                async for row in cursor:
+                    yield (metric, *row)
+
+async def get_user_rollups(guild_id: int, user_id: int, hours: int, on_snapshot=None):
+    """
+    Agrégats d'un utilisateur sur une période [(métrique, hour_bucket, quantité)]
+    Lus sur un lecteur figé, comme iter_activity_rollups
+    """
+    cutoff = _cutoff_bucket(hours)
+    async with pool.snapshot(on_snapshot) as db:
+        async with db.execute("""
+            SELECT 'messages', hour_bucket, message_count FROM message_rollups
+            WHERE guild_id = ? AND user_id = ? AND hour_bucket >= ?
+            UNION ALL
+            SELECT 'voice', hour_bucket, voice_seconds FROM voice_rollups
+            WHERE guild_id = ? AND user_id = ? AND hour_bucket >= ?
+        """, (guild_id, user_id, cutoff) * 2) as cursor:
+            return [tuple(row) for row in await cursor.fetchall()]
+
+async def backfill_rollups():
+    """Reconstruit les agrégats horaires à partir de message_logs et voice_sessions"""
+    async with pool.write() as db:
+        # Messages : une seule requête d'agrégation
+        await db.execute("DELETE FROM message_rollups")
+        await db.execute("""
+            INSERT INTO message_rollups (guild_id, user_id, hour_bucket, message_count)
+            SELECT guild_id, user_id, strftime('%Y-%m-%d %H:00:00', timestamp), COUNT(*)
+            FROM message_logs
+            GROUP BY guild_id, user_id, strftime('%Y-%m-%d %H:00:00', timestamp)
+        """)
+        async with db.execute("SELECT COUNT(*) FROM message_rollups") as cursor:
+            message_rows = (await cursor.fetchone())[0]
+        
+        # Vocal : les sessions sont réparties heure par heure
+        voice = {}
+        async with db.execute("""
+            SELECT guild_id, user_id, join_time, leave_time FROM voice_sessions
+            WHERE leave_time IS NOT NULL
+        """) as cursor:
+            async for row in cursor:
+                join_time = datetime.fromisoformat(row['join_time'])
+                leave_time = datetime.fromisoformat(row['leave_time'])
+                for bucket, seconds in split_by_hour(join_time, leave_time):
+                    key = (row['guild_id'], row['user_id'], bucket)
+                    voice[key] = voice.get(key, 0) + seconds
+        
+        await db.execute("DELETE FROM voice_rollups")
+        await db.executemany(
+            "INSERT INTO voice_rollups (guild_id, user_id, hour_bucket, voice_seconds) VALUES (?, ?, ?, ?)",
+            [(*key, seconds) for key, seconds in voice.items()]
+        )
+    
+    logger.info(f"Agrégats reconstruits: {message_rows} tranches messages, {len(voice)} tranches vocales")
+    return message_rows, len(voice)
@@ -0,0 +1,159 @@
+"""
+Détection de flood coordonné - Messages quasi identiques de plusieurs comptes dans un salon
+"""
+
+import re
+import time
+from collections import deque
+
+SKETCH_SIZE = 16  # plus petites empreintes gardées par message (MinHash bottom-k)
+BAND_SIZE = 4  # empreintes servant de clés d'index (candidats)
+MIN_LENGTH = 20  # texte normalisé minimal (ignore "gg", "lol"...)
+MIN_WORDS = 3
+MAX_ENTRIES_PER_CHANNEL = 500
+
+_NORMALIZE = re.compile(r"[\W_]+")
+
+def fingerprint(content: str):
+    """Empreinte MinHash (bottom-k) des paires de mots du texte normalisé, ou None si trop court"""
+    text = _NORMALIZE.sub(" ", content.lower())
+    words = text.split()
+    if len(text) < MIN_LENGTH or len(words) < MIN_WORDS:
+        return None
+    hashes = sorted({hash(pair) for pair in zip(words, words[1:])})
+    return tuple(hashes[:SKETCH_SIZE])
+
+def similarity(a: tuple, b: tuple) -> float:
+    """Estimation de Jaccard entre deux empreintes bottom-k"""
+    union = sorted(set(a) | set(b))[:SKETCH_SIZE]
+    shared = set(a) & set(b)
+    return sum(1 for value in union if value in shared) / len(union)
+
+class _Entry:
+    __slots__ = ("time", "message_id", "author_id", "sketch", "flagged")
+
+    def __init__(self, now: float, message_id: int, author_id: int, sketch: tuple):
+        self.time = now
+        self.message_id = message_id
+        self.author_id = author_id
+        self.sketch = sketch
+        self.flagged = False
+
+class _Cluster:
+    """Signature d'un flood signalé : empreintes du groupe détecté, gardées tant qu'il se poursuit"""
+    __slots__ = ("sketches", "last")
+
+    def __init__(self, now: float, sketches: list):
+        self.sketches = sketches
+        self.last = now
+
+    def matches(self, sketch: tuple, threshold: float) -> bool:
+        return any(similarity(sketch, other) >= threshold for other in self.sketches)
+
+class _ChannelIndex:
+    """Messages récents d'un salon, indexés par leurs plus petites empreintes"""
+    __slots__ = ("entries", "buckets", "clusters")
+
+    def __init__(self):
+        self.entries = deque()
+        self.buckets = {}  # empreinte -> deque d'entrées (ordre d'arrivée)
+        self.clusters = []  # floods signalés encore actifs sur la fenêtre
+
+    def expire(self, horizon: float):
+        if self.clusters:
+            self.clusters = [cluster for cluster in self.clusters if cluster.last > horizon]
+        while self.entries and (self.entries[0].time <= horizon or len(self.entries) > MAX_ENTRIES_PER_CHANNEL):
+            entry = self.entries.popleft()
+            # L'entrée est la plus ancienne de chacun de ses seaux
+            for key in entry.sketch[:BAND_SIZE]:
+                bucket = self.buckets.get(key)
+                if bucket and bucket[0] is entry:
+                    bucket.popleft()
+                    if not bucket:
+                        del self.buckets[key]
+
+class FloodDetector:
+    """Signale N messages quasi identiques de M auteurs distincts sur une fenêtre glissante"""
+
+    def __init__(self, min_messages: int, min_authors: int, window: float, threshold: float = 0.6):
+        self.min_messages = min_messages
+        self.min_authors = min_authors
+        self.window = window
+        self.threshold = threshold
+        self._channels = {}  # channel_id -> _ChannelIndex
+        self.detections = 0
+        self.follow_ups = 0
+
+    def check(self, channel_id: int, message_id: int, author_id: int, content: str):
+        """
+        Enregistre un message ; si un flood est détecté, retourne ([(author_id, message_id)], suite)
+        des messages en cause (qui ne seront plus signalés), sinon None. La signature d'un flood
+        signalé reste active sur la fenêtre : un message qui lui ressemble est signalé aussitôt
+        (suite=True), avec les messages proches pas encore signalés.
+        """
+        sketch = fingerprint(content)
+        if sketch is None:
+            return None
+
+        now = time.monotonic()
+        index = self._channels.get(channel_id)
+        if index is None:
+            index = self._channels[channel_id] = _ChannelIndex()
+        index.expire(now - self.window)
+
+        entry = _Entry(now, message_id, author_id, sketch)
+
+        # Candidats : messages partageant au moins une des plus petites empreintes
+        candidates = {}
+        for key in sketch[:BAND_SIZE]:
+            for other in index.buckets.get(key, ()):
+                if not other.flagged:
+                    candidates[id(other)] = other
+
+        matches = [other for other in candidates.values() if similarity(sketch, other.sketch) >= self.threshold]
+
+        index.entries.append(entry)
+        for key in sketch[:BAND_SIZE]:
+            index.buckets.setdefault(key, deque()).append(entry)
+
+        # Suite d'un flood déjà signalé : pas besoin d'un nouveau groupe complet
+        cluster = next((cluster for cluster in index.clusters if cluster.matches(sketch, self.threshold)), None)
+        if cluster is not None:
+            cluster.last = now
+            matches.append(entry)
+            for match in matches:
+                match.flagged = True
+            self.follow_ups += 1
+            return [(match.author_id, match.message_id) for match in sorted(matches, key=lambda m: m.time)], True
+
+        if len(matches) + 1 < self.min_messages:
+            return None
+        matches.append(entry)
+        if len({match.author_id for match in matches}) < self.min_authors:
+            return None
+
+        for match in matches:
+            match.flagged = True
+        index.clusters.append(_Cluster(now, [match.sketch for match in matches]))
+        self.detections += 1
+        return [(match.author_id, match.message_id) for match in sorted(matches, key=lambda m: m.time)], False
+
+    def sweep(self) -> int:
+        """Retire les salons sans message récent"""
+        horizon = time.monotonic() - self.window
+        idle = []
+        for channel_id, index in self._channels.items():
+            index.expire(horizon)
+            if not index.entries:
+                idle.append(channel_id)
+        for channel_id in idle:
+            del self._channels[channel_id]
+        return len(idle)
+
+    def stats(self) -> dict:
+        return {
+            "channels": len(self._channels),
+            "messages": sum(len(index.entries) for index in self._channels.values()),
+            "detections": self.detections,
+            "follow_ups": self.follow_ups,
+        }
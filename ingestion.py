@@ -0,0 +1,165 @@
+"""
+File d'ingestion des messages - Écriture différée et commit groupé des statistiques
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+import database
+
+logger = logging.getLogger(__name__)
+
+class MessageIngestor:
+    """Accumule les messages en mémoire et les écrit par lots dans une seule transaction"""
+
+    def __init__(self, flush_interval: float = 2.0, batch_size: int = 500, max_queue: int = 10000):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        # File bornée : quand elle est pleine, submit() attend (backpressure)
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self._task = None
+        # Fonctions synchrones appelées avec (agrégats horaires, totaux par utilisateur) de chaque lot écrit
+        self.listeners = []
+        self.metrics = {
+            "received": 0,
+            "flushed": 0,
+            "failed": 0,
+            "flushes": 0,
+            "backpressure": 0,
+            "max_depth": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    def start(self):
+        """Démarre la tâche d'écriture en arrière-plan"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def submit(self, guild_id: int, user_id: int):
+        """Ajoute un message à la file d'ingestion"""
+        if self.queue.full():
+            self.metrics["backpressure"] += 1
+        await self.queue.put((guild_id, user_id, datetime.now()))
+        self.metrics["received"] += 1
+        depth = self.queue.qsize()
+        if depth > self.metrics["max_depth"]:
+            self.metrics["max_depth"] = depth
+
+    async def close(self, timeout: float = 10.0):
+        """Vide la file puis arrête la tâche d'écriture"""
+        if self._task is None or self._task.done():
+            await self._flush(self._drain())
+            return
+
+        # Le marqueur de fin est traité après tous les messages déjà en file
+        await self.queue.put(None)
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.error("Ingestion: arrêt trop long, vidage forcé de la file")
+            self._task.cancel()
+            await self._flush(self._drain())
+        self._task = None
+
+    def _drain(self) -> list:
+        """Retire immédiatement tout ce qui reste dans la file"""
+        items = []
+        while not self.queue.empty():
+            item = self.queue.get_nowait()
+            if item is not None:
+                items.append(item)
+        return items
+
+    async def _run(self):
+        """Boucle d'écriture : un lot toutes les N ms ou tous les M messages"""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            first = await self.queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                # Récupérer sans attendre ce qui est déjà disponible
+                while len(batch) < self.batch_size and not self.queue.empty():
+                    item = self.queue.get_nowait()
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+
+                remaining = deadline - loop.time()
+                if stopping or len(batch) >= self.batch_size or remaining <= 0:
+                    break
+
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+    async def _flush(self, batch: list):
+        """Regroupe le lot par (serveur, utilisateur) et l'écrit en une transaction"""
+        if not batch:
+            return
+
+        start = time.perf_counter()
+
+        # Cumuler les incréments par utilisateur et par tranche horaire
+        counters = {}
+        hourly = {}
+        for guild_id, user_id, timestamp in batch:
+            key = (guild_id, user_id)
+            entry = counters.get(key)
+            if entry:
+                entry[0] += 1
+                entry[1] = timestamp
+            else:
+                counters[key] = [1, timestamp]
+
+            bucket_key = (guild_id, user_id, database.hour_bucket(timestamp))
+            hourly[bucket_key] = hourly.get(bucket_key, 0) + 1
+
+        stats = [(guild_id, user_id, count, last) for (guild_id, user_id), (count, last) in counters.items()]
+        rollups = [(*key, count) for key, count in hourly.items()]
+
+        try:
+            totals = await database.record_message_batch(stats, batch, rollups)
+        except Exception as e:
+            self.metrics["failed"] += len(batch)
+            logger.error(f"Ingestion: échec de l'écriture d'un lot de {len(batch)} messages: {e}")
+        else:
+            self.metrics["flushed"] += len(batch)
+            # Sans await entre l'écriture et les listeners : l'ordre est garanti
+            for listener in self.listeners:
+                try:
+                    listener(rollups, totals)
+                except Exception as e:
+                    logger.error(f"Ingestion: erreur dans un listener: {e}")
+
+        elapsed = (time.perf_counter() - start) * 1000
+        self.metrics["flushes"] += 1
+        self.metrics["last_flush_ms"] = elapsed
+        self.metrics["total_flush_ms"] += elapsed
+        self.metrics["max_flush_ms"] = max(self.metrics["max_flush_ms"], elapsed)
+
+    def stats(self) -> dict:
+        """Profondeur de file et latence des écritures"""
+        flushes = self.metrics["flushes"] or 1
+        return {
+            **self.metrics,
+            "depth": self.queue.qsize(),
+            "avg_flush_ms": self.metrics["total_flush_ms"] / flushes,
+        }
@@ -0,0 +1,189 @@
+"""
+Classements en mémoire - Top-K par serveur tenu à jour par les écritures, pages par curseur
+"""
+
+import bisect
+import discord
+from config import Emojis
+
+class _GuildBoard:
+    """Meilleurs scores connus d'un serveur : préfixe exact du classement complet"""
+    __slots__ = ("entries", "scores", "extra", "complete")
+
+    def __init__(self, rows, complete: bool):
+        self.entries = sorted((-score, user_id) for user_id, score, _ in rows)  # meilleur en tête
+        self.scores = {user_id: score for user_id, score, _ in rows}
+        self.extra = {user_id: extra for user_id, _, extra in rows}
+        self.complete = complete  # tous les membres classés du serveur sont présents
+
+    def remove(self, user_id: int):
+        score = self.scores.pop(user_id)
+        del self.entries[bisect.bisect_left(self.entries, (-score, user_id))]
+        self.extra.pop(user_id, None)
+
+    def insert(self, user_id: int, score: int, extra):
+        self.scores[user_id] = score
+        self.extra[user_id] = extra
+        bisect.insort(self.entries, (-score, user_id))
+
+class TopKCache:
+    """
+    Top-K par serveur (membres présents), surdimensionné pour absorber les départs.
+    Invariant : tout utilisateur absent a un score inférieur ou égal au dernier présent,
+    donc les entrées forment toujours le début exact du classement.
+    loader(guild_id, limit) -> [(user_id, score, extra)] triés, lu sans écriture concurrente ;
+    fetch_after(guild_id, (score, user_id) | None, limit) -> suite du classement en base (curseur).
+    """
+
+    def __init__(self, capacity: int, loader, fetch_after, present=None):
+        self.capacity = capacity
+        self.loader = loader
+        self.fetch_after = fetch_after
+        self.present = present  # present(guild_id, user_id) : membres partis ignorés par update()
+        self._boards = {}  # guild_id -> _GuildBoard
+        self.metrics = {"hits": 0, "rebuilds": 0, "fallbacks": 0, "updates": 0}
+
+    def invalidate(self, guild_id: int):
+        """Oublie le classement d'un serveur (reconstruit à la prochaine lecture)"""
+        self._boards.pop(guild_id, None)
+
+    def discard(self, guild_id: int, user_id: int):
+        """Retire un membre parti : les suivants remontent, le préfixe reste exact"""
+        board = self._boards.get(guild_id)
+        if board is None or user_id not in board.scores:
+            return
+        board.remove(user_id)
+        if not board.complete and len(board.entries) < self.capacity // 2:
+            self.invalidate(guild_id)
+
+    def update(self, guild_id: int, user_id: int, score: int, extra=None):
+        """Nouveau score absolu d'un utilisateur (appelé juste après son écriture en base)"""
+        board = self._boards.get(guild_id)
+        if board is None:
+            return
+        if self.present is not None and not self.present(guild_id, user_id):
+            # Écriture arrivée après le départ : le membre ne doit pas revenir dans le classement
+            self.discard(guild_id, user_id)
+            return
+        self.metrics["updates"] += 1
+        if user_id in board.scores:
+            board.remove(user_id)
+        elif not board.complete and board.entries and (-score, user_id) > board.entries[-1]:
+            return  # Reste hors du top connu
+
+        if board.complete or not board.entries or (-score, user_id) < board.entries[-1]:
+            board.insert(user_id, score, extra)
+        # Sinon (score en baisse sous le dernier connu) : l'entrée sort, le préfixe reste exact
+
+        if len(board.entries) > self.capacity:
+            _, last_user = board.entries[-1]
+            board.remove(last_user)
+            board.complete = False
+        elif not board.complete and len(board.entries) < self.capacity // 2:
+            # Trop d'entrées perdues : reconstruire à la prochaine lecture
+            self.invalidate(guild_id)
+
+    async def _board(self, guild_id: int) -> _GuildBoard:
+        board = self._boards.get(guild_id)
+        if board is not None:
+            self.metrics["hits"] += 1
+            return board
+        rows = await self.loader(guild_id, self.capacity)
+        # Aucune attente entre la lecture et l'installation : aucune mise à jour perdue
+        board = self._boards[guild_id] = _GuildBoard(rows, complete=len(rows) < self.capacity)
+        self.metrics["rebuilds"] += 1
+        return board
+
+    async def page(self, guild_id: int, limit: int, cursor: tuple = None):
+        """
+        Une page du classement : ([(rang, user_id, score, extra)], curseur suivant ou None)
+        curseur = (score, user_id, rang) du dernier affiché
+        """
+        board = await self._board(guild_id)
+        rows = []
+        rank = cursor[2] if cursor else 0
+        last = (cursor[0], cursor[1]) if cursor else None
+        start = bisect.bisect_right(board.entries, (-last[0], last[1])) if last else 0
+
+        # limit + 1 lignes : la dernière indique seulement qu'une page suivante existe
+        for negative_score, user_id in board.entries[start:start + limit + 1]:
+            rank += 1
+            last = (-negative_score, user_id)
+            rows.append((rank, user_id, -negative_score, board.extra.get(user_id)))
+
+        # Top en mémoire épuisé : suite lue en base après la dernière ligne vue
+        if len(rows) <= limit and not board.complete:
+            self.metrics["fallbacks"] += 1
+            fetched = await self.fetch_after(guild_id, last, limit + 1 - len(rows))
+            for user_id, score, extra in fetched:
+                rank += 1
+                rows.append((rank, user_id, score, extra))
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            rank, user_id, score, _ = rows[-1]
+            return rows, (score, user_id, rank)
+        return rows, None
+
+    def stats(self) -> dict:
+        return {
+            "guilds": len(self._boards),
+            "entries": sum(len(board.entries) for board in self._boards.values()),
+            **self.metrics,
+        }
+
+def guild_member_check(bot):
+    """present(guild_id, user_id) d'après le cache du gateway (vrai si les membres ne sont pas chargés)"""
+    def present(guild_id: int, user_id: int) -> bool:
+        guild = bot.get_guild(guild_id)
+        return guild is None or not guild.chunked or guild.get_member(user_id) is not None
+    return present
+
+class LeaderboardView(discord.ui.View):
+    """Navigation dans un classement : pages servies par le cache, curseurs gardés en pile"""
+
+    def __init__(self, board: TopKCache, guild: discord.Guild, author_id: int, limit: int, render, next_cursor):
+        super().__init__(timeout=180)
+        self.board = board
+        self.guild = guild
+        self.author_id = author_id
+        self.limit = limit
+        self.render = render  # render(rows, page) -> discord.Embed
+        self.cursors = [None]  # curseur de départ de chaque page affichée
+        self.next_cursor = next_cursor
+        self._update_buttons()
+
+    def _update_buttons(self):
+        self.previous_button.disabled = len(self.cursors) <= 1
+        self.next_button.disabled = self.next_cursor is None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Vérifier que seul l'auteur peut utiliser les boutons"""
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(
+                f"{Emojis.ERROR} Seul l'auteur de la commande peut utiliser ces boutons.",
+                ephemeral=True
+            )
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction):
+        rows, self.next_cursor = await self.board.page(
+            self.guild.id, self.limit, cursor=self.cursors[-1]
+        )
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.render(rows, len(self.cursors)), view=self)
+
+    @discord.ui.button(label="◀️ Précédent", style=discord.ButtonStyle.gray)
+    async def previous_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Aller à la page précédente"""
+        if len(self.cursors) > 1:
+            self.cursors.pop()
+        await self._show(interaction)
+
+    @discord.ui.button(label="▶️ Suivant", style=discord.ButtonStyle.gray)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Aller à la page suivante"""
+        if self.next_cursor is not None:
+            self.cursors.append(self.next_cursor)
+        await self._show(interaction)
@@ -0,0 +1,107 @@
+"""
+Rôles de niveau - Calcul des différences et synchronisation reprenable d'un serveur
+"""
+
+import asyncio
+import logging
+import discord
+import database
+
+logger = logging.getLogger(__name__)
+
+def expected_roles(mapping, level: int) -> set:
+    """Rôles qu'un membre de ce niveau doit avoir (cumulés : tous les paliers atteints)"""
+    return {role_id for required, role_id in mapping if required <= level}
+
+def role_changes(mapping, level: int, current_ids) -> tuple:
+    """(rôles à ajouter, rôles à retirer) parmi les rôles de niveau uniquement"""
+    managed = {role_id for _, role_id in mapping}
+    expected = expected_roles(mapping, level)
+    current = managed.intersection(current_ids)
+    return expected - current, current - expected
+
+def assignable_mapping(guild: discord.Guild, mapping) -> tuple:
+    """Associations dont le bot peut gérer le rôle (existant, non géré, sous son rôle le plus haut)"""
+    top_role = guild.me.top_role
+    usable = []
+    for level, role_id in mapping:
+        role = guild.get_role(role_id)
+        if role and not role.managed and role < top_role:
+            usable.append((level, role_id))
+    return tuple(usable)
+
+async def apply_role_changes(member: discord.Member, add: set, remove: set, reason: str):
+    """Une seule requête par membre : la liste complète de ses rôles, corrigée"""
+    roles = [role for role in member.roles if not role.is_default() and role.id not in remove]
+    roles.extend(role for role_id in add if (role := member.guild.get_role(role_id)) is not None)
+    await member.edit(roles=roles, reason=reason)
+
+class LevelRoleSync:
+    """
+    Compare les rôles de niveau attendus de chaque membre (cache du gateway) à ses rôles
+    actuels et n'envoie que les différences, par lots triés par ID avec point de reprise.
+    Les niveaux sont relus à chaque lot : un level up pendant la synchronisation est respecté.
+    """
+
+    def __init__(self, guild: discord.Guild, mapping, level_source, channel_id: int = None,
+                 concurrency: int = 3, batch_size: int = 100, checkpoint: dict = None):
+        self.guild = guild
+        self.mapping = mapping
+        self.level_source = level_source  # async (guild_id, user_ids) -> {user_id: niveau}
+        self.channel_id = channel_id
+        self.batch_size = batch_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+        checkpoint = checkpoint or {}
+        self.last_user_id = checkpoint.get('last_user_id', 0)
+        self.processed = checkpoint.get('processed', 0)
+        self.changed = checkpoint.get('changed', 0)
+        self.failed = checkpoint.get('failed', 0)
+        self.total = self.processed
+
+    async def _apply(self, member: discord.Member, add: set, remove: set) -> bool:
+        async with self._semaphore:
+            try:
+                await apply_role_changes(member, add, remove, "Synchronisation des rôles de niveau")
+                return True
+            except discord.NotFound:
+                return False  # Membre parti entre-temps
+            except discord.HTTPException as e:
+                logger.warning(f"Rôles de niveau: échec pour {member} ({self.guild}): {e}")
+                self.failed += 1
+                return False
+
+    async def run(self, on_progress=None):
+        """Traite les membres restants ; on_progress(sync) est attendu après chaque lot"""
+        members = sorted(
+            (member for member in self.guild.members if not member.bot and member.id > self.last_user_id),
+            key=lambda member: member.id
+        )
+        self.total = self.processed + len(members)
+        await database.save_level_role_sync(
+            self.guild.id, self.channel_id, self.last_user_id, self.processed, self.changed, self.failed
+        )
+
+        for start in range(0, len(members), self.batch_size):
+            batch = members[start:start + self.batch_size]
+            levels = await self.level_source(self.guild.id, [member.id for member in batch])
+            work = []
+            for member in batch:
+                add, remove = role_changes(
+                    self.mapping,
+                    levels.get(member.id, 0),
+                    [role.id for role in member.roles]
+                )
+                if add or remove:
+                    work.append(self._apply(member, add, remove))
+
+            results = await asyncio.gather(*work)
+            self.changed += sum(results)
+            self.processed += len(batch)
+            self.last_user_id = batch[-1].id
+            await database.save_level_role_sync(
+                self.guild.id, self.channel_id, self.last_user_id, self.processed, self.changed, self.failed
+            )
+            if on_progress:
+                await on_progress(self)
+
+        await database.delete_level_role_sync(self.guild.id)
@@ -0,0 +1,298 @@
+"""
+Niveaux - Table des seuils d'XP et accumulateur en mémoire écrit par lots
+"""
+
+import bisect
+import csv
+import io
+import json
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import partial
+import database
+from config import Config
+
+INITIAL_LEVELS = 1000  # seuils précalculés (étendus si un utilisateur les dépasse)
+CHUNK_SIZE = 5000  # lignes lues puis écrites par transaction (recalcul, import)
+
+# En-têtes reconnus dans les exports d'autres bots
+USER_KEYS = ("user_id", "id", "userid", "user", "member_id")
+XP_KEYS = ("xp", "exp", "experience", "total_xp")
+
+class LevelTable:
+    """Seuils d'XP précalculés : le niveau d'un total d'XP se trouve par bisection"""
+
+    def __init__(self, xp_formula=Config.XP_FORMULA, levels: int = INITIAL_LEVELS):
+        self.xp_formula = xp_formula
+        self.thresholds = [xp_formula(level) for level in range(levels + 1)]
+
+    def _extend(self, xp: int):
+        while xp >= self.thresholds[-1]:
+            start = len(self.thresholds)
+            self.thresholds.extend(self.xp_formula(level) for level in range(start, start * 2))
+
+    def level_for(self, xp: int) -> int:
+        """Plus haut niveau dont le seuil est atteint"""
+        if xp >= self.thresholds[-1]:
+            self._extend(xp)
+        return bisect.bisect_right(self.thresholds, xp) - 1
+
+    def levels_for(self, xps) -> list:
+        """Niveaux d'une série d'XP (un seul passage, bisection en C via map)"""
+        xps = list(xps)
+        if xps:
+            self._extend(max(xps))
+        return [index - 1 for index in map(partial(bisect.bisect_right, self.thresholds), xps)]
+
+    def xp_for(self, level: int) -> int:
+        """XP nécessaire pour atteindre un niveau"""
+        if level >= len(self.thresholds):
+            return self.xp_formula(level)
+        return self.thresholds[level]
+
+class _LevelEntry:
+    __slots__ = ("xp", "level", "last_message", "dirty", "touched")
+
+    def __init__(self, xp: int, level: int, last_message=None):
+        self.xp = xp
+        self.level = level
+        self.last_message = last_message
+        self.dirty = False
+        self.touched = time.monotonic()
+
+class XPAccumulator:
+    """
+    XP des utilisateurs actifs tenue en mémoire ; les lignes modifiées sont écrites
+    ensemble par flush() au lieu d'une transaction par message récompensé.
+    """
+
+    def __init__(self, table: LevelTable):
+        self.table = table
+        self._entries = {}  # (guild_id, user_id) -> _LevelEntry
+        self.paused = set()  # serveurs dont la table est réécrite (recalcul, import)
+        # Fonctions synchrones appelées avec les lignes de chaque flush réussi
+        self.listeners = []
+        self.metrics = {"awards": 0, "loads": 0, "flushes": 0, "rows_written": 0, "evicted": 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    async def get(self, guild_id: int, user_id: int):
+        """Entrée de l'utilisateur (chargée depuis la base au premier accès), None s'il n'a jamais eu d'XP"""
+        key = (guild_id, user_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+
+        row = await database.get_level_data(guild_id, user_id)
+        self.metrics["loads"] += 1
+        # Une autre coroutine a pu créer l'entrée pendant la lecture
+        entry = self._entries.get(key)
+        if entry is None and row is not None:
+            entry = self._entries[key] = _LevelEntry(row['xp'], row['level'], row['last_message'])
+        return entry
+
+    async def add(self, guild_id: int, user_id: int, xp: int):
+        """Ajoute de l'XP ; retourne (level up ?, niveau)"""
+        if guild_id in self.paused:
+            return False, None
+        entry = await self.get(guild_id, user_id)
+        if entry is None:
+            entry = self._entries.setdefault((guild_id, user_id), _LevelEntry(0, 0))
+
+        old_level = entry.level
+        entry.xp += xp
+        entry.level = self.table.level_for(entry.xp)
+        entry.last_message = datetime.now()
+        entry.dirty = True
+        entry.touched = time.monotonic()
+        self.metrics["awards"] += 1
+        return entry.level > old_level, entry.level
+
+    async def add_many(self, guild_id: int, user_ids: list, xp: int) -> list:
+        """
+        Ajoute la même XP à plusieurs membres (XP vocale) ; les absents du cache sont
+        chargés en une lecture groupée. Retourne [(user_id, niveau)] des level up.
+        """
+        if guild_id in self.paused:
+            return []
+        missing = [user_id for user_id in user_ids if (guild_id, user_id) not in self._entries]
+        if missing:
+            rows = await database.get_level_rows(guild_id, missing)
+            self.metrics["loads"] += len(missing)
+            for row in rows:
+                self._entries.setdefault((guild_id, row['user_id']), _LevelEntry(row['xp'], row['level'], row['last_message']))
+            # Le serveur a pu être suspendu pendant la lecture
+            if guild_id in self.paused:
+                self.forget_guild(guild_id)
+                return []
+
+        now = time.monotonic()
+        level_ups = []
+        for user_id in user_ids:
+            entry = self._entries.get((guild_id, user_id))
+            if entry is None:
+                entry = self._entries[(guild_id, user_id)] = _LevelEntry(0, 0)
+            old_level = entry.level
+            entry.xp += xp
+            entry.level = self.table.level_for(entry.xp)
+            entry.dirty = True
+            entry.touched = now
+            if entry.level > old_level:
+                level_ups.append((user_id, entry.level))
+        self.metrics["awards"] += len(user_ids)
+        return level_ups
+
+    def cached_levels(self, guild_id: int, user_ids) -> dict:
+        """Niveaux {user_id: niveau} des utilisateurs présents en mémoire"""
+        entries = self._entries
+        return {
+            user_id: entry.level for user_id in user_ids
+            if (entry := entries.get((guild_id, user_id))) is not None
+        }
+
+    def set(self, guild_id: int, user_id: int, xp: int):
+        """Remplace l'XP d'un utilisateur (écrit au prochain flush)"""
+        key = (guild_id, user_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = _LevelEntry(xp, 0)
+        entry.xp = xp
+        entry.level = self.table.level_for(xp)
+        entry.last_message = datetime.now()
+        entry.dirty = True
+        entry.touched = time.monotonic()
+        return entry
+
+    async def flush(self) -> int:
+        """Écrit toutes les lignes modifiées en une transaction"""
+        dirty = [(key, entry) for key, entry in self._entries.items() if entry.dirty]
+        if not dirty:
+            return 0
+        rows = []
+        for (guild_id, user_id), entry in dirty:
+            entry.dirty = False
+            rows.append((guild_id, user_id, entry.xp, entry.level, entry.last_message))
+
+        try:
+            await database.save_levels(rows)
+        except Exception:
+            # Réessayer au prochain flush
+            for _, entry in dirty:
+                entry.dirty = True
+            raise
+
+        # Sans await depuis l'écriture : les listeners voient les lignes dans l'ordre des flushs
+        for listener in self.listeners:
+            listener(rows)
+        self.metrics["flushes"] += 1
+        self.metrics["rows_written"] += len(rows)
+        return len(rows)
+
+    def evict_idle(self, max_idle: float) -> int:
+        """Oublie les utilisateurs inactifs déjà écrits"""
+        horizon = time.monotonic() - max_idle
+        idle = [key for key, entry in self._entries.items() if not entry.dirty and entry.touched < horizon]
+        for key in idle:
+            del self._entries[key]
+        self.metrics["evicted"] += len(idle)
+        return len(idle)
+
+    def forget_guild(self, guild_id: int):
+        """Oublie les entrées d'un serveur (y compris non écrites)"""
+        for key in [key for key in self._entries if key[0] == guild_id]:
+            del self._entries[key]
+
+    @asynccontextmanager
+    async def exclusive(self, guild_id: int):
+        """
+        Réécriture directe de la table levels pour un serveur : l'XP en attente est écrite,
+        les gains sont suspendus puis le cache est vidé pour relire les nouvelles valeurs
+        """
+        await self.flush()
+        self.paused.add(guild_id)
+        self.forget_guild(guild_id)
+        try:
+            yield
+        finally:
+            self.forget_guild(guild_id)
+            self.paused.discard(guild_id)
+
+    def stats(self) -> dict:
+        return {
+            "cached": len(self._entries),
+            "dirty": sum(1 for entry in self._entries.values() if entry.dirty),
+            **self.metrics,
+        }
+
+async def recompute_levels(table: LevelTable, guild_id: int = None, chunk_size: int = CHUNK_SIZE):
+    """
+    Recalcule les niveaux stockés (tous les serveurs si guild_id est None) par pages ;
+    seules les lignes dont le niveau change sont réécrites. Retourne (lues, modifiées).
+    """
+    scanned = changed = 0
+    async for rows in database.iter_level_chunks(guild_id, chunk_size):
+        levels = table.levels_for(row['xp'] for row in rows)
+        updates = [
+            (level, row['guild_id'], row['user_id'])
+            for row, level in zip(rows, levels)
+            if level != row['level']
+        ]
+        if updates:
+            await database.update_levels(updates)
+        scanned += len(rows)
+        changed += len(updates)
+    return scanned, changed
+
+def parse_xp_import(data: bytes):
+    """
+    Lit un export d'XP d'un autre bot et produit des paires (user_id, xp).
+    JSON : liste d'objets, {"players": [...]} ou {user_id: xp} ; CSV : colonnes user_id/id et xp.
+    ValueError si le format n'est pas reconnu.
+    """
+    text = data.decode("utf-8-sig")
+    stripped = text.lstrip()
+    if stripped.startswith(("{", "[")):
+        try:
+            payload = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON invalide: {e}")
+        if isinstance(payload, dict):
+            if isinstance(payload.get("players"), list):
+                payload = payload["players"]
+            else:
+                return [_import_pair({"user_id": user_id, "xp": xp}) for user_id, xp in payload.items()]
+        if not isinstance(payload, list):
+            raise ValueError("Liste d'entrées attendue")
+        return [_import_pair(item) for item in payload]
+
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        raise ValueError("Fichier vide")
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    return [_import_pair(row) for row in reader]
+
+def _import_pair(item) -> tuple:
+    if not isinstance(item, dict):
+        raise ValueError("Chaque entrée doit être un objet avec un identifiant et de l'XP")
+    user_id = next((item[key] for key in USER_KEYS if item.get(key) not in (None, "")), None)
+    xp = next((item[key] for key in XP_KEYS if item.get(key) not in (None, "")), None)
+    if user_id is None or xp is None:
+        raise ValueError(f"Colonnes attendues : {USER_KEYS[0]} et {XP_KEYS[0]}")
+    try:
+        return int(user_id), max(0, int(float(xp)))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Valeur invalide : {user_id} / {xp}")
+
+async def import_xp(table: LevelTable, guild_id: int, pairs, chunk_size: int = CHUNK_SIZE) -> int:
+    """Remplace l'XP des utilisateurs importés (niveaux recalculés), par transactions de chunk_size lignes"""
+    pairs = list(pairs)
+    for start in range(0, len(pairs), chunk_size):
+        chunk = pairs[start:start + chunk_size]
+        levels = table.levels_for(xp for _, xp in chunk)
+        await database.save_levels([
+            (guild_id, user_id, xp, level, None)
+            for (user_id, xp), level in zip(chunk, levels)
+        ])
+    return len(pairs)
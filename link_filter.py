@@ -0,0 +1,119 @@
+"""
+Filtre de liens - Extraction des domaines et correspondance par suffixe (listes et anti-phishing)
+"""
+
+import logging
+import re
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Extensions reconnues pour un domaine écrit sans http:// ni www. ("exemple.com")
+BARE_TLDS = frozenset({
+    "com", "net", "org", "gg", "io", "co", "me", "tv", "xyz", "ru", "fr", "de", "uk",
+    "info", "biz", "app", "dev", "link", "site", "online", "shop", "store", "club",
+    "live", "gift", "top", "ly", "to", "cc", "be", "eu", "us", "ws",
+})
+
+# Une seule expression : après http(s):// tout hôte est un lien (IP, localhost...) ;
+# sans schéma, www. optionnel puis un nom de domaine
+_URL_PATTERN = re.compile(
+    r"https?://(?P<host>[^\s/?#()<>\"'`|\\*~]*)"
+    r"|(?P<www>www\.)?"
+    r"(?P<domain>(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+(?P<tld>[a-z]{2,63}))"
+    r"(?![a-z0-9-])",
+    re.IGNORECASE,
+)
+
+def _url_host(host: str) -> str:
+    """Hôte d'une URL avec schéma : sans identifiants, port ni point final"""
+    host = host.rsplit("@", 1)[-1].lower()
+    if host.startswith("["):
+        return host.split("]", 1)[0] + "]"  # IPv6 littérale
+    return host.split(":", 1)[0].strip(".")
+
+def extract_domains(content: str) -> list:
+    """Domaines des liens d'un message (sans www.), dans l'ordre d'apparition"""
+    if "." not in content and "://" not in content:
+        return []
+    domains = []
+    for match in _URL_PATTERN.finditer(content):
+        if match.group("host") is not None:
+            domain = _url_host(match.group("host"))
+            if not domain:
+                continue
+        else:
+            domain = match.group("domain").lower()
+            if not match.group("www") and match.group("tld").lower() not in BARE_TLDS:
+                continue
+        if domain.startswith("www."):
+            domain = domain[4:]
+        domains.append(domain)
+    return domains
+
+def normalize_domain(value: str) -> str:
+    """Domaine saisi par un modérateur : retire le schéma, www. et le chemin"""
+    value = value.strip().lower()
+    value = re.sub(r"^[a-z]+://", "", value)
+    value = value.split("/", 1)[0].split(":", 1)[0].strip(".")
+    if value.startswith("www."):
+        value = value[4:]
+    return value
+
+def matches_suffix(domain: str, domains) -> bool:
+    """Vrai si le domaine ou l'un de ses domaines parents est dans l'ensemble (un test par niveau)"""
+    if domain in domains:
+        return True
+    index = domain.find(".")
+    while index != -1:
+        if domain[index + 1:] in domains:
+            return True
+        index = domain.find(".", index + 1)
+    return False
+
+class LinkFilter:
+    """Classe les liens d'un message : phishing connu, domaine interdit ou lien ordinaire"""
+
+    def __init__(self):
+        self.blocklist = frozenset()
+        self.hits = {"phishing": 0, "denied": 0, "link": 0}
+
+    def load_blocklist(self, path) -> int:
+        """Charge la liste locale des domaines de phishing (un domaine par ligne, # pour commenter)"""
+        path = Path(path)
+        if not path.exists():
+            logger.info(f"Liste anti-phishing absente ({path}), filtre désactivé")
+            self.blocklist = frozenset()
+            return 0
+        domains = set()
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    domains.add(normalize_domain(line))
+        self.blocklist = frozenset(domains)
+        return len(self.blocklist)
+
+    def check(self, content: str, rules: dict, block_all: bool):
+        """
+        Retourne (verdict, domaine) pour le premier lien à sanctionner, sinon None
+        verdict: "phishing" (liste locale), "denied" (liste du serveur) ou "link" (anti-liens actif)
+        rules: {"allow": set, "deny": set} du serveur
+        """
+        for domain in extract_domains(content):
+            if matches_suffix(domain, self.blocklist):
+                verdict = "phishing"
+            elif matches_suffix(domain, rules["allow"]):
+                continue
+            elif matches_suffix(domain, rules["deny"]):
+                verdict = "denied"
+            elif block_all:
+                verdict = "link"
+            else:
+                continue
+            self.hits[verdict] += 1
+            return verdict, domain
+        return None
+
+    def stats(self) -> dict:
+        return {"blocklist": len(self.blocklist), **self.hits}
@@ -0,0 +1,160 @@
+"""
+Cache des messages récents - LRU par serveur, limité en octets, pour les logs de suppression/modification
+"""
+
+import sys
+from collections import OrderedDict
+import discord
+
+# Coût fixe estimé d'un enregistrement (objet à slots, entiers, entrée du dict)
+RECORD_OVERHEAD = 200
+# Au-delà du plafond global, on libère jusqu'à cette part du plafond (évite d'évincer à chaque message)
+GLOBAL_LOW_WATER = 0.9
+
+class CachedMessage:
+    """Instantané compact d'un message"""
+    __slots__ = ("id", "channel_id", "author_id", "author_name", "content", "attachments", "size")
+
+    def __init__(self, message: discord.Message):
+        self.id = message.id
+        self.channel_id = message.channel.id
+        self.author_id = message.author.id
+        self.author_name = str(message.author)
+        self.content = message.content
+        self.attachments = tuple(attachment.url for attachment in message.attachments)
+        self.size = self._measure()
+
+    def _measure(self) -> int:
+        size = RECORD_OVERHEAD + sys.getsizeof(self.content) + sys.getsizeof(self.author_name)
+        for url in self.attachments:
+            size += sys.getsizeof(url)
+        return size
+
+    def set_content(self, content: str) -> int:
+        """Remplace le contenu (modification) et retourne la variation de taille"""
+        old_size = self.size
+        self.content = content
+        self.size = self._measure()
+        return self.size - old_size
+
+class _GuildCache:
+    __slots__ = ("messages", "bytes")
+
+    def __init__(self):
+        self.messages = OrderedDict()  # message_id -> CachedMessage (du moins au plus récent)
+        self.bytes = 0
+
+class MessageCache:
+    """Messages récents par serveur, plafonnés par serveur et globalement (éviction des plus anciens)"""
+
+    def __init__(self, max_bytes: int, guild_bytes: int):
+        self.max_bytes = max_bytes
+        self.guild_bytes = guild_bytes  # plafond par défaut d'un serveur
+        self._guilds = {}  # guild_id -> _GuildCache
+        self.bytes = 0
+        self.metrics = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def add(self, message: discord.Message, budget: int = None):
+        """Met un message en cache ; budget = plafond du serveur en octets (None = défaut, 0 = désactivé)"""
+        guild_id = message.guild.id
+        if budget is None:
+            budget = self.guild_bytes
+        if budget <= 0:
+            self.drop_guild(guild_id)
+            return None
+
+        guild = self._guilds.get(guild_id)
+        if guild is None:
+            guild = self._guilds[guild_id] = _GuildCache()
+
+        record = CachedMessage(message)
+        previous = guild.messages.pop(record.id, None)
+        if previous is not None:
+            self._account(guild, -previous.size)
+        guild.messages[record.id] = record
+        self._account(guild, record.size)
+
+        self._evict(guild, budget)
+        if self.bytes > self.max_bytes:
+            self._evict_global()
+        return record
+
+    def _account(self, guild: _GuildCache, delta: int):
+        guild.bytes += delta
+        self.bytes += delta
+
+    def _evict(self, guild: _GuildCache, budget: int):
+        while guild.bytes > budget and guild.messages:
+            _, record = guild.messages.popitem(last=False)
+            self._account(guild, -record.size)
+            self.metrics["evictions"] += 1
+
+    def _evict_global(self):
+        """Plafond global dépassé : réduire les serveurs les plus gourmands"""
+        target = self.max_bytes * GLOBAL_LOW_WATER
+        for guild_id, guild in sorted(self._guilds.items(), key=lambda item: item[1].bytes, reverse=True):
+            if self.bytes <= target:
+                break
+            self._evict(guild, max(0, guild.bytes - (self.bytes - target)))
+            if not guild.messages:
+                del self._guilds[guild_id]
+
+    def get(self, guild_id: int, message_id: int):
+        """Instantané d'un message (marqué comme récemment utilisé), ou None"""
+        guild = self._guilds.get(guild_id)
+        record = guild.messages.get(message_id) if guild else None
+        if record is None:
+            self.metrics["misses"] += 1
+            return None
+        guild.messages.move_to_end(message_id)
+        self.metrics["hits"] += 1
+        return record
+
+    def update(self, guild_id: int, message_id: int, content: str):
+        """Enregistre le nouveau contenu d'un message modifié : (instantané, ancien contenu), ou (None, None)"""
+        record = self.get(guild_id, message_id)
+        if record is None:
+            return None, None
+        old_content = record.content
+        self._account(self._guilds[guild_id], record.set_content(content))
+        return record, old_content
+
+    def pop(self, guild_id: int, message_id: int):
+        """Retire et retourne un message supprimé, ou None"""
+        guild = self._guilds.get(guild_id)
+        record = guild.messages.pop(message_id, None) if guild else None
+        if record is None:
+            self.metrics["misses"] += 1
+            return None
+        self._account(guild, -record.size)
+        self.metrics["hits"] += 1
+        return record
+
+    def pop_many(self, guild_id: int, message_ids) -> list:
+        """Retire les messages connus parmi ceux donnés (suppression groupée), du plus ancien au plus récent"""
+        records = [self.pop(guild_id, message_id) for message_id in sorted(message_ids)]
+        return [record for record in records if record is not None]
+
+    def discard(self, guild_id: int, message_ids):
+        """Oublie des messages sans compter de hit (suppressions faites par le bot)"""
+        guild = self._guilds.get(guild_id)
+        if not guild:
+            return
+        for message_id in message_ids:
+            record = guild.messages.pop(message_id, None)
+            if record is not None:
+                self._account(guild, -record.size)
+
+    def drop_guild(self, guild_id: int):
+        guild = self._guilds.pop(guild_id, None)
+        if guild:
+            self.bytes -= guild.bytes
+
+    def stats(self) -> dict:
+        return {
+            "guilds": len(self._guilds),
+            "messages": sum(len(guild.messages) for guild in self._guilds.values()),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            **self.metrics,
+        }
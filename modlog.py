@@ -0,0 +1,123 @@
+"""
+Envoi des logs de modération - Regroupe les embeds par salon (jusqu'à 10 par message)
+"""
+
+import asyncio
+import logging
+from collections import deque
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Limites Discord par message
+EMBEDS_PER_MESSAGE = 10
+EMBED_CHARS_PER_MESSAGE = 6000
+
+class _ChannelBuffer:
+    """Embeds en attente pour un salon de logs"""
+    __slots__ = ("channel", "embeds", "wakeup", "task")
+
+    def __init__(self, channel, max_buffer: int):
+        self.channel = channel
+        # Plein : l'embed le plus ancien est abandonné (salon lent ou injoignable)
+        self.embeds = deque(maxlen=max_buffer)
+        self.wakeup = asyncio.Event()
+        self.task = None
+
+class ModLogDispatcher:
+    """Tampon d'envoi par salon : un message pour plusieurs embeds, un envoi à la fois par salon"""
+
+    def __init__(self, flush_interval: float = 1.0, max_buffer: int = 100):
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._buffers = {}  # channel_id -> _ChannelBuffer
+        self._closing = False
+        self.metrics = {
+            "submitted": 0,
+            "sent": 0,
+            "messages": 0,
+            "dropped": 0,
+            "failed": 0,
+        }
+
+    def submit(self, channel: discord.abc.Messageable, embed: discord.Embed):
+        """Met un embed en attente d'envoi (ne bloque jamais l'appelant)"""
+        buffer = self._buffers.get(channel.id)
+        if buffer is None:
+            buffer = self._buffers[channel.id] = _ChannelBuffer(channel, self.max_buffer)
+        buffer.channel = channel
+
+        if len(buffer.embeds) == buffer.embeds.maxlen:
+            self.metrics["dropped"] += 1
+        buffer.embeds.append(embed)
+        self.metrics["submitted"] += 1
+
+        # Un message complet est prêt : inutile d'attendre l'intervalle
+        if len(buffer.embeds) >= EMBEDS_PER_MESSAGE:
+            buffer.wakeup.set()
+        if buffer.task is None or buffer.task.done():
+            buffer.task = asyncio.create_task(self._run(channel.id, buffer))
+
+    async def _run(self, channel_id: int, buffer: _ChannelBuffer):
+        """Envoie les embeds d'un salon tant qu'il en reste, puis s'arrête"""
+        while buffer.embeds:
+            if len(buffer.embeds) < EMBEDS_PER_MESSAGE and not self._closing:
+                buffer.wakeup.clear()
+                try:
+                    await asyncio.wait_for(buffer.wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self._send_batch(buffer)
+
+        # Sans await depuis la vérification : aucun embed n'a pu arriver entre-temps
+        if self._buffers.get(channel_id) is buffer:
+            del self._buffers[channel_id]
+
+    async def _send_batch(self, buffer: _ChannelBuffer):
+        """Envoie un message avec autant d'embeds que les limites le permettent"""
+        batch = []
+        size = 0
+        while buffer.embeds and len(batch) < EMBEDS_PER_MESSAGE:
+            length = len(buffer.embeds[0])
+            if batch and size + length > EMBED_CHARS_PER_MESSAGE:
+                break
+            batch.append(buffer.embeds.popleft())
+            size += length
+        if not batch:
+            return
+
+        try:
+            await buffer.channel.send(embeds=batch)
+            self.metrics["sent"] += len(batch)
+            self.metrics["messages"] += 1
+        except (discord.Forbidden, discord.NotFound) as e:
+            # Salon injoignable : abandonner ce qui reste plutôt que de réessayer
+            dropped = len(batch) + len(buffer.embeds)
+            buffer.embeds.clear()
+            self.metrics["dropped"] += dropped
+            logger.warning(f"Logs de modération: salon {buffer.channel.id} injoignable, {dropped} embed(s) abandonné(s): {e}")
+        except Exception as e:
+            # discord.py réessaie déjà les rate limits et erreurs serveur
+            self.metrics["failed"] += len(batch)
+            logger.error(f"Logs de modération: échec de l'envoi de {len(batch)} embed(s): {e}")
+
+    async def close(self, timeout: float = 10.0):
+        """Envoie immédiatement tout ce qui est en attente"""
+        self._closing = True
+        tasks = []
+        for buffer in list(self._buffers.values()):
+            buffer.wakeup.set()
+            if buffer.task and not buffer.task.done():
+                tasks.append(buffer.task)
+        if tasks:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> dict:
+        """Embeds en attente, envoyés et abandonnés"""
+        return {
+            **self.metrics,
+            "buffered": sum(len(buffer.embeds) for buffer in self._buffers.values()),
+            "channels": len(self._buffers),
+        }
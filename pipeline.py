@@ -0,0 +1,91 @@
+"""
+Pipeline des messages - Un seul listener on_message qui enchaîne les étapes des cogs
+"""
+
+import bisect
+import logging
+import time
+import discord
+import database
+
+logger = logging.getLogger(__name__)
+
+# Ordre d'exécution des étapes (croissant)
+ORDER_AUTOMOD = 10
+ORDER_MESSAGE_CACHE = 15  # après l'auto-mod : ses suppressions ne sont pas journalisées
+ORDER_ANALYTICS = 20
+ORDER_LEVELING = 30
+
+class MessageContext:
+    """Informations calculées une seule fois par message et partagées par les étapes"""
+    __slots__ = ("message", "guild", "author", "permissions", "config", "is_moderator", "stopped")
+
+    def __init__(self, message: discord.Message, config: dict):
+        self.message = message
+        self.guild = message.guild
+        self.author = message.author
+        self.permissions = getattr(message.author, "guild_permissions", discord.Permissions.none())
+        self.config = config
+        self.is_moderator = self.permissions.administrator or self.permissions.manage_messages
+        self.stopped = False
+
+    def stop(self):
+        """Interrompt le pipeline : les étapes suivantes ne voient pas ce message"""
+        self.stopped = True
+
+class MessagePipeline:
+    """Dispatcher on_message unique qui exécute les étapes enregistrées dans l'ordre"""
+
+    def __init__(self):
+        self._stages = []  # [(ordre, nom, callback)] trié par ordre
+        self._timings = {}
+
+    def register(self, name: str, callback, order: int):
+        """Enregistre (ou remplace) une étape"""
+        self.unregister(name)
+        bisect.insort(self._stages, (order, name, callback), key=lambda stage: (stage[0], stage[1]))
+        self._timings.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+
+    def unregister(self, name: str):
+        """Retire une étape (déchargement d'un cog)"""
+        self._stages = [stage for stage in self._stages if stage[1] != name]
+
+    def _record(self, name: str, elapsed: float):
+        timing = self._timings.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        timing["count"] += 1
+        timing["total"] += elapsed
+        if elapsed > timing["max"]:
+            timing["max"] = elapsed
+
+    async def dispatch(self, message: discord.Message):
+        """Listener on_message : construit le contexte puis exécute les étapes"""
+        # Ignorer les bots et les DMs
+        if message.author.bot or not message.guild:
+            return
+
+        start = time.perf_counter()
+        config = await database.get_guild_config(message.guild.id)
+        ctx = MessageContext(message, config)
+
+        for order, name, callback in self._stages:
+            stage_start = time.perf_counter()
+            try:
+                await callback(ctx)
+            except Exception as e:
+                logger.error(f"Pipeline: erreur dans l'étape {name}: {e}", exc_info=e)
+            self._record(name, time.perf_counter() - stage_start)
+            if ctx.stopped:
+                break
+
+        self._record("total", time.perf_counter() - start)
+
+    def stats(self) -> dict:
+        """Durée par étape en millisecondes"""
+        return {
+            name: {
+                "count": timing["count"],
+                "avg_ms": timing["total"] / timing["count"] * 1000 if timing["count"] else 0.0,
+                "max_ms": timing["max"] * 1000,
+            }
+            for name, timing in self._timings.items()
+        }
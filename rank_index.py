@@ -0,0 +1,157 @@
+"""
+Index de classement en mémoire - Rangs et tops sur une fenêtre glissante de 7 jours
+"""
+
+import bisect
+from datetime import datetime
+
+WINDOW_HOURS = 168  # 7 jours, comme les classements SQL
+
+def hour_index(timestamp: datetime) -> int:
+    """Numéro d'heure absolu (même découpage que database.hour_bucket)"""
+    return timestamp.toordinal() * 24 + timestamp.hour
+
+def bucket_index(bucket: str) -> int:
+    """Numéro d'heure d'une tranche horaire 'YYYY-MM-DD HH:00:00'"""
+    return hour_index(datetime.fromisoformat(bucket))
+
+class WindowRankIndex:
+    """Scores par utilisateur sur une fenêtre glissante, triés pour des rangs en O(log n)"""
+
+    def __init__(self, window_hours: int = WINDOW_HOURS):
+        self.window_hours = window_hours
+        self._buckets = {}  # heure -> {user_id: quantité}
+        self._scores = {}  # user_id -> score sur la fenêtre
+        self._sorted = []  # [(-score, user_id)] trié : le meilleur en tête
+        self._horizon = None  # plus ancienne heure encore dans la fenêtre
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def _set_score(self, user_id: int, score: int):
+        """Repositionne un utilisateur dans la liste triée"""
+        old = self._scores.get(user_id, 0)
+        if old:
+            del self._sorted[bisect.bisect_left(self._sorted, (-old, user_id))]
+        if score > 0:
+            self._scores[user_id] = score
+            bisect.insort(self._sorted, (-score, user_id))
+        else:
+            self._scores.pop(user_id, None)
+
+    def advance(self, current_hour: int):
+        """Retire les contributions sorties de la fenêtre"""
+        horizon = current_hour - self.window_hours
+        if self._horizon is not None and horizon <= self._horizon:
+            return
+        self._horizon = horizon
+
+        for hour in [hour for hour in self._buckets if hour < horizon]:
+            for user_id, amount in self._buckets.pop(hour).items():
+                self._set_score(user_id, self._scores.get(user_id, 0) - amount)
+
+    def add(self, user_id: int, amount: int, hour: int):
+        """Ajoute une contribution datée (ignorée si déjà hors fenêtre)"""
+        if amount <= 0 or (self._horizon is not None and hour < self._horizon):
+            return
+        bucket = self._buckets.setdefault(hour, {})
+        bucket[user_id] = bucket.get(user_id, 0) + amount
+        self._set_score(user_id, self._scores.get(user_id, 0) + amount)
+
+    def remove(self, user_id: int):
+        """Retire toutes les contributions d'un utilisateur"""
+        for bucket in self._buckets.values():
+            bucket.pop(user_id, None)
+        self._set_score(user_id, 0)
+
+    def score(self, user_id: int) -> int:
+        return self._scores.get(user_id, 0)
+
+    def rank(self, user_id: int):
+        """(rang, nombre d'utilisateurs actifs) : rang = 1 + utilisateurs strictement devant"""
+        score = self._scores.get(user_id, 0)
+        above = bisect.bisect_left(self._sorted, (-score,)) if score else len(self._sorted)
+        return above + 1, len(self._sorted)
+
+    def top(self, k: int):
+        """Les k meilleurs [(user_id, score)]"""
+        return [(user_id, -negative) for negative, user_id in self._sorted[:k]]
+
+class ActivityRankIndex:
+    """Index de classement par (serveur, métrique), alimenté au fil de l'activité"""
+
+    def __init__(self, window_hours: int = WINDOW_HOURS):
+        self.window_hours = window_hours
+        self._indexes = {}
+        self._pending = None  # opérations reçues pendant une reconstruction, rejouées à la fin
+        self.generation = 0  # incrémenté à chaque remise à zéro
+        self.ready = False
+
+    def _index(self, guild_id: int, metric: str) -> WindowRankIndex:
+        key = (guild_id, metric)
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = WindowRankIndex(self.window_hours)
+        index.advance(hour_index(datetime.now()))
+        return index
+
+    def load(self, metric: str, guild_id: int, user_id: int, bucket: str, amount: int):
+        """Charge une ligne d'agrégat pendant la reconstruction"""
+        self._index(guild_id, metric).add(user_id, amount, bucket_index(bucket))
+
+    def begin_rebuild(self):
+        """Appelé quand l'état lu en base est fixé : les opérations suivantes sont mises de côté"""
+        self._pending = []
+
+    def finish_rebuild(self):
+        """Rejoue dans l'ordre les opérations reçues pendant la reconstruction"""
+        pending, self._pending = self._pending or [], None
+        for operation, args in pending:
+            operation(*args)
+        self.ready = True
+
+    def record(self, metric: str, rows):
+        """
+        Ajoute des lignes d'agrégats [(guild_id, user_id, tranche_horaire, quantité)]
+        Ignoré tant que la reconstruction n'a pas fixé son état : ces lignes seront lues en base.
+        """
+        if self._pending is not None:
+            self._pending.append((self._record, (metric, rows)))
+        elif self.ready:
+            self._record(metric, rows)
+
+    def _record(self, metric: str, rows):
+        for guild_id, user_id, bucket, amount in rows:
+            self.load(metric, guild_id, user_id, bucket, amount)
+
+    def remove(self, guild_id: int, user_id: int):
+        """Retire un utilisateur des index de son serveur (membre parti)"""
+        if self._pending is not None:
+            self._pending.append((self._remove, (guild_id, user_id)))
+        else:
+            self._remove(guild_id, user_id)
+
+    def _remove(self, guild_id: int, user_id: int):
+        for (index_guild, _), index in self._indexes.items():
+            if index_guild == guild_id:
+                index.remove(user_id)
+
+    def rank(self, guild_id: int, metric: str, user_id: int):
+        return self._index(guild_id, metric).rank(user_id)
+
+    def top(self, guild_id: int, metric: str, k: int = 10):
+        return self._index(guild_id, metric).top(k)
+
+    def reset(self):
+        self._indexes.clear()
+        self._pending = None
+        self.generation += 1
+        self.ready = False
+
+    def stats(self) -> dict:
+        return {
+            "indexes": len(self._indexes),
+            "entries": sum(len(index) for index in self._indexes.values()),
+            "ready": self.ready,
+            "pending": len(self._pending) if self._pending is not None else 0,
+        }
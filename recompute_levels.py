@@ -0,0 +1,28 @@
+"""
+Script de recalcul des niveaux stockés (tous les serveurs)
+À lancer bot arrêté après une modification de Config.XP_FORMULA / LEVEL_FORMULA.
+"""
+
+import asyncio
+import database
+from levels import LevelTable, recompute_levels
+
+async def main():
+    print("=" * 50)
+    print("🔁 RECALCUL DES NIVEAUX")
+    print("=" * 50)
+
+    await database.pool.open()
+    try:
+        await database.init_db()
+
+        scanned, changed = await recompute_levels(LevelTable())
+        print(f"✅ {scanned} membres parcourus")
+        print(f"✅ {changed} niveaux corrigés")
+    finally:
+        await database.pool.close()
+
+    print("=" * 50)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+"""
+Planificateur des actions temporaires - Tas de minuteries réveillé à la prochaine échéance
+"""
+
+import asyncio
+import heapq
+import logging
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Réveil au moins toutes les heures (changement d'heure système, mise en veille...)
+MAX_SLEEP = 3600
+
+class ActionScheduler:
+    """Exécute chaque action à son échéance exacte, sans balayer la base"""
+
+    def __init__(self, handler):
+        # handler(action) est attendu à l'échéance ; il supprime l'action de la base
+        self.handler = handler
+        self._heap = []  # [(expires_at, action_id)]
+        self._actions = {}  # action_id -> action (dict)
+        self._targets = {}  # (guild_id, user_id, action_type) -> action_id
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.metrics = {
+            "executed": 0,
+            "cancelled": 0,
+            "failed": 0,
+            "last_lag": 0.0,
+            "max_lag": 0.0,
+            "total_lag": 0.0,
+        }
+
+    def __len__(self):
+        return len(self._actions)
+
+    def start(self):
+        """Démarre la boucle d'exécution"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def schedule(self, action: dict):
+        """
+        Ajoute une action {id, guild_id, user_id, action_type, expires_at}
+        Retourne l'id de l'action remplacée sur la même cible (ou None).
+        """
+        if action["id"] in self._actions:
+            return None
+        expires_at = action["expires_at"]
+        if isinstance(expires_at, str):
+            expires_at = datetime.fromisoformat(expires_at)
+        action = {**action, "expires_at": expires_at}
+
+        # Une nouvelle action remplace la précédente sur la même cible
+        replaced = self.cancel_for(action["guild_id"], action["user_id"], action["action_type"])
+
+        self._actions[action["id"]] = action
+        self._targets[(action["guild_id"], action["user_id"], action["action_type"])] = action["id"]
+        heapq.heappush(self._heap, (expires_at, action["id"]))
+
+        # Réveiller la boucle si cette échéance passe en tête
+        if self._heap[0][1] == action["id"]:
+            self._wakeup.set()
+        return replaced
+
+    def cancel(self, action_id: int) -> bool:
+        """Annule une action (l'entrée du tas est ignorée à son échéance)"""
+        action = self._actions.pop(action_id, None)
+        if action is None:
+            return False
+        key = (action["guild_id"], action["user_id"], action["action_type"])
+        if self._targets.get(key) == action_id:
+            del self._targets[key]
+        self.metrics["cancelled"] += 1
+        return True
+
+    def cancel_for(self, guild_id: int, user_id: int, action_type: str):
+        """Annule l'action en attente d'un membre, retourne son id (ou None)"""
+        action_id = self._targets.get((guild_id, user_id, action_type))
+        if action_id is not None:
+            self.cancel(action_id)
+        return action_id
+
+    def _pop_due(self):
+        """Retire la prochaine action échue, ou retourne le délai avant la suivante"""
+        while self._heap:
+            expires_at, action_id = self._heap[0]
+            if action_id not in self._actions:
+                heapq.heappop(self._heap)  # annulée
+                continue
+            delay = (expires_at - datetime.now()).total_seconds()
+            if delay > 0:
+                return None, delay
+            heapq.heappop(self._heap)
+            action = self._actions.pop(action_id)
+            key = (action["guild_id"], action["user_id"], action["action_type"])
+            if self._targets.get(key) == action_id:
+                del self._targets[key]
+            return action, 0
+        return None, None
+
+    async def _run(self):
+        while True:
+            action, delay = self._pop_due()
+            if action is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), min(delay or MAX_SLEEP, MAX_SLEEP))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            lag = (datetime.now() - action["expires_at"]).total_seconds()
+            self.metrics["last_lag"] = lag
+            self.metrics["max_lag"] = max(self.metrics["max_lag"], lag)
+            self.metrics["total_lag"] += lag
+            try:
+                await self.handler(action)
+                self.metrics["executed"] += 1
+            except Exception as e:
+                self.metrics["failed"] += 1
+                logger.error(f"Planificateur: erreur sur l'action {action['id']}: {e}")
+
+    def next_deadline(self):
+        """Prochaine échéance encore active (ou None)"""
+        return min((action["expires_at"] for action in self._actions.values()), default=None)
+
+    def stats(self) -> dict:
+        """Actions en attente et retard d'exécution (secondes)"""
+        done = self.metrics["executed"] + self.metrics["failed"]
+        return {
+            **self.metrics,
+            "pending": len(self._actions),
+            "avg_lag": self.metrics["total_lag"] / done if done else 0.0,
+            "next_deadline": self.next_deadline(),
+        }
@@ -0,0 +1,94 @@
+"""
+Suivi anti-spam - Fenêtre glissante de messages par (serveur, utilisateur)
+"""
+
+import time
+from collections import Counter, OrderedDict, deque
+
+# Messages gardés au plus par utilisateur (même en cas de flood sur la fenêtre)
+MAX_MESSAGES_PER_USER = 50
+
+class _UserWindow:
+    """Messages récents d'un utilisateur et nombre d'occurrences de chaque contenu"""
+    __slots__ = ("messages", "counts", "last_seen")
+
+    def __init__(self):
+        self.messages = deque()  # [(instant, empreinte du contenu, salon, message)]
+        self.counts = Counter()  # empreinte -> occurrences dans la fenêtre
+        self.last_seen = 0.0
+
+class SpamTracker:
+    """Compte les messages identiques sur une fenêtre glissante, vérification en O(1) amorti"""
+
+    def __init__(self, threshold: int, window: float):
+        self.threshold = threshold
+        self.window = window
+        # Ordre d'activité : les utilisateurs inactifs sont en tête
+        self._users = OrderedDict()  # (guild_id, user_id) -> _UserWindow
+        self.swept = 0
+
+    def __len__(self):
+        return len(self._users)
+
+    def _expire(self, entry: _UserWindow, now: float):
+        """Retire les messages sortis de la fenêtre"""
+        horizon = now - self.window
+        messages = entry.messages
+        while messages and (messages[0][0] <= horizon or len(messages) > MAX_MESSAGES_PER_USER):
+            digest = messages.popleft()[1]
+            remaining = entry.counts[digest] - 1
+            if remaining:
+                entry.counts[digest] = remaining
+            else:
+                del entry.counts[digest]
+
+    def record(self, guild_id: int, user_id: int, content: str, channel_id: int = 0, message_id: int = 0,
+               threshold: int = None) -> bool:
+        """Enregistre un message, retourne True si le seuil de messages identiques est atteint"""
+        now = time.monotonic()
+        key = (guild_id, user_id)
+        entry = self._users.get(key)
+        if entry is None:
+            entry = self._users[key] = _UserWindow()
+        else:
+            self._users.move_to_end(key)
+        entry.last_seen = now
+
+        digest = hash(content.lower())
+        entry.messages.append((now, digest, channel_id, message_id))
+        entry.counts[digest] += 1
+        self._expire(entry, now)
+
+        return entry.counts[digest] >= (threshold or self.threshold)
+
+    def pop_messages(self, guild_id: int, user_id: int) -> dict:
+        """Oublie l'historique d'un utilisateur et retourne ses messages récents {salon: [ids]}"""
+        entry = self._users.pop((guild_id, user_id), None)
+        by_channel = {}
+        if entry is None:
+            return by_channel
+        self._expire(entry, time.monotonic())
+        for _, _, channel_id, message_id in entry.messages:
+            if message_id:
+                by_channel.setdefault(channel_id, []).append(message_id)
+        return by_channel
+
+    def sweep(self) -> int:
+        """Retire les utilisateurs sans message depuis plus d'une fenêtre"""
+        horizon = time.monotonic() - self.window
+        removed = 0
+        while self._users:
+            key, entry = next(iter(self._users.items()))
+            if entry.last_seen > horizon:
+                break
+            del self._users[key]
+            removed += 1
+        self.swept += removed
+        return removed
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._users),
+            "messages": sum(len(entry.messages) for entry in self._users.values()),
+            "swept": self.swept,
+        }
@@ -0,0 +1,92 @@
+"""
+Registre des violations d'auto-modération - Scores à décroissance exponentielle
+"""
+
+import logging
+import time
+import database
+
+logger = logging.getLogger(__name__)
+
+# En dessous, un score est considéré comme oublié et retiré de la mémoire
+FORGOTTEN_SCORE = 0.05
+
+class ViolationLedger:
+    """Scores de violation par (serveur, utilisateur), divisés par deux à chaque demi-vie"""
+
+    def __init__(self):
+        self._scores = {}  # (guild_id, user_id) -> (score, instant, demi-vie en secondes)
+        self._dirty = set()  # clés à écrire au prochain checkpoint
+
+    def __len__(self):
+        return len(self._scores)
+
+    @staticmethod
+    def _decayed(score: float, updated_at: float, half_life: float, now: float) -> float:
+        if half_life <= 0:
+            return score
+        return score * 0.5 ** (max(0.0, now - updated_at) / half_life)
+
+    def score(self, guild_id: int, user_id: int) -> float:
+        """Score actuel (décroissance appliquée)"""
+        entry = self._scores.get((guild_id, user_id))
+        if entry is None:
+            return 0.0
+        return self._decayed(*entry, time.time())
+
+    def add(self, guild_id: int, user_id: int, half_life_hours: float, amount: float = 1.0) -> float:
+        """Ajoute une violation et retourne le nouveau score"""
+        now = time.time()
+        key = (guild_id, user_id)
+        half_life = half_life_hours * 3600
+        score = amount
+        entry = self._scores.get(key)
+        if entry is not None:
+            score += self._decayed(entry[0], entry[1], half_life, now)
+        self._scores[key] = (score, now, half_life)
+        self._dirty.add(key)
+        return score
+
+    def sweep(self) -> int:
+        """Retire les scores devenus négligeables"""
+        now = time.time()
+        forgotten = [
+            key for key, entry in self._scores.items()
+            if self._decayed(*entry, now) < FORGOTTEN_SCORE
+        ]
+        for key in forgotten:
+            del self._scores[key]
+            self._dirty.add(key)
+        return len(forgotten)
+
+    async def load(self):
+        """Recharge les scores sauvegardés (au démarrage)"""
+        for row in await database.get_automod_violations():
+            key = (row['guild_id'], row['user_id'])
+            self._scores[key] = (row['score'], row['updated_at'], row['half_life'])
+        self.sweep()
+
+    async def checkpoint(self):
+        """Écrit en une transaction les scores modifiés depuis le dernier checkpoint"""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+
+        upserts = []
+        deletes = []
+        for key in dirty:
+            entry = self._scores.get(key)
+            if entry is None:
+                deletes.append(key)
+            else:
+                upserts.append((*key, *entry))
+
+        try:
+            await database.save_automod_violations(upserts, deletes)
+        except Exception as e:
+            # Réessayer au prochain checkpoint
+            self._dirty |= dirty
+            logger.error(f"Violations: échec du checkpoint de {len(dirty)} score(s): {e}")
+
+    def stats(self) -> dict:
+        return {"scores": len(self._scores), "dirty": len(self._dirty)}